@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for the engine operations the AI hammers.
+
+Each benchmark times one operation on a seeded mid-game position and
+reports the best per-call time over several repeats (like timeit).
+
+    python -m benchmarks.hot_paths run [--out results.json] [--quick]
+    python -m benchmarks.hot_paths compare results.json [--baseline PATH] [--threshold 0.10]
+
+compare exits with status 1 when any benchmark got slower than the baseline
+(benchmarks/baseline.json by default) by more than the threshold (a
+fraction, 0.10 = 10%), so it can gate CI or a pre-merge check. Timings are
+machine-specific: refresh the baseline with `run --out` on the machine
+that does the comparing.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+from yoot import MCTSController, MonteCarloController, RandomController, YutGame, YutThrow
+from yoot.board import POSITION_NAMES
+from yoot.packed import PackedState
+
+WARMUP_TURNS = 30
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def mid_game(num_players=4, seed=0):
+    """Seeded random play to a mid-game position, with throws in hand."""
+    random.seed(seed)
+    game = YutGame(None, num_players)
+    ctrl = RandomController()
+    for _ in range(WARMUP_TURNS):
+        if game.game_state != "playing":
+            break
+        pid = game.current_player_idx
+        game.throw_phase()
+        while game.accumulated_moves:
+            legal = game.get_legal_moves(pid)
+            if not legal:
+                game.accumulated_moves = []
+                break
+            success, captured = game.move_piece(pid, *ctrl.choose_move({}, legal))
+            if captured:
+                game.throw_phase(is_bonus=True)
+            if game.check_win_condition():
+                break
+        game.next_turn()
+    game.accumulated_moves = [4, 3, 2]
+    return game
+
+
+def _best(fn, number, repeat):
+    """Best per-call seconds of fn() over repeat runs of number calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def _best_on_copies(make, fn, number, repeat):
+    """_best() for an fn(state) that consumes its state; copies are made untimed."""
+    best = float("inf")
+    for _ in range(repeat):
+        states = [make() for _ in range(number)]
+        start = time.perf_counter()
+        for state in states:
+            fn(state)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def bench_throw(game, number, repeat):
+    return _best(YutThrow.throw, number, repeat)
+
+
+def bench_get_legal_moves(game, number, repeat):
+    pid = game.current_player_idx
+    return _best(lambda: game.get_legal_moves(pid), number, repeat)
+
+
+def bench_move_piece(game, number, repeat):
+    pid = game.current_player_idx
+    piece_id, steps, dest = game.get_legal_moves(pid)[0]
+    return _best_on_copies(
+        game.clone, lambda g: g.move_piece(pid, piece_id, steps, dest), number, repeat
+    )
+
+
+def bench_check_capture(game, number, repeat):
+    # Only the lookup: a position holding no opponent (capturing mutates)
+    pid = game.current_player_idx
+    on_board = [p.pos for p in game.players[pid].pieces if p.pos > 0]
+    position = POSITION_NAMES[on_board[0]] if on_board else "01"
+    return _best(lambda: game.check_capture(pid, position), number, repeat)
+
+
+def bench_check_win_condition(game, number, repeat):
+    return _best(game.check_win_condition, number, repeat)
+
+
+def bench_get_game_state(game, number, repeat):
+    return _best(game.get_game_state, number, repeat)
+
+
+def bench_clone(game, number, repeat):
+    return _best(game.clone, number, repeat)
+
+
+def bench_random_rollout(game, number, repeat):
+    pid = game.current_player_idx
+    piece_id, steps, dest = game.get_legal_moves_idx(pid)[0]
+    ctrl = MonteCarloController(game, pid, rng=random.Random(0))
+    snapshot = PackedState.from_game(game)
+    return _best_on_copies(
+        snapshot.clone,
+        lambda sim: ctrl._rollout(sim, piece_id, steps, dest),
+        number,
+        repeat,
+    )
+
+
+def bench_mcts_choose_move(game, number, repeat, iterations=200):
+    pid = game.current_player_idx
+    legal = game.get_legal_moves(pid)
+    state = game.get_game_state()
+
+    def choose():
+        ctrl = MCTSController(game, pid, num_iterations=iterations, rng=random.Random(0))
+        ctrl.choose_move(state, legal)
+
+    return _best(choose, number, repeat)
+
+
+# name -> (function, calls per repeat, repeats); --quick divides the calls
+BENCHMARKS = {
+    "throw": (bench_throw, 200_000, 5),
+    "get_legal_moves": (bench_get_legal_moves, 20_000, 5),
+    "move_piece": (bench_move_piece, 5_000, 5),
+    "check_capture": (bench_check_capture, 100_000, 5),
+    "check_win_condition": (bench_check_win_condition, 50_000, 5),
+    "get_game_state": (bench_get_game_state, 20_000, 5),
+    "clone": (bench_clone, 10_000, 5),
+    "random_rollout": (bench_random_rollout, 300, 5),
+    "mcts_choose_move_200": (bench_mcts_choose_move, 5, 3),
+}
+
+
+def run(names=None, quick=False, progress=None):
+    """
+    Run the benchmarks (all by default).
+
+    Returns:
+        JSON-ready dict: {"python", "platform", "machine", "timestamp",
+        "results": {name: seconds per call}}
+    """
+    game = mid_game()
+    results = {}
+    for name in names or BENCHMARKS:
+        fn, number, repeat = BENCHMARKS[name]
+        if quick:
+            number = max(1, number // 20)
+        random.seed(0)
+        results[name] = fn(game, number, repeat)
+        if progress is not None:
+            progress(name, results[name])
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold=0.10):
+    """
+    Compare two run() outputs.
+
+    Returns:
+        [(name, baseline_s, current_s, ratio, regressed)] for benchmarks in
+        both; regressed means current is slower by more than threshold
+    """
+    rows = []
+    for name, base in baseline["results"].items():
+        if name not in current["results"]:
+            continue
+        now = current["results"][name]
+        ratio = now / base if base else float("inf")
+        rows.append((name, base, now, ratio, ratio > 1.0 + threshold))
+    return rows
+
+
+def _format_time(seconds):
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:9.2f}ms"
+    return f"{seconds * 1e6:9.2f}us"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.hot_paths")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_parser = sub.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--out", help="write results JSON here")
+    run_parser.add_argument("--quick", action="store_true", help="fewer calls per repeat")
+    run_parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    compare_parser = sub.add_parser("compare", help="compare results with a baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--baseline", default=BASELINE)
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        unknown = [name for name in args.names if name not in BENCHMARKS]
+        if unknown:
+            parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+        results = run(
+            args.names,
+            args.quick,
+            progress=lambda name, s: print(f"  {name:>22s}: {_format_time(s)}", flush=True),
+        )
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump(results, f, indent=2)
+                f.write("\n")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    rows = compare(baseline, current, args.threshold)
+    for name, base, now, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(
+            f"  {name:>22s}: {_format_time(base)} -> {_format_time(now)}  "
+            f"{ratio:5.2f}x{flag}"
+        )
+    regressions = sum(1 for row in rows if row[4])
+    if regressions:
+        print(f"{regressions} benchmark(s) slower than baseline by > {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,7 @@ from yoot import (
     YutGame,
 )
 from yoot.config import DEFAULT_PLAYER_NAMES
+from yoot.telemetry import TextSink
 
 
 def clear_screen():
@@ -285,10 +286,10 @@ def main():
                 controllers[i] = RandomController()
                 break
             if choice == "m":
-                controllers[i] = MonteCarloController(game, i)
+                controllers[i] = MonteCarloController(game, i, telemetry=TextSink())
                 break
             if choice == "a":
-                controllers[i] = MCTSController(game, i)
+                controllers[i] = MCTSController(game, i, telemetry=TextSink())
                 break
             print("Please enter 'h', 'r', 'm', or 'a'.")
 
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark: YutGame.clone() vs copy.deepcopy on mid-game states.
+Clones each state N times with both methods and reports per-clone cost.
+"""
+
+import copy
+import time
+
+from benchmarks.hot_paths import mid_game
+from yoot import YutGame
+
+NUM_CLONES = 20000
+PLAYER_COUNTS = [2, 4, 6]
+
+
+def deepcopy_game(game):
+    """The old controller approach: deepcopy with the Board detached."""
+    board = game.board
+    game.board = None
+    sim = copy.deepcopy(game)
+    game.board = board
+    sim.board = board
+    return sim
+
+
+def time_per_clone(fn, game):
+    start = time.perf_counter()
+    for _ in range(NUM_CLONES):
+        fn(game)
+    return (time.perf_counter() - start) / NUM_CLONES * 1e6
+
+
+print("=" * 60)
+print(f"CLONE BENCHMARK — {NUM_CLONES} clones per method")
+print("=" * 60)
+print(f"  {'Players':>7s}  {'deepcopy':>10s}  {'clone()':>10s}  {'Speedup':>8s}")
+for num_players in PLAYER_COUNTS:
+    game = mid_game(num_players)
+    deep_us = time_per_clone(deepcopy_game, game)
+    fast_us = time_per_clone(YutGame.clone, game)
+    print(
+        f"  {num_players:7d}  {deep_us:8.1f}us  {fast_us:8.1f}us  {deep_us / fast_us:7.1f}x"
+    )
+print("=" * 60)
@@ -2,15 +2,62 @@
 """
 Benchmark: Monte Carlo AI (player 0, goes first) vs Monte Carlo AI (player 1, goes second).
 Runs 1000 games with 3000 simulations per move decision.
+
+With --paired, plays common-random-numbers pairs of MC with NUM_SIMS (A)
+against MC with NUM_SIMS_B (B) instead: each pair replays the same per-seat
+throws with the seats swapped, which cancels the first-move advantage and
+most of the dice luck.
 """
 
 import sys
 import time
 
 from yoot import MonteCarloController, YutGame
+from yoot.match import paired_estimate, play_game, play_pair
 
 NUM_GAMES = 1000
 NUM_SIMS = 100
+NUM_SIMS_B = 100  # opponent strength in --paired mode
+
+
+def run_paired(num_pairs):
+    pairs = []
+    start = time.time()
+    for g in range(num_pairs):
+        results = play_pair(
+            lambda game, pid, rng: MonteCarloController(
+                game, pid, num_simulations=NUM_SIMS, rng=rng
+            ),
+            lambda game, pid, rng: MonteCarloController(
+                game, pid, num_simulations=NUM_SIMS_B, rng=rng
+            ),
+            seed=g,
+        )
+        pairs.append(tuple(score for score, _ in results))
+        estimate = paired_estimate(pairs)
+        print(
+            f"Pair {g + 1:4d}: A first {results[0][0]:+d}, A second {results[1][0]:+d}  "
+            f"Running: A-B {estimate['diff']:+.1%} ± {estimate['stderr']:.1%}",
+            flush=True,
+        )
+
+    estimate = paired_estimate(pairs)
+    total_time = time.time() - start
+    print(f"\n{'=' * 60}")
+    print(f"PAIRED RESULTS — {num_pairs} pairs, {NUM_SIMS} vs {NUM_SIMS_B} sims/move")
+    print(f"{'=' * 60}")
+    print(f"  Win rate A - B: {estimate['diff']:+.1%}")
+    print(
+        f"  Std. error: {estimate['stderr']:.1%} paired, "
+        f"{estimate['unpaired_stderr']:.1%} as independent games"
+    )
+    print(f"  Total time: {total_time / 3600:.1f} hours")
+    print(f"{'=' * 60}")
+
+
+if "--paired" in sys.argv[1:]:
+    run_paired(NUM_GAMES // 2)
+    sys.exit()
 
 wins = {0: 0, 1: 0}
 start = time.time()
@@ -21,35 +68,7 @@ for g in range(NUM_GAMES):
     mc0 = MonteCarloController(game, 0, num_simulations=NUM_SIMS)
     mc1 = MonteCarloController(game, 1, num_simulations=NUM_SIMS)
     controllers = {0: mc0, 1: mc1}
-
-    turn = 0
-    while game.game_state == "playing" and turn < 500:
-        pid = game.current_player_idx
-        ctrl = controllers[pid]
-        game.throw_phase()
-        while game.accumulated_moves:
-            legal = game.get_legal_moves(pid)
-            if not legal:
-                game.accumulated_moves = []
-                break
-            choice = ctrl.choose_move(game.get_game_state(), legal)
-            if choice is None:
-                game.accumulated_moves = []
-                break
-            piece_id, steps = choice
-            success, captured = game.move_piece(pid, piece_id, steps)
-            if not success:
-                game.accumulated_moves = []
-                break
-            if captured:
-                game.throw_phase(is_bonus=True)
-            game.check_win_condition()
-            if game.game_state != "playing":
-                break
-        if game.game_state == "finished":
-            break
-        game.next_turn()
-        turn += 1
+    turn = play_game(game, controllers)
 
     winner = game.rankings[0] if game.rankings else -1
     wins[winner] = wins.get(winner, 0) + 1
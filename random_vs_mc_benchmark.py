@@ -2,11 +2,17 @@
 """
 Benchmark: Random AI vs Monte Carlo AI.
 500 games with Random as player 0, 500 games with Random as player 1.
+
+With --paired, plays 500 common-random-numbers pairs instead (each pair
+replays the same per-seat throws with the seats swapped) and reports the
+win-rate difference with its standard error.
 """
 
+import sys
 import time
 
 from yoot import MonteCarloController, RandomController, YutGame
+from yoot.match import paired_estimate, play_game, play_pair
 
 NUM_GAMES_PER_CONFIG = 500
 NUM_SIMS = 100
@@ -24,35 +30,7 @@ def run_games(random_idx, mc_idx, num_games):
             random_idx: RandomController(),
             mc_idx: MonteCarloController(game, mc_idx, num_simulations=NUM_SIMS),
         }
-
-        turn = 0
-        while game.game_state == "playing" and turn < 500:
-            pid = game.current_player_idx
-            ctrl = controllers[pid]
-            game.throw_phase()
-            while game.accumulated_moves:
-                legal = game.get_legal_moves(pid)
-                if not legal:
-                    game.accumulated_moves = []
-                    break
-                choice = ctrl.choose_move(game.get_game_state(), legal)
-                if choice is None:
-                    game.accumulated_moves = []
-                    break
-                piece_id, steps = choice
-                success, captured = game.move_piece(pid, piece_id, steps)
-                if not success:
-                    game.accumulated_moves = []
-                    break
-                if captured:
-                    game.throw_phase(is_bonus=True)
-                game.check_win_condition()
-                if game.game_state != "playing":
-                    break
-            if game.game_state == "finished":
-                break
-            game.next_turn()
-            turn += 1
+        turn = play_game(game, controllers)
 
         winner_name = game.players[game.rankings[0]].name if game.rankings else "?"
         if game.rankings and game.rankings[0] == mc_idx:
@@ -69,6 +47,45 @@ def run_games(random_idx, mc_idx, num_games):
     return wins
 
 
+def run_paired(num_pairs):
+    """Common-random-numbers pairs: MC is A, Random is B."""
+    pairs = []
+    for g in range(num_pairs):
+        pair_start = time.time()
+        results = play_pair(
+            lambda game, pid, rng: MonteCarloController(
+                game, pid, num_simulations=NUM_SIMS, rng=rng
+            ),
+            lambda game, pid, rng: RandomController(rng),
+            seed=g,
+        )
+        pairs.append(tuple(score for score, _ in results))
+        estimate = paired_estimate(pairs)
+        print(
+            f"  Pair {g + 1:3d}: MC first {results[0][0]:+d}, MC second {results[1][0]:+d} "
+            f"({time.time() - pair_start:.1f}s)  Running: MC-Random "
+            f"{estimate['diff']:+.1%} ± {estimate['stderr']:.1%}",
+            flush=True,
+        )
+    return paired_estimate(pairs)
+
+
+if "--paired" in sys.argv[1:]:
+    start = time.time()
+    estimate = run_paired(NUM_GAMES_PER_CONFIG)
+    print()
+    print("=" * 60)
+    print(f"PAIRED RESULTS — {estimate['pairs']} pairs, {NUM_SIMS} sims/move")
+    print("=" * 60)
+    print(f"  MC win rate - Random win rate: {estimate['diff']:+.1%}")
+    print(
+        f"  Std. error: {estimate['stderr']:.1%} paired, "
+        f"{estimate['unpaired_stderr']:.1%} as independent games"
+    )
+    print(f"  Total time: {(time.time() - start) / 3600:.1f} hours")
+    print("=" * 60)
+    sys.exit()
+
 start = time.time()
 
 print("=" * 60)
@@ -2,6 +2,7 @@
 """Play 3 games with MCTS output visible to diagnose behavior."""
 
 from yoot import MCTSController, MonteCarloController, YutGame
+from yoot.telemetry import TextSink
 
 
 def play_game(game_num: int) -> int:
@@ -10,8 +11,12 @@ def play_game(game_num: int) -> int:
 
     game = YutGame(["MCTS", "MC"], 2)
     controllers = {
-        mcts_pid: MCTSController(game, mcts_pid, num_iterations=100),
-        mc_pid: MonteCarloController(game, mc_pid, num_simulations=100),
+        mcts_pid: MCTSController(
+            game, mcts_pid, num_iterations=100, telemetry=TextSink(), profile=True
+        ),
+        mc_pid: MonteCarloController(
+            game, mc_pid, num_simulations=100, telemetry=TextSink()
+        ),
     }
 
     for turn in range(500):
@@ -42,11 +47,11 @@ def play_game(game_num: int) -> int:
                 game.accumulated_moves = []
                 break
 
-            piece_id, steps = choice
+            piece_id, steps, dest = choice
             if pid == mcts_pid:
                 print(f"  >>> MCTS chose piece={piece_id} steps={steps}")
 
-            success, captured = game.move_piece(pid, piece_id, steps)
+            success, captured = game.move_piece(pid, piece_id, steps, dest)
             if not success:
                 game.accumulated_moves = []
                 break
@@ -62,7 +67,8 @@ def play_game(game_num: int) -> int:
 
     winner = game.rankings[0] if game.rankings else -1
     label = "MCTS" if winner == mcts_pid else "MC"
-    print(f"\n=== Game {game_num}: {label} wins ===\n")
+    print(f"\n=== Game {game_num}: {label} wins ===")
+    print(f"MCTS search profile: {controllers[mcts_pid].game_profile.format()}\n")
     return winner
 
 
@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
-"""Simulate MCTS vs Monte Carlo: 500 games each side going first."""
+"""
+Simulate MCTS vs Monte Carlo: 500 games each side going first.
+
+With --paired, the 1000 games are played as 500 common-random-numbers pairs
+(each pair replays the same per-seat throws with the seats swapped) and the
+win-rate difference is reported with its standard error.
+"""
 
-import io
 import sys
 
 from yoot import MCTSController, MonteCarloController, YutGame
+from yoot.match import paired_estimate, play_game, play_pair
+
+
+def make_mcts(game, player_id, rng=None):
+    return MCTSController(game, player_id, num_iterations=1000, rng=rng)
 
 
-def play_game(mcts_player_id: int) -> int:
+def make_mc(game, player_id, rng=None):
+    return MonteCarloController(game, player_id, num_simulations=100, rng=rng)
+
+
+def play_one(mcts_player_id: int) -> int:
     """Play one game, return winner player_id."""
     mc_player_id = 1 - mcts_player_id
     names = [None, None]
@@ -17,75 +31,54 @@ def play_game(mcts_player_id: int) -> int:
     game = YutGame(names, 2)
 
     controllers = {}
-    controllers[mcts_player_id] = MCTSController(
-        game, mcts_player_id, num_iterations=1000
-    )
-    controllers[mc_player_id] = MonteCarloController(
-        game, mc_player_id, num_simulations=100
-    )
-
-    max_turns = 500
-    for _ in range(max_turns):
-        if game.game_state != "playing":
-            break
-
-        pid = game.current_player_idx
-        ctrl = controllers[pid]
-
-        game.throw_phase()
-
-        while game.accumulated_moves:
-            legal = game.get_legal_moves(pid)
-            if not legal:
-                game.accumulated_moves = []
-                break
-
-            game_state = game.get_game_state()
-            choice = ctrl.choose_move(game_state, legal)
-
-            if choice is None:
-                game.accumulated_moves = []
-                break
-
-            piece_id, steps = choice
-            success, captured = game.move_piece(pid, piece_id, steps)
-            if not success:
-                game.accumulated_moves = []
-                break
+    controllers[mcts_player_id] = make_mcts(game, mcts_player_id)
+    controllers[mc_player_id] = make_mc(game, mc_player_id)
+    play_game(game, controllers)
 
-            if captured:
-                game.throw_phase(is_bonus=True)
+    if game.rankings:
+        return game.rankings[0]
+    return -1  # draw/timeout
 
-            if game.check_win_condition():
-                break
 
-        if game.game_state == "finished":
-            break
+def main_paired(num_pairs):
+    pairs = []
+    for i in range(num_pairs):
+        results = play_pair(make_mcts, make_mc, seed=i)
 
-        game.next_turn()
+        pairs.append(tuple(score for score, _ in results))
+        estimate = paired_estimate(pairs)
+        print(
+            f"  Pair {i + 1}/{num_pairs}: MCTS first {results[0][0]:+d}, "
+            f"MCTS second {results[1][0]:+d}  Running: MCTS-MC "
+            f"{estimate['diff']:+.1%} ± {estimate['stderr']:.1%}"
+        )
 
-    if game.rankings:
-        return game.rankings[0]
-    return -1  # draw/timeout
+    estimate = paired_estimate(pairs)
+    print()
+    print("=" * 50)
+    print(f"PAIRED RESULTS ({num_pairs} pairs)")
+    print(f"  MCTS win rate - MC win rate: {estimate['diff']:+.1%}")
+    print(f"  Std. error (paired):         {estimate['stderr']:.1%}")
+    print(f"  Std. error (unpaired):       {estimate['unpaired_stderr']:.1%}")
+    print("=" * 50)
 
 
 def main():
-    # Suppress print output from controllers
-    real_stdout = sys.stdout
-
     mcts_wins = 0
     mc_wins = 0
     draws = 0
 
     total = 1000
 
+    if "--paired" in sys.argv[1:]:
+        main_paired(total // 2)
+        return
+
     for i in range(total):
         mcts_is_p0 = i % 2 == 0
         mcts_pid = 0 if mcts_is_p0 else 1
 
-        sys.stdout = io.StringIO()
-        winner = play_game(mcts_pid)
-        sys.stdout = real_stdout
+        winner = play_one(mcts_pid)
 
         if winner == mcts_pid:
             mcts_wins += 1
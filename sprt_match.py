@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Regression match: MCTS vs Monte Carlo, stopped early by an SPRT.
+
+Tests H0 "MCTS wins P0 of its games" against H1 "MCTS wins P1" and stops as
+soon as the test decides (at most MAX_GAMES games). Seats alternate and
+every game is seeded from SEED, so a run can be replayed.
+"""
+
+import time
+
+from yoot import MCTSController, MonteCarloController
+from yoot.match import SPRT, run_sprt
+
+P0 = 0.5
+P1 = 0.55
+ALPHA = 0.05
+BETA = 0.05
+MAX_GAMES = 2000
+SEED = 0
+
+
+def make_mcts(game, player_id, rng):
+    return MCTSController(game, player_id, num_iterations=1000, rng=rng)
+
+
+def make_mc(game, player_id, rng):
+    return MonteCarloController(game, player_id, num_simulations=100, rng=rng)
+
+
+def main():
+    def progress(i, score, test):
+        print(
+            f"  Game {i + 1:4d}: MCTS {'won' if score > 0 else 'lost':4s}  "
+            f"W-L-D {test.wins}-{test.losses}-{test.draws}  "
+            f"LLR {test.llr():+.2f} ({test.lower:+.2f}, {test.upper:+.2f})",
+            flush=True,
+        )
+
+    start = time.time()
+    report = run_sprt(
+        make_mcts,
+        make_mc,
+        SPRT(P0, P1, ALPHA, BETA),
+        max_games=MAX_GAMES,
+        seed=SEED,
+        progress=progress,
+    )
+
+    low, high = report["interval"]
+    print()
+    print("=" * 50)
+    print(f"SPRT H0: p={P0} vs H1: p={P1} (alpha={ALPHA}, beta={BETA})")
+    print(f"  Decision:  {report['decision'] or 'inconclusive'}")
+    print(f"  Games:     {report['games']}")
+    print(f"  LLR:       {report['llr']:+.2f}")
+    print(f"  Win rate:  {report['win_rate']:.1%} (95% CI {low:.1%} - {high:.1%})")
+    print(f"  Time:      {time.time() - start:.0f}s")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
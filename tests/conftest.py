@@ -0,0 +1,19 @@
+"""
+Shared fixtures for the Yut Nori tests.
+"""
+
+import pytest
+
+from yoot import YutGame
+
+
+@pytest.fixture
+def midgame():
+    """Two-player game with player 0 to move: pieces on 03 and 08, one
+    opponent piece on 12, and throws [4, 3, 2] to spend."""
+    game = YutGame(["A", "B"], num_players=2)
+    game.players[0].pieces[0].enter_board("03")
+    game.players[0].pieces[1].enter_board("08")
+    game.players[1].pieces[0].enter_board("12")
+    game.accumulated_moves = [4, 3, 2]
+    return game
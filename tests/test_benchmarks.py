@@ -0,0 +1,45 @@
+"""
+Tests for the hot-path microbenchmark suite.
+"""
+
+from benchmarks.hot_paths import BENCHMARKS, compare, main, run
+
+
+def _results(**times):
+    return {"results": times}
+
+
+class TestHotPaths:
+    """Test benchmark runs and baseline comparison."""
+
+    def test_quick_run(self):
+        results = run(["throw", "clone", "mcts_choose_move_200"], quick=True)
+        assert set(results["results"]) == {"throw", "clone", "mcts_choose_move_200"}
+        assert all(t > 0 for t in results["results"].values())
+        assert results["python"]
+
+    def test_every_benchmark_runs(self):
+        names = [name for name in BENCHMARKS if name != "mcts_choose_move_200"]
+        results = run(names, quick=True)["results"]
+        assert list(results) == names
+
+    def test_compare_flags_regressions(self):
+        rows = compare(
+            _results(a=1.0, b=1.0, c=1.0, gone=1.0),
+            _results(a=1.05, b=1.2, c=0.5, new=1.0),
+            threshold=0.10,
+        )
+        assert [(name, regressed) for name, _, _, _, regressed in rows] == [
+            ("a", False),
+            ("b", True),
+            ("c", False),
+        ]
+
+    def test_compare_exit_status(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        current = tmp_path / "current.json"
+        baseline.write_text('{"results": {"throw": 1e-6}}')
+        current.write_text('{"results": {"throw": 2e-6}}')
+        assert main(["compare", str(current), "--baseline", str(baseline)]) == 1
+        assert "REGRESSION" in capsys.readouterr().out
+        assert main(["compare", str(baseline), "--baseline", str(baseline)]) == 0
@@ -2,7 +2,7 @@
 
 import pytest
 
-from yoot.board import Board
+from yoot.board import BACK_DO_INDEX, OFF_BOARD, Board
 
 
 class TestBoardPositions:
@@ -303,3 +303,30 @@ class TestBoardRendering:
         assert board.is_valid_position("cc")
         assert not board.is_valid_position("zz")
         assert not board.is_valid_position("21")
+
+
+class TestCompiledTopology:
+    """Test the integer-indexed board tables used on the hot path."""
+
+    def test_outer_positions_keep_their_number(self):
+        for i, name in enumerate(Board.OUTER_POSITIONS):
+            assert Board.to_index(name) == i
+
+    def test_index_round_trip(self):
+        for name in Board.ALL_POSITIONS:
+            assert Board.to_name(Board.to_index(name)) == name
+        assert Board.to_index(None) == OFF_BOARD
+        assert Board.to_name(OFF_BOARD) is None
+
+    def test_next_index_matches_move_table(self):
+        board = Board()
+        for name in Board.ALL_POSITIONS:
+            idx = Board.to_index(name)
+            for steps in (-1, 1, 2, 3, 4, 5):
+                expected = board.get_next_position(name, steps)
+                assert Board.to_name(Board.next_index(idx, steps)) == expected
+
+    def test_back_do_index_keeps_all_branches(self):
+        for name in Board.ALL_POSITIONS:
+            dests = BACK_DO_INDEX[Board.to_index(name)]
+            assert [Board.to_name(d) for d in dests] == Board.BACK_DO.get(name, [])
@@ -0,0 +1,126 @@
+"""
+Tests for the Monte Carlo controller.
+"""
+
+import random
+
+import pytest
+
+from yoot import MonteCarloController, YutGame
+
+
+class TestMonteCarloController:
+    """Test Monte Carlo move selection."""
+
+    def test_fixed_count_search(self, midgame):
+        random.seed(0)
+        game = midgame
+        ctrl = MonteCarloController(game, 0, num_simulations=10)
+        legal = game.get_legal_moves(0)
+        move, stats = ctrl.search(game.get_game_state(), legal)
+
+        assert move in legal
+        assert all(sims == 10 for _, sims, _ in stats["moves"])
+        assert stats["iterations"] == 10 * len(stats["moves"])
+
+    def test_time_budget(self, midgame):
+        random.seed(0)
+        game = midgame
+        ctrl = MonteCarloController(game, 0, num_simulations=None, time_budget_ms=30)
+        legal = game.get_legal_moves(0)
+        move, stats = ctrl.search(game.get_game_state(), legal)
+
+        assert move in legal
+        assert all(sims >= 1 for _, sims, _ in stats["moves"])
+        assert stats["elapsed_ms"] < 1000
+        assert ctrl.last_stats is stats
+
+    def test_needs_some_limit(self, midgame):
+        with pytest.raises(ValueError):
+            MonteCarloController(midgame, 0, num_simulations=None)
+
+    def test_injected_rng_is_reproducible(self, midgame):
+        game = midgame
+        legal = game.get_legal_moves(0)
+        runs = []
+        for global_seed in (1, 2):
+            random.seed(global_seed)  # must not matter
+            ctrl = MonteCarloController(game, 0, num_simulations=20, rng=random.Random(3))
+            runs.append(ctrl.search(game.get_game_state(), legal)[1]["moves"])
+        assert runs[0] == runs[1]
+
+
+class TestParallelMonteCarlo:
+    """Test process-pool rollouts."""
+
+    def test_matches_serial_counts(self, midgame):
+        game = midgame
+        legal = game.get_legal_moves(0)
+        sims = 200
+        serial = MonteCarloController(
+            game, 0, num_simulations=sims, rng=random.Random(0)
+        )
+        parallel = MonteCarloController(
+            game, 0, num_simulations=sims, workers=3, rng=random.Random(0)
+        )
+        try:
+            _, serial_stats = serial.search(game.get_game_state(), legal)
+            move, stats = parallel.search(game.get_game_state(), legal)
+        finally:
+            parallel.close()
+
+        assert move in legal
+        assert sorted(m for m, _, _ in stats["moves"]) == sorted(
+            m for m, _, _ in serial_stats["moves"]
+        )
+        assert all(n == sims for _, n, _ in stats["moves"])
+        # Same estimates from different streams: the difference of two
+        # 200-rollout win rates has a standard error of at most 0.05, so
+        # allow three of them
+        serial_rates = {m: rate for m, _, rate in serial_stats["moves"]}
+        for m, _, rate in stats["moves"]:
+            assert abs(rate - serial_rates[m]) <= 0.15, m
+
+    def test_seeded_runs_are_reproducible(self, midgame):
+        game = midgame
+        legal = game.get_legal_moves(0)
+        ctrl = MonteCarloController(game, 0, num_simulations=30, workers=2)
+        try:
+            random.seed(5)
+            first = ctrl.search(game.get_game_state(), legal)[1]["moves"]
+            random.seed(5)
+            second = ctrl.search(game.get_game_state(), legal)[1]["moves"]
+        finally:
+            ctrl.close()
+        assert first == second
+
+    def test_injected_rng_seeds_batches(self, midgame):
+        game = midgame
+        legal = game.get_legal_moves(0)
+        ctrl = MonteCarloController(
+            game, 0, num_simulations=30, workers=2, rng=random.Random(5)
+        )
+        try:
+            first = ctrl.search(game.get_game_state(), legal)[1]["moves"]
+            ctrl.rng.seed(5)
+            random.seed(99)  # must not matter
+            second = ctrl.search(game.get_game_state(), legal)[1]["moves"]
+        finally:
+            ctrl.close()
+        assert first == second
+
+    def test_winning_move_scores_one(self):
+        game = YutGame(["A", "B"], num_players=2)
+        pieces = game.players[0].pieces
+        for piece in pieces[:3]:
+            piece.enter_board("01")
+            piece.finish()
+        pieces[3].enter_board("00")
+        game.accumulated_moves = [1, 2]
+        ctrl = MonteCarloController(game, 0, num_simulations=8, workers=2)
+        try:
+            move, stats = ctrl.search(game.get_game_state(), game.get_legal_moves(0))
+        finally:
+            ctrl.close()
+        assert move[0] == 3
+        assert stats["moves"][0][2] == 1.0
@@ -0,0 +1,100 @@
+"""
+Tests for the throughput counters.
+"""
+
+import random
+
+import pytest
+
+from yoot import MCTSController, MonteCarloController, PackedState, RandomController, YutGame
+from yoot import counters
+from yoot.counters import COUNTERS, FIELDS, Counters, Reporter
+from yoot.match import play_game
+
+
+class TestCounters:
+    """Test what the engine counts."""
+
+    def test_moves_throws_and_clones(self, midgame):
+        game = midgame
+        before = counters.snapshot()
+        game.move_piece_idx(0, 0, 4)
+        game.move_piece_idx(0, 0, 9)  # illegal: not counted
+        sim = PackedState.from_game(game).clone()
+        sim.move_piece_idx(0, 0, 3)
+        game.clone()
+        throws = game.throw_phase()
+        counts = counters.delta(before)
+        assert counts["moves"] == 2
+        assert counts["clones"] == 3
+        assert counts["throws"] == len(throws)
+        assert counts["seconds"] >= 0
+
+    @pytest.mark.parametrize(
+        "make",
+        [
+            lambda g: MonteCarloController(g, 0, num_simulations=4, rng=random.Random(1)),
+            lambda g: MCTSController(g, 0, num_iterations=30, rng=random.Random(1)),
+        ],
+    )
+    def test_rollouts(self, midgame, make):
+        game = midgame
+        ctrl = make(game)
+        before = counters.snapshot()
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        counts = counters.delta(before)
+        assert counts["rollouts"] > 0
+        assert counts["rollout_turns"] > counts["rollouts"]
+
+    @pytest.mark.parametrize(
+        "make",
+        [
+            lambda g: MonteCarloController(
+                g, 0, num_simulations=8, workers=2, rng=random.Random(1)
+            ),
+            lambda g: MCTSController(
+                g, 0, num_iterations=30, workers=2, rng=random.Random(1)
+            ),
+        ],
+    )
+    def test_worker_rollouts_reach_the_parent(self, midgame, make):
+        game = midgame
+        ctrl = make(game)
+        before = counters.snapshot()
+        try:
+            ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        finally:
+            ctrl.close()
+        counts = counters.delta(before)
+        assert counts["rollouts"] > 0
+        assert counts["rollout_turns"] > counts["rollouts"]
+        assert counts["clones"] >= counts["rollouts"]
+
+    def test_games(self):
+        random.seed(0)
+        game = YutGame(["A", "B"], num_players=2)
+        before = counters.snapshot()
+        play_game(game, {0: RandomController(), 1: RandomController()})
+        assert counters.delta(before)["games"] == 1
+
+
+class TestHelpers:
+    """Test snapshot arithmetic and reporting."""
+
+    def test_add_and_rates(self):
+        local = Counters()
+        local.add({"rollouts": 30, "rollout_turns": 600})
+        first = local.snapshot()
+        local.add({"rollouts": 10})
+        counts = counters.delta(first, {**local.snapshot(), "time": first["time"] + 2})
+        assert counts["rollouts"] == 10 and counts["seconds"] == 2
+        assert counters.rates(counts)["rollouts"] == 5
+        assert counters.rates({**counts, "seconds": 0}) == dict.fromkeys(FIELDS, 0.0)
+        assert "5 rollouts/s" in counters.format_rates(counts)
+
+    def test_reporter(self):
+        reports = []
+        with Reporter(interval=0.01, report=reports.append):
+            COUNTERS.rollouts += 3
+        assert reports
+        assert sum(r["rollouts"] for r in reports) >= 3
@@ -353,6 +353,271 @@ class TestLegalMoves:
 
         assert len(legal_moves) == 0
 
+    def test_legal_moves_idx_matches_named_moves(self):
+        """Integer legal moves translate back to exactly the named legal moves."""
+        game = YutGame(["A", "B"], num_players=2)
+        game.players[0].pieces[0].enter_board("cc")
+        game.players[0].pieces[1].enter_board("15")
+        game.accumulated_moves = [-1, 2, 5]
+
+        named = game.get_legal_moves(0)
+        indexed = game.get_legal_moves_idx(0)
+
+        assert [(p, s, Board.to_name(d)) for p, s, d in indexed] == named
+
+    def test_move_piece_idx_back_do_branch(self):
+        """Integer back-do honours an explicit branch at merge points."""
+        game = YutGame(["A", "B"], num_players=2)
+        piece = game.players[0].pieces[0]
+        piece.enter_board("15")
+        game.accumulated_moves = [-1]
+
+        success, _ = game.move_piece_idx(0, 0, -1, Board.to_index("vv"))
+
+        assert success
+        assert piece.position == "vv"
+
+
+class TestClone:
+    """Test fast game cloning for simulations."""
+
+    def test_clone_copies_state(self):
+        """Clone reproduces positions, flags, moves, rankings and turn."""
+        game = YutGame(["A", "B", "C"], num_players=3)
+        game.players[0].pieces[0].enter_board("cc")
+        game.players[1].pieces[2].enter_board("00")
+        game.players[2].pieces[1].enter_board("01")
+        game.players[2].pieces[1].finish()
+        game.accumulated_moves = [4, -1]
+        game.rankings = [1]
+        game.current_player_idx = 2
+
+        sim = game.clone()
+
+        state = game.get_game_state()
+        sim_state = sim.get_game_state()
+        state.pop("move_history")
+        sim_state.pop("move_history")
+        assert sim_state == state
+        for player, sim_player in zip(game.players, sim.players):
+            for piece, sim_piece in zip(player.pieces, sim_player.pieces):
+                assert sim_piece.has_moved == piece.has_moved
+
+    def test_clone_is_independent(self):
+        """Mutating the clone leaves the original untouched."""
+        game = YutGame(["A", "B"], num_players=2)
+        game.players[0].pieces[0].enter_board("03")
+        game.accumulated_moves = [2]
+
+        sim = game.clone()
+        sim.move_piece(0, 0, 2)
+        sim.rankings.append(0)
+
+        assert game.players[0].pieces[0].position == "03"
+        assert game.accumulated_moves == [2]
+        assert game.rankings == []
+
+    def test_clone_shares_board(self):
+        """The immutable Board is shared, not copied."""
+        game = YutGame(["A", "B"], num_players=2)
+        assert game.clone().board is game.board
+
+
+def _brute_force_occupancy(game):
+    occupancy = {}
+    for player in game.players:
+        for piece in player.pieces:
+            if piece.is_active and piece.pos >= 0:
+                occupancy.setdefault(piece.pos, set()).add(piece)
+    return occupancy
+
+
+def _indexed_occupancy(game):
+    return {pos: set(pieces) for pos, pieces in game._occupancy.items() if pieces}
+
+
+class TestOccupancyIndex:
+    """Test the incremental position -> pieces index."""
+
+    def test_index_follows_direct_piece_changes(self):
+        game = YutGame(["A", "B"], num_players=2)
+        piece = game.players[0].pieces[0]
+        piece.position = "aa"
+        piece.is_active = True
+        piece.has_moved = True
+        assert game._get_stack_at_position(0, "aa") == [piece]
+
+        piece.move_to("cc")
+        assert game._get_stack_at_position(0, "aa") == []
+        assert game._get_stack_at_position(0, "cc") == [piece]
+
+        piece.capture()
+        assert _indexed_occupancy(game) == {}
+
+    def test_stack_lookup_in_piece_order(self):
+        game = YutGame(["A", "B"], num_players=2)
+        pieces = game.players[0].pieces
+        pieces[2].enter_board("04")
+        pieces[0].enter_board("04")
+        assert game._get_stack_at_position(0, "04") == [pieces[0], pieces[2]]
+        assert game._get_stack_at_position(1, "04") == []
+
+    def test_index_matches_scan_through_play(self):
+        import random
+
+        rng = random.Random(3)
+        game = YutGame(None, num_players=4)
+        for _ in range(400):
+            if game.game_state != "playing":
+                break
+            pid = game.current_player_idx
+            game.accumulated_moves = [rng.choice([-1, 1, 2, 3, 4, 5]) for _ in range(2)]
+            while game.accumulated_moves:
+                legal = game.get_legal_moves_idx(pid)
+                if not legal:
+                    break
+                game.move_piece_idx(pid, *rng.choice(legal))
+                assert _indexed_occupancy(game) == _brute_force_occupancy(game)
+                if game.check_win_condition():
+                    break
+            game.next_turn()
+
+    def test_clone_has_own_index(self):
+        game = YutGame(["A", "B"], num_players=2)
+        game.players[0].pieces[0].enter_board("03")
+        sim = game.clone()
+        sim.players[0].pieces[0].move_to("05")
+        assert game._get_stack_at_position(0, "03") == [game.players[0].pieces[0]]
+        assert sim._get_stack_at_position(0, "03") == []
+        assert sim._get_stack_at_position(0, "05") == [sim.players[0].pieces[0]]
+
+
+def _full_state(game):
+    """Everything undo_move must restore, including has_moved flags."""
+    state = game.get_game_state()
+    state["move_history"] = list(game.move_history)
+    state["has_moved"] = [[pc.has_moved for pc in p.pieces] for p in game.players]
+    return state
+
+
+class TestApplyUndo:
+    """Test reversible apply_move / undo_move."""
+
+    def test_undo_restores_simple_move(self):
+        game = YutGame(["A", "B"], num_players=2)
+        game.players[0].pieces[0].enter_board("03")
+        game.accumulated_moves = [2, 3, 2]
+        before = _full_state(game)
+
+        undo = game.apply_move(0, 0, 3)
+        assert game.players[0].pieces[0].position == "06"
+
+        game.undo_move(undo)
+        assert _full_state(game) == before
+
+    def test_undo_restores_capture_and_bonus(self):
+        game = YutGame(["A", "B"], num_players=2)
+        game.players[0].pieces[0].enter_board("01")
+        game.players[0].pieces[1].enter_board("01")
+        game.players[1].pieces[0].enter_board("03")
+        game.accumulated_moves = [2, 4]
+        before = _full_state(game)
+
+        undo = game.apply_move(0, 0, 2, bonus=[3])
+        assert not game.players[1].pieces[0].is_active
+        assert game.accumulated_moves == [4, 3]
+        assert undo.bonus == [3]
+
+        game.undo_move(undo)
+        assert _full_state(game) == before
+
+    def test_undo_restores_finish_and_rankings(self):
+        game = YutGame(["A", "B"], num_players=2)
+        pieces = game.players[0].pieces
+        for piece in pieces[:3]:
+            piece.enter_board("01")
+            piece.finish()
+        pieces[3].enter_board("00")
+        game.accumulated_moves = [1]
+        before = _full_state(game)
+
+        undo = game.apply_move(0, 3, 1)
+        assert game.rankings == [0, 1]
+        assert game.game_state == "finished"
+
+        game.undo_move(undo)
+        assert _full_state(game) == before
+
+    def test_undo_skip(self):
+        game = YutGame(["A", "B"], num_players=2)
+        game.accumulated_moves = [5, 1]
+        undo = game.apply_skip()
+        assert game.accumulated_moves == []
+        game.undo_move(undo)
+        assert game.accumulated_moves == [5, 1]
+
+    def test_undo_throw_and_next_turn(self):
+        game = YutGame(["A", "B", "C"], num_players=3)
+        game.accumulated_moves = [2]
+        before = _full_state(game)
+
+        throw = game.apply_throw(4)
+        assert game.accumulated_moves == [2, 4]
+        turn = game.apply_next_turn()
+        assert game.current_player_idx == 1
+        assert game.accumulated_moves == []
+
+        game.undo_move(turn)
+        game.undo_move(throw)
+        assert _full_state(game) == before
+
+    def test_capture_is_recorded_on_undo(self):
+        game = YutGame(["A", "B"], num_players=2)
+        game.players[0].pieces[0].enter_board("01")
+        game.players[1].pieces[0].enter_board("03")
+        game.accumulated_moves = [2]
+        assert game.apply_move(0, 0, 2, bonus=[]).captured
+
+    def test_search_moves_are_not_logged(self):
+        game = YutGame(["A", "B"], num_players=2)
+        game.players[0].pieces[0].enter_board("01")
+        game.players[1].pieces[0].enter_board("03")
+        game.accumulated_moves = [2, 1]
+        assert game.apply_move(0, 0, 2, bonus=[]).captured
+        assert game.apply_move(0, -1, 1) is not None
+        assert game.move_history == []
+
+        game.accumulated_moves = [3]
+        game.move_piece(0, 0, 3)
+        assert game.move_history == ["A moved Piece 0 3 spaces to 06"]
+
+    def test_illegal_move_returns_none(self):
+        game = YutGame(["A", "B"], num_players=2)
+        game.accumulated_moves = [2]
+        before = _full_state(game)
+        assert game.apply_move(0, 0, 2) is None
+        assert _full_state(game) == before
+
+    def test_random_sequences_unwind_exactly(self):
+        import random
+
+        rng = random.Random(7)
+        game = YutGame(["A", "B", "C"], num_players=3)
+        game.players[1].pieces[0].enter_board("02")
+        game.players[2].pieces[0].enter_board("04")
+        for _ in range(50):
+            game.accumulated_moves = [rng.choice([-1, 1, 2, 3, 4, 5]) for _ in range(3)]
+            before = _full_state(game)
+            stack = []
+            while game.accumulated_moves and game.game_state == "playing":
+                legal = game.get_legal_moves_idx(0)
+                if not legal:
+                    break
+                stack.append(game.apply_move(0, *rng.choice(legal), bonus=[2]))
+            while stack:
+                game.undo_move(stack.pop())
+            assert _full_state(game) == before
+
 
 class TestGameState:
     """Test game state management."""
@@ -0,0 +1,141 @@
+"""
+Tests for head-to-head match helpers.
+"""
+
+import math
+import random
+
+import pytest
+
+from yoot import MonteCarloController, RandomController, YutGame
+from yoot.match import (
+    SPRT,
+    SeatThrows,
+    paired_estimate,
+    play_game,
+    play_pair,
+    run_sprt,
+    wilson_interval,
+)
+
+
+def _random(game, player_id, rng):
+    return RandomController(rng)
+
+
+class TestPlayGame:
+    """Test the shared game loop."""
+
+    def test_plays_to_a_winner(self):
+        random.seed(0)
+        game = YutGame(["A", "B"], num_players=2)
+        turns = play_game(game, {0: RandomController(), 1: RandomController()})
+        assert game.game_state == "finished"
+        assert len(game.rankings) == 2
+        assert 0 < turns < 500
+
+    def test_turn_limit(self):
+        random.seed(0)
+        game = YutGame(["A", "B"], num_players=2)
+        assert play_game(game, {0: RandomController(), 1: RandomController()}, 3) == 3
+        assert game.game_state == "playing"
+
+
+class TestCommonRandomNumbers:
+    """Test paired games and the paired estimator."""
+
+    def test_seat_throws_follow_current_player(self):
+        game = YutGame(["A", "B"], num_players=2)
+        game.throw_source = SeatThrows(game, [random.Random(1), random.Random(2)])
+        seat0 = [game.throw_source() for _ in range(5)]
+        game.current_player_idx = 1
+        seat1 = [game.throw_source() for _ in range(5)]
+        expected = SeatThrows(game, [random.Random(2)])
+        game.current_player_idx = 0
+        assert seat1 == [expected() for _ in range(5)]
+        assert seat0 != seat1
+
+    def test_pairs_are_reproducible(self):
+        first = play_pair(_random, _random, seed=3)
+        assert play_pair(_random, _random, seed=3) == first
+        assert all(score in (-1, 0, 1) for score, _ in first)
+
+    def test_same_controller_twice_cancels(self):
+        # Identical controllers with identical generators see identical
+        # dice from the same seat, so each pair is a win and a loss
+        def make(game, player_id, rng):
+            return MonteCarloController(
+                game, player_id, num_simulations=3, rng=random.Random(7)
+            )
+
+        for seed in range(3):
+            (s0, _), (s1, _) = play_pair(make, make, seed)
+            assert s0 == -s1
+
+    def test_paired_estimate(self):
+        estimate = paired_estimate([(1, 1), (1, -1), (-1, 1), (1, 1)])
+        assert estimate["pairs"] == 4
+        assert estimate["diff"] == pytest.approx(0.5)
+        assert estimate["stderr"] == pytest.approx(math.sqrt(1 / 3 / 4))
+        assert estimate["unpaired_stderr"] > estimate["stderr"]
+        assert paired_estimate([(1, -1)])["stderr"] == math.inf
+
+
+class TestSPRT:
+    """Test the sequential test and the early-stopping runner."""
+
+    def test_llr_and_bounds(self):
+        test = SPRT(0.5, 0.6, alpha=0.05, beta=0.1)
+        assert test.lower == pytest.approx(math.log(0.1 / 0.95))
+        assert test.upper == pytest.approx(math.log(0.9 / 0.05))
+        for score in (1, 1, -1, 0):
+            test.add(score)
+        points, misses = 2.5, 1.5
+        expected = points * math.log(0.6 / 0.5) + misses * math.log(0.4 / 0.5)
+        assert test.llr() == pytest.approx(expected)
+        assert test.decision() is None
+
+    def test_decides_both_ways(self):
+        strong = SPRT(0.5, 0.6)
+        while strong.decision() is None:
+            strong.add(1)
+        assert strong.decision() == "H1"
+        weak = SPRT(0.5, 0.6)
+        while weak.decision() is None:
+            weak.add(-1)
+        assert weak.decision() == "H0"
+
+    def test_rejects_bad_hypotheses(self):
+        with pytest.raises(ValueError):
+            SPRT(0.5, 0.5)
+        with pytest.raises(ValueError):
+            SPRT(0.0, 0.5)
+
+    def test_wilson_interval(self):
+        low, high = wilson_interval(50, 100)
+        assert low == pytest.approx(0.4038, abs=1e-3)
+        assert high == pytest.approx(0.5962, abs=1e-3)
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+
+    def test_stops_early_on_clear_result(self):
+        def make_mc(game, player_id, rng):
+            return MonteCarloController(game, player_id, num_simulations=2, rng=rng)
+
+        seen = []
+        report = run_sprt(
+            make_mc,
+            _random,
+            SPRT(0.4, 0.8),
+            max_games=200,
+            progress=lambda i, score, test: seen.append(score),
+        )
+        assert report["decision"] == "H1"
+        assert report["games"] == len(seen) < 200
+        assert report["llr"] >= report["bounds"][1]
+        low, high = report["interval"]
+        assert low < report["win_rate"] < high
+
+    def test_game_cap(self):
+        report = run_sprt(_random, _random, SPRT(0.5, 0.51), max_games=4)
+        assert report["games"] == 4
+        assert report["decision"] is None
@@ -0,0 +1,309 @@
+"""
+Tests for the MCTS controller.
+"""
+
+import random
+
+import pytest
+
+from yoot import MCTSController, PackedState, YutGame
+from yoot.mcts_controller import SearchProfile
+from yoot.telemetry import MemorySink
+
+
+@pytest.fixture
+def quiet_midgame(midgame):
+    """Like midgame, without captures (so no bonus throws break reuse)."""
+    midgame.players[1].pieces[0].capture()
+    return midgame
+
+
+class TestMCTSController:
+    """Test MCTS move selection."""
+
+    @pytest.mark.parametrize("use_transpositions", [False, True])
+    def test_returns_legal_move(self, midgame, use_transpositions):
+        random.seed(0)
+        game = midgame
+        ctrl = MCTSController(
+            game, 0, num_iterations=200, use_transpositions=use_transpositions
+        )
+        legal = game.get_legal_moves(0)
+        assert ctrl.choose_move(game.get_game_state(), legal) in legal
+
+    def test_search_leaves_live_game_untouched(self, midgame):
+        random.seed(0)
+        game = midgame
+        before = game.get_game_state()
+        MCTSController(game, 0, num_iterations=200).choose_move(
+            before, game.get_legal_moves(0)
+        )
+        assert game.get_game_state() == before
+
+    def test_injected_rng_is_reproducible(self, midgame):
+        game = midgame
+        legal = game.get_legal_moves(0)
+        runs = []
+        for global_seed in (1, 2):
+            random.seed(global_seed)  # must not matter
+            ctrl = MCTSController(game, 0, num_iterations=200, rng=random.Random(3))
+            runs.append(ctrl.search(game.get_game_state(), legal)[1]["moves"])
+        assert runs[0] == runs[1]
+
+
+class TestTranspositionMCTS:
+    """Test the transposition-table (DAG) search mode."""
+
+    def test_transpositions_are_merged(self, midgame):
+        random.seed(0)
+        game = midgame
+        sink = MemorySink()
+        ctrl = MCTSController(
+            game, 0, num_iterations=500, use_transpositions=True, telemetry=sink
+        )
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+
+        assert ctrl.transpositions > 0
+        assert sink.records[-1]["transpositions"] == ctrl.transpositions
+
+    def test_table_nodes_are_unique_per_state(self, midgame):
+        random.seed(0)
+        game = midgame
+        ctrl = MCTSController(game, 0, num_iterations=300, use_transpositions=True)
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+
+        table = ctrl._table
+        assert table is not None
+        assert len({id(node) for node in table.values()}) == len(table)
+
+    @pytest.mark.parametrize("throws", [[3, 5, -1], [4, 3, -1], [5, 4, 2]])
+    def test_walks_match_table_keys_with_pieces_off_board(self, throws):
+        # Entering pieces in a different order transposes to a state with
+        # the piece ids swapped; edges must still replay onto the keyed state
+        class Checked(MCTSController):
+            def _expand(self, node, game, path, nodes):
+                child = super()._expand(node, game, path, nodes)
+                assert self._table[game.state_hash()] is nodes[-1]
+                return child
+
+        random.seed(1)
+        game = YutGame(["A", "B"], num_players=2)
+        game.accumulated_moves = throws
+        ctrl = Checked(game, 0, num_iterations=1000, use_transpositions=True)
+        legal = game.get_legal_moves(0)
+        assert ctrl.choose_move(game.get_game_state(), legal) in legal
+        assert ctrl.transpositions > 0
+
+    def test_tree_mode_merges_nothing(self, midgame):
+        random.seed(0)
+        game = midgame
+        ctrl = MCTSController(game, 0, num_iterations=300)
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        assert ctrl.transpositions == 0
+
+
+class TestTimeBudget:
+    """Test anytime (time-budgeted) search."""
+
+    def test_budget_stops_search(self, midgame):
+        random.seed(0)
+        game = midgame
+        ctrl = MCTSController(game, 0, num_iterations=None, time_budget_ms=30)
+        legal = game.get_legal_moves(0)
+        move, stats = ctrl.search(game.get_game_state(), legal)
+
+        assert move in legal
+        assert stats["iterations"] > 0
+        assert stats["elapsed_ms"] < 1000
+        assert stats["moves"][0][0] == move
+        assert ctrl.last_stats is stats
+
+    def test_iteration_cap_applies_with_budget(self, midgame):
+        random.seed(0)
+        game = midgame
+        ctrl = MCTSController(game, 0, num_iterations=25, time_budget_ms=10_000)
+        _, stats = ctrl.search(game.get_game_state(), game.get_legal_moves(0))
+        assert stats["iterations"] == 25
+        assert stats["root_visits"] == 25
+
+    def test_needs_some_limit(self, midgame):
+        with pytest.raises(ValueError):
+            MCTSController(midgame, 0, num_iterations=None)
+
+
+class TestRootParallelMCTS:
+    """Test root-parallel search over worker processes."""
+
+    def test_merges_root_children(self, midgame):
+        random.seed(0)
+        game = midgame
+        legal = game.get_legal_moves(0)
+        sink = MemorySink()
+        ctrl = MCTSController(game, 0, num_iterations=120, workers=3, telemetry=sink)
+        try:
+            move, stats = ctrl.search(game.get_game_state(), legal)
+        finally:
+            ctrl.close()
+
+        assert move in legal
+        assert stats["iterations"] == 120
+        assert stats["root_visits"] == 120
+        assert sum(visits for _, visits, _ in stats["moves"]) == 120
+        assert stats["moves"][0][0] == move
+        assert sink.records[-1]["trees"] == 3
+
+    def test_subtree_reuse_within_turn(self, quiet_midgame):
+        random.seed(0)
+        game = quiet_midgame
+        sink = MemorySink()
+        ctrl = MCTSController(game, 0, num_iterations=200, workers=2, telemetry=sink)
+        try:
+            move = ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+            piece_id, steps, dest = move
+            game.move_piece(0, piece_id, steps, dest)
+            ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        finally:
+            ctrl.close()
+        assert sink.records[0]["reused_visits"] == 0
+        assert sink.records[1]["reused_visits"] > 0
+
+
+class TestTreeParallelMCTS:
+    """Test the shared-tree threaded search."""
+
+    def test_threads_share_one_tree(self, midgame):
+        random.seed(0)
+        game = midgame
+        before = game.get_game_state()
+        legal = game.get_legal_moves(0)
+        ctrl = MCTSController(game, 0, num_iterations=300, threads=4)
+        move, stats = ctrl.search(before, legal)
+
+        assert move in legal
+        assert stats["iterations"] == 300
+        assert stats["root_visits"] == 300
+        assert sum(visits for _, visits, _ in stats["moves"]) <= 300
+        assert game.get_game_state() == before
+
+    def test_subtree_reuse_within_turn(self, quiet_midgame):
+        random.seed(0)
+        game = quiet_midgame
+        sink = MemorySink()
+        ctrl = MCTSController(game, 0, num_iterations=200, threads=2, telemetry=sink)
+        piece_id, steps, dest = ctrl.choose_move(
+            game.get_game_state(), game.get_legal_moves(0)
+        )
+        game.move_piece(0, piece_id, steps, dest)
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        assert sink.records[1]["reused_visits"] > 0
+
+    def test_rejects_transpositions(self, midgame):
+        with pytest.raises(ValueError):
+            MCTSController(midgame, 0, use_transpositions=True, threads=2)
+
+
+class TestBatchedMCTS:
+    """Test batched leaf evaluation."""
+
+    def test_default_evaluator(self, midgame):
+        random.seed(0)
+        game = midgame
+        legal = game.get_legal_moves(0)
+        ctrl = MCTSController(game, 0, num_iterations=100, batch_size=16)
+        move, stats = ctrl.search(game.get_game_state(), legal)
+
+        assert move in legal
+        assert stats["iterations"] == 100
+        assert stats["root_visits"] == 100
+
+    def test_evaluator_gets_batches(self, midgame):
+        batches = []
+
+        def evaluator(states, player_id):
+            batches.append(len(states))
+            assert all(isinstance(state, PackedState) for state in states)
+            return [0.5] * len(states)
+
+        game = midgame
+        ctrl = MCTSController(
+            game, 0, num_iterations=50, batch_size=16, evaluator=evaluator
+        )
+        _, stats = ctrl.search(game.get_game_state(), game.get_legal_moves(0))
+
+        assert batches == [16, 16, 16, 2]
+        assert all(win_rate == 0.5 for _, _, win_rate in stats["moves"])
+
+
+class TestSearchProfile:
+    """Test the per-phase search profile."""
+
+    def test_profile_counts_phases(self, midgame):
+        game = midgame
+        ctrl = MCTSController(game, 0, num_iterations=150, profile=True)
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        profile = ctrl.last_profile
+        assert profile.decisions == 1
+        assert profile.iterations == 150
+        assert profile.rollouts == 150
+        for phase in ("select", "expand", "simulate", "backpropagate"):
+            assert profile.calls[phase] == 150
+        assert profile.calls["clone"] == 151  # rollout snapshots plus the root copy
+        assert sum(profile.seconds.values()) <= profile.elapsed
+        assert profile.max_rollout_turns >= profile.mean_rollout_turns > 0
+        assert profile.heuristic_fallbacks >= profile.cap_hits
+
+    def test_profile_does_not_change_search(self, midgame):
+        game = midgame
+        moves = []
+        for profile in (False, True):
+            ctrl = MCTSController(
+                game, 0, num_iterations=200, rng=random.Random(5), profile=profile
+            )
+            moves.append(ctrl.search(game.get_game_state(), game.get_legal_moves(0)))
+        (plain, plain_stats), (profiled, profiled_stats) = moves
+        assert plain == profiled
+        assert plain_stats["moves"] == profiled_stats["moves"]
+
+    def test_cap_hits_fall_back_to_heuristic(self, midgame):
+        game = midgame
+        ctrl = MCTSController(game, 0, num_iterations=30, profile=True)
+        ctrl.MAX_ROLLOUT_TURNS = 1
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        profile = ctrl.last_profile
+        assert profile.max_rollout_turns == 1
+        assert profile.cap_hits > 0
+        assert profile.heuristic_fallbacks >= profile.cap_hits
+
+    def test_game_profile_aggregates_decisions(self, quiet_midgame):
+        game = quiet_midgame
+        sink = MemorySink()
+        ctrl = MCTSController(game, 0, num_iterations=100, profile=True, telemetry=sink)
+        piece_id, steps, dest = ctrl.choose_move(
+            game.get_game_state(), game.get_legal_moves(0)
+        )
+        game.move_piece(0, piece_id, steps, dest)
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        assert ctrl.game_profile.decisions == 2
+        assert ctrl.game_profile.iterations == 200
+        assert [r["profile"]["iterations"] for r in sink.records] == [100, 100]
+        assert sink.records[0]["profile"]["phase_calls"]["select"] == 100
+
+    def test_merge(self):
+        first, second = SearchProfile(), SearchProfile()
+        first.add("select", 0.5)
+        second.add("select", 0.25)
+        second.add_rollout(7, capped=False, fallback=False)
+        total = SearchProfile().merge(first).merge(second)
+        assert total.seconds["select"] == 0.75
+        assert total.calls["select"] == 2
+        assert total.mean_rollout_turns == 7
+
+    def test_off_by_default(self, midgame):
+        game = midgame
+        ctrl = MCTSController(game, 0, num_iterations=50)
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        assert ctrl.last_profile is None and ctrl.game_profile is None
+
+    def test_rejects_parallel_modes(self, midgame):
+        with pytest.raises(ValueError):
+            MCTSController(midgame, 0, threads=2, profile=True)
@@ -0,0 +1,145 @@
+"""
+Tests for the multi-turn MCTS controller.
+"""
+
+import random
+
+import pytest
+
+from yoot import MultiTurnMCTSController, YutGame, YutThrow
+from yoot.multi_turn_mcts import CHANCE, DECISION, END_TURN, TurnNode
+
+
+class TestMultiTurnMCTS:
+    """Test move selection across turn boundaries."""
+
+    def test_returns_legal_move(self, midgame):
+        random.seed(0)
+        game = midgame
+        ctrl = MultiTurnMCTSController(game, 0, num_iterations=200)
+        legal = game.get_legal_moves(0)
+        assert ctrl.choose_move(game.get_game_state(), legal) in legal
+
+    def test_search_leaves_live_game_untouched(self, midgame):
+        random.seed(0)
+        game = midgame
+        before = game.get_game_state()
+        history = list(game.move_history)
+        MultiTurnMCTSController(game, 0, num_iterations=200).choose_move(
+            before, game.get_legal_moves(0)
+        )
+        assert game.get_game_state() == before
+        assert game.move_history == history
+
+    def test_injected_rng_is_reproducible(self, midgame):
+        game = midgame
+        legal = game.get_legal_moves(0)
+        runs = []
+        for global_seed in (1, 2):
+            random.seed(global_seed)  # must not matter
+            ctrl = MultiTurnMCTSController(game, 0, num_iterations=200, rng=random.Random(3))
+            runs.append(ctrl.search(game.get_game_state(), legal)[1]["moves"])
+        assert runs[0] == runs[1]
+
+    def test_search_crosses_turns(self):
+        random.seed(1)
+        game = YutGame(["A", "B"], num_players=2)
+        game.players[0].pieces[0].enter_board("03")
+        game.accumulated_moves = [1, 2]
+        ctrl = MultiTurnMCTSController(game, 0, num_iterations=300, search_turns=1)
+
+        deepest = []
+        original = ctrl._step
+
+        def spy(game, node, action, path):
+            kind, depth = original(game, node, action, path)
+            deepest.append(depth)
+            return kind, depth
+
+        ctrl._step = spy
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        assert max(deepest) >= 1
+
+    def test_chance_outcomes_are_whole_throw_phases(self, midgame):
+        game = midgame
+        ctrl = MultiTurnMCTSController(game, 0, num_iterations=300, rng=random.Random(2))
+        outcomes = []
+        original = ctrl._throw_phase
+
+        def spy(game, path):
+            outcomes.append(original(game, path))
+            return outcomes[-1]
+
+        ctrl._throw_phase = spy
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        distribution = dict(YutThrow.turn_distribution())
+        assert outcomes
+        assert all(outcome in distribution for outcome in outcomes)
+        assert any(len(outcome) > 1 for outcome in outcomes)
+
+    def test_chance_value_is_probability_weighted(self, midgame):
+        ctrl = MultiTurnMCTSController(midgame, 0, num_iterations=1)
+        ctrl._outcome_probabilities = {(1,): 0.75, (2,): 0.25}
+        chance = TurnNode(CHANCE, 0, 1)
+        # The rare outcome happens to be sampled twice, then the common one
+        for outcome, score in (((2,), 0.0), ((2,), 0.0), ((1,), 1.0)):
+            child = chance.children.setdefault(outcome, TurnNode(DECISION, 0, 1))
+            ctrl._backpropagate([chance, child], score)
+        common, rare = chance.children[(1,)], chance.children[(2,)]
+        assert chance.visits == 3
+        assert chance.wins / chance.visits == pytest.approx(0.75)
+        assert rare.wins == 0.0 and common.wins == 1.0
+
+    @pytest.mark.parametrize(
+        "samples",
+        [
+            [(2,), (2,), (1,)],  # rare outcome oversampled
+            [(1,), (1,), (1,), (1,), (2,)],  # common outcome oversampled
+        ],
+    )
+    def test_ancestors_follow_the_weighted_chance_value(self, midgame, samples):
+        ctrl = MultiTurnMCTSController(midgame, 0, num_iterations=1)
+        ctrl._outcome_probabilities = {(1,): 0.75, (2,): 0.25}
+        scores = {(1,): 1.0, (2,): 0.0}
+        root = TurnNode(DECISION, 0, 0)
+        move = TurnNode(DECISION, 0, 0)
+        chance = TurnNode(CHANCE, 1, 1)
+        root.children.append(move)
+        move.children.append(chance)
+        for outcome in samples:
+            child = chance.children.setdefault(outcome, TurnNode(DECISION, 1, 1))
+            ctrl._backpropagate([root, move, chance, child], scores[outcome])
+        assert move.wins / move.visits == pytest.approx(0.75)
+        assert root.wins / root.visits == pytest.approx(0.75)
+
+    def test_certain_win_is_terminal(self):
+        random.seed(0)
+        game = YutGame(["A", "B"], num_players=2)
+        pieces = game.players[0].pieces
+        for piece in pieces[:3]:
+            piece.enter_board("01")
+            piece.finish()
+        pieces[3].enter_board("00")
+        game.accumulated_moves = [1, 2]
+        ctrl = MultiTurnMCTSController(game, 0, num_iterations=50)
+        move = ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        assert move[0] == 3
+
+
+class TestTurnNode:
+    """Test the tree node used by the multi-turn search."""
+
+    def test_chance_children_are_keyed_by_throw(self):
+        assert TurnNode(CHANCE, 0, 0).children == {}
+        assert TurnNode(DECISION, 0, 0).children == []
+
+    def test_opponent_picks_worst_child_for_root(self):
+        node = TurnNode(DECISION, 1, 1)
+        for wins in (9.0, 1.0):
+            child = TurnNode(CHANCE, 0, 2)
+            child.visits, child.wins = 10, wins
+            node.children.append(child)
+            node.edges.append(END_TURN)
+        node.visits = 20
+        assert node.best_index(root_player_id=0) == 1
+        assert node.best_index(root_player_id=1) == 0
@@ -0,0 +1,101 @@
+"""
+Tests for the packed array-backed game state.
+"""
+
+import random
+
+import pytest
+
+from yoot import PackedState, YutGame
+from yoot.packed import FINISHED, WAITING
+
+
+def _snapshot(game):
+    """Comparable YutGame state, including has_moved flags."""
+    return (
+        [[(pc.pos, pc.is_active, pc.has_moved) for pc in p.pieces] for p in game.players],
+        game.current_player_idx,
+        list(game.accumulated_moves),
+        list(game.rankings),
+        game.winner,
+        game.game_state,
+    )
+
+
+class TestConversion:
+    """Test lossless YutGame <-> PackedState conversion."""
+
+    def test_new_game_packs_as_all_waiting(self):
+        state = PackedState.from_game(YutGame(["A", "B"], num_players=2))
+        assert list(state.positions) == [WAITING] * 8
+        assert list(state.waiting) == [4, 4]
+        assert list(state.finished) == [0, 0]
+        assert state == PackedState(2)
+
+    def test_round_trip(self):
+        game = YutGame(["A", "B", "C"], num_players=3)
+        game.players[0].pieces[0].enter_board("cc")
+        game.players[0].pieces[1].enter_board("00")
+        game.players[1].pieces[3].enter_board("01")
+        game.players[1].pieces[3].finish()
+        game.accumulated_moves = [4, -1]
+        game.current_player_idx = 1
+
+        state = PackedState.from_game(game)
+        assert list(state.piece_positions(1)) == [WAITING, WAITING, WAITING, FINISHED]
+
+        copy = YutGame(["A", "B", "C"], num_players=3)
+        state.apply_to(copy)
+        assert _snapshot(copy) == _snapshot(game)
+        assert _snapshot(state.to_game()) == _snapshot(game)
+
+    def test_unreachable_piece_state_rejected(self):
+        game = YutGame(["A", "B"], num_players=2)
+        piece = game.players[0].pieces[0]
+        piece.position = "03"
+        piece.is_active = True
+        with pytest.raises(ValueError):
+            PackedState.from_game(game)
+
+    def test_clone_is_independent(self):
+        state = PackedState(2)
+        state.accumulated_moves = [3]
+        copy = state.clone()
+        copy.move_piece_idx(0, -1, 3)
+        assert state.accumulated_moves == [3]
+        assert list(state.waiting) == [4, 4]
+        assert list(copy.waiting) == [3, 4]
+
+
+class TestRulesParity:
+    """The packed rules engine must track YutGame move for move."""
+
+    @pytest.mark.parametrize("num_players", [2, 4, 6])
+    def test_random_games_match(self, num_players):
+        rng = random.Random(num_players)
+        game = YutGame(None, num_players)
+        state = PackedState.from_game(game)
+
+        for _ in range(300):
+            if game.game_state != "playing":
+                break
+            pid = game.current_player_idx
+            moves = [rng.choice([-1, 1, 2, 3, 4, 5]) for _ in range(rng.randint(1, 3))]
+            game.accumulated_moves = list(moves)
+            state.accumulated_moves = list(moves)
+
+            while game.accumulated_moves:
+                legal = game.get_legal_moves_idx(pid)
+                assert state.get_legal_moves_idx(pid) == legal
+                if not legal:
+                    break
+                move = rng.choice(legal)
+                assert state.move_piece_idx(pid, *move) == game.move_piece_idx(pid, *move)
+                assert state.check_win_condition() == game.check_win_condition()
+                assert state == PackedState.from_game(game)
+                if game.game_state != "playing":
+                    break
+
+            game.next_turn()
+            state.next_turn()
+            assert state == PackedState.from_game(game)
@@ -0,0 +1,75 @@
+"""
+Tests for seed-splitting helpers and injected generators.
+"""
+
+import random
+
+from yoot import (
+    MCTSController,
+    MonteCarloController,
+    MultiTurnMCTSController,
+    PackedState,
+    YutGame,
+)
+from yoot.seeding import derive_seed, make_rng, split_rng
+
+
+class TestSeeding:
+    """Test seed derivation and splitting."""
+
+    def test_derive_seed_is_stable(self):
+        assert derive_seed(42, "game", 3) == derive_seed(42, "game", 3)
+        assert derive_seed(42, "game", 3) != derive_seed(42, "game", 4)
+        assert 0 <= derive_seed(42) < 2**64
+
+    def test_make_rng_replays(self):
+        a = make_rng(7, "seat", 1)
+        b = make_rng(7, "seat", 1)
+        assert [a.random() for _ in range(5)] == [b.random() for _ in range(5)]
+
+    def test_split_rng(self):
+        children = split_rng(random.Random(1), 4)
+        again = split_rng(random.Random(1), 4)
+        assert len(children) == 4
+        firsts = [child.random() for child in children]
+        assert firsts == [child.random() for child in again]
+        assert len(set(firsts)) == 4
+
+
+class TestGameRng:
+    """Test games driven by their own generator."""
+
+    def _throws(self, game, count=50):
+        return [game.throw_source() for _ in range(count)]
+
+    def test_seeded_games_repeat(self):
+        a = YutGame(["A", "B"], num_players=2, rng=random.Random(5))
+        b = YutGame(["A", "B"], num_players=2, rng=random.Random(5))
+        assert self._throws(a) == self._throws(b)
+
+    def test_global_random_untouched(self):
+        random.seed(11)
+        expected = random.random()
+        random.seed(11)
+        game = YutGame(["A", "B"], num_players=2, rng=random.Random(5))
+        self._throws(game)
+        assert random.random() == expected
+
+    def test_clones_do_not_draw_from_the_game(self):
+        game = YutGame(["A", "B"], num_players=2, rng=random.Random(5))
+        self._throws(game.clone())
+        self._throws(PackedState.from_game(game))
+        expected = YutGame(["A", "B"], num_players=2, rng=random.Random(5))
+        assert self._throws(game) == self._throws(expected)
+
+    def test_search_without_rng_leaves_game_throws_alone(self):
+        game = YutGame(["A", "B"], num_players=2, rng=random.Random(5))
+        game.accumulated_moves = [4, 3, 2]
+        for ctrl in (
+            MCTSController(game, 0, num_iterations=50),
+            MultiTurnMCTSController(game, 0, num_iterations=50),
+            MonteCarloController(game, 0, num_simulations=3),
+        ):
+            ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        expected = YutGame(["A", "B"], num_players=2, rng=random.Random(5))
+        assert self._throws(game) == self._throws(expected)
@@ -0,0 +1,116 @@
+"""
+Tests for search telemetry sinks and records.
+"""
+
+import io
+import json
+import random
+
+import pytest
+
+from yoot import MCTSController, MonteCarloController, MultiTurnMCTSController
+from yoot.telemetry import (
+    NULL_SINK,
+    JsonlSink,
+    MemorySink,
+    TelemetrySink,
+    TextSink,
+    format_record,
+)
+
+FIELDS = {
+    "controller",
+    "player_id",
+    "move",
+    "iterations",
+    "elapsed_ms",
+    "time_budget_ms",
+    "root_visits",
+    "reused_visits",
+    "tree_size",
+    "candidates",
+}
+
+
+def _decide(game, cls, sink, **params):
+    ctrl = cls(game, 0, rng=random.Random(1), telemetry=sink, **params)
+    legal = game.get_legal_moves(0)
+    return ctrl.choose_move(game.get_game_state(), legal)
+
+
+class TestRecords:
+    """Test the records each controller emits."""
+
+    @pytest.mark.parametrize(
+        "cls, params, name",
+        [
+            (MonteCarloController, {"num_simulations": 5}, "MC"),
+            (MCTSController, {"num_iterations": 100}, "MCTS"),
+            (MultiTurnMCTSController, {"num_iterations": 100}, "MT-MCTS"),
+        ],
+    )
+    def test_one_record_per_decision(self, midgame, cls, params, name):
+        sink = MemorySink()
+        move = _decide(midgame, cls, sink, **params)
+        (record,) = sink.records
+        assert FIELDS <= set(record)
+        assert record["controller"] == name
+        assert record["player_id"] == 0
+        assert record["move"] == move
+        assert move in [c["move"] for c in record["candidates"]]
+        assert json.loads(json.dumps(record)) is not None
+
+    def test_mcts_tree_size(self, midgame):
+        sink = MemorySink()
+        _decide(midgame, MCTSController, sink, num_iterations=100)
+        (record,) = sink.records
+        assert record["iterations"] == 100
+        assert record["root_visits"] == 100
+        assert 1 < record["tree_size"] <= 101
+
+    def test_default_is_silent(self, midgame, capsys):
+        game = midgame
+        ctrl = MCTSController(game, 0, num_iterations=50)
+        assert ctrl.telemetry is NULL_SINK and not NULL_SINK.enabled
+        ctrl.choose_move(game.get_game_state(), game.get_legal_moves(0))
+        assert capsys.readouterr().out == ""
+
+
+class TestSinks:
+    """Test the sink base class and the JSONL and text sinks."""
+
+    def test_sink_must_define_emit(self):
+        class Incomplete(TelemetrySink):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_jsonl_sink(self, midgame, tmp_path):
+        path = tmp_path / "decisions.jsonl"
+        sink = JsonlSink(str(path))
+        for _ in range(2):
+            _decide(midgame, MCTSController, sink, num_iterations=30)
+        sink.close()
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(records) == 2
+        assert all(r["controller"] == "MCTS" for r in records)
+
+    def test_text_sink_marks_choice(self, midgame):
+        stream = io.StringIO()
+        _decide(midgame, MCTSController, TextSink(stream), num_iterations=50)
+        text = stream.getvalue()
+        assert text.startswith("  [MCTS] 50 iterations")
+        assert text.count(" <<") == 1
+
+    def test_format_skip(self):
+        record = {
+            "controller": "MC",
+            "move": None,
+            "iterations": 0,
+            "elapsed_ms": 0.0,
+            "reused_visits": 0,
+            "tree_size": None,
+            "candidates": [{"move": None, "visits": 0, "win_rate": 0.0}],
+        }
+        assert "skip: 0 visits, 0.0% winrate <<" in format_record(record)
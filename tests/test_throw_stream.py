@@ -0,0 +1,60 @@
+"""
+Tests for NumPy bulk throw streams (skipped without NumPy).
+"""
+
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from yoot import PackedState, YutGame, YutThrow  # noqa: E402
+from yoot.throw_stream import ThrowStream  # noqa: E402
+
+
+class TestThrowStream:
+    """Test pre-drawn throw blocks."""
+
+    def test_same_seed_and_stream_repeat(self):
+        first = ThrowStream(7, stream=3, block_size=64)
+        second = ThrowStream(7, stream=3, block_size=1024)
+        assert [first() for _ in range(500)] == [second() for _ in range(500)]
+
+    def test_streams_are_independent(self):
+        streams = ThrowStream.for_games(2, seed=7)
+        assert [streams[0]() for _ in range(50)] != [streams[1]() for _ in range(50)]
+
+    def test_distribution(self):
+        stream = ThrowStream(1, block_size=4096)
+        counts = Counter(name for name, _ in (stream() for _ in range(20000)))
+        for name, _, probability in YutThrow.distribution():
+            assert counts[name] / 20000 == pytest.approx(probability, abs=0.015)
+
+    def test_follows_flat_probability(self, monkeypatch):
+        stream = ThrowStream(1, block_size=256)
+        stream()
+        monkeypatch.setattr(YutThrow, "FLAT_PROBABILITY", 1.0)
+        assert {stream() for _ in range(20)} == {("yut", 4)}
+
+
+class TestThrowSource:
+    """Test games drawing from a pluggable throw source."""
+
+    def test_throw_phase_uses_source(self):
+        game = YutGame(["A", "B"], num_players=2, throw_source=ThrowStream(5))
+        expected = ThrowStream(5)
+        throws = game.throw_phase()
+        assert throws == [expected() for _ in throws]
+
+    def test_snapshots_get_their_own_source(self):
+        stream = ThrowStream(5)
+        game = YutGame(["A", "B"], num_players=2, throw_source=stream)
+        assert game.clone().throw_source is not stream
+        assert game.clone(stream).throw_source is stream
+
+        state = PackedState.from_game(game)
+        assert state.throw_source is not stream
+        state = PackedState.from_game(game, stream)
+        assert state.throw_source is stream
+        assert state.clone().throw_source is stream
+        assert state == PackedState.from_game(YutGame(["A", "B"], num_players=2))
@@ -0,0 +1,166 @@
+"""
+Tests for the tournament runner.
+"""
+
+import json
+
+import pytest
+
+from yoot.tournament import (
+    normalize_spec,
+    play_tournament_game,
+    read_results,
+    run_tournament,
+    seat_order,
+    summarize,
+)
+
+
+def _spec(games=6, **extra):
+    return normalize_spec(
+        {
+            "name": "test",
+            "games": games,
+            "players": [
+                {"name": "R1", "controller": "RandomController"},
+                {"name": "R2", "controller": "RandomController"},
+                {
+                    "name": "MC",
+                    "controller": "MonteCarloController",
+                    "params": {"num_simulations": 2},
+                },
+            ],
+            **extra,
+        }
+    )
+
+
+class TestSpec:
+    """Test spec validation and seating."""
+
+    def test_defaults(self):
+        (matchup,) = _spec()
+        assert matchup["rotate_seats"] is True
+        assert matchup["common_throws"] is False
+        assert matchup["players"][0]["params"] == {}
+
+    def test_rejects_bad_specs(self):
+        with pytest.raises(ValueError):
+            normalize_spec({"name": "x", "games": 1, "players": []})
+        with pytest.raises(ValueError):
+            _spec(games=0)
+        with pytest.raises(ValueError):
+            normalize_spec(
+                {
+                    "name": "x",
+                    "games": 1,
+                    "players": [
+                        {"name": "A", "controller": "NoSuchController"},
+                        {"name": "B", "controller": "RandomController"},
+                    ],
+                }
+            )
+
+    def test_common_throws_need_rotation(self):
+        with pytest.raises(ValueError):
+            _spec(common_throws=True, rotate_seats=False)
+        (matchup,) = _spec(common_throws=True)
+        assert matchup["rotate_seats"] is True
+
+    def test_seat_rotation(self):
+        (matchup,) = _spec()
+        assert [seat_order(matchup, i) for i in range(3)] == [
+            [0, 1, 2],
+            [1, 2, 0],
+            [2, 0, 1],
+        ]
+        (fixed,) = _spec(rotate_seats=False)
+        assert seat_order(fixed, 4) == [0, 1, 2]
+
+
+class TestRunTournament:
+    """Test game records, resuming and summaries."""
+
+    def test_games_are_deterministic(self):
+        (matchup,) = _spec()
+        first = play_tournament_game(matchup, 4)
+        second = play_tournament_game(matchup, 4)
+        first.pop("seconds"), second.pop("seconds")
+        assert first == second
+        assert first["seats"] == ["R2", "MC", "R1"]
+        assert first["counters"]["games"] == 1
+        assert first["counters"]["rollouts"] > 0
+        assert set(first["rankings"]) <= {"MC", "R1", "R2"}
+
+    def test_resume_skips_finished_games(self, tmp_path):
+        path = str(tmp_path / "results.jsonl")
+        matchups = _spec(games=4)
+        records = run_tournament(matchups, path, workers=1)
+        assert sorted(r["game"] for r in records) == [0, 1, 2, 3]
+
+        # Simulate a run killed mid-write: drop two records, tear a line
+        lines = open(path).read().splitlines()
+        with open(path, "w") as f:
+            f.write("\n".join(lines[:-2]) + '\n{"matchup": "te')
+        played = []
+        resumed = run_tournament(
+            matchups, path, workers=1, progress=lambda r, done, total: played.append(r)
+        )
+        assert sorted(r["game"] for r in played) == [2, 3]
+        spec, again = read_results(path)
+        assert spec == matchups
+        assert sorted(r["game"] for r in again) == [0, 1, 2, 3]
+
+        strip = [{k: v for k, v in r.items() if k != "seconds"} for r in records]
+        assert sorted(strip, key=lambda r: r["game"]) == sorted(
+            ({k: v for k, v in r.items() if k != "seconds"} for r in resumed),
+            key=lambda r: r["game"],
+        )
+
+    def test_rejects_other_spec(self, tmp_path):
+        path = str(tmp_path / "results.jsonl")
+        run_tournament(_spec(games=1), path, workers=1)
+        with pytest.raises(ValueError):
+            run_tournament(_spec(games=2), path, workers=1)
+
+    def test_process_pool(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        records = run_tournament(_spec(games=4), str(path), workers=2)
+        assert sorted(r["game"] for r in records) == [0, 1, 2, 3]
+        assert len(path.read_text().splitlines()) == 5  # spec + 4 games
+
+    def test_summary(self, tmp_path):
+        path = str(tmp_path / "results.jsonl")
+        matchups = normalize_spec(
+            {
+                "name": "pair",
+                "games": 4,
+                "common_throws": True,
+                "players": [
+                    {"name": "A", "controller": "RandomController"},
+                    {"name": "B", "controller": "RandomController"},
+                ],
+            }
+        )
+        records = run_tournament(matchups, path, workers=1)
+        result = summarize(matchups, records)["pair"]
+        players = result["players"]
+        assert result["games"] == 4
+        assert players["A"]["wins"] + players["B"]["wins"] == 4
+        assert players["A"]["mean_rank"] + players["B"]["mean_rank"] == pytest.approx(3)
+        assert result["paired"]["pairs"] == 2
+        assert result["rollouts_per_second"] == 0.0  # random players roll nothing out
+        assert json.dumps(result)  # plain data
+
+    def test_telemetry_file(self, tmp_path):
+        path = str(tmp_path / "results.jsonl")
+        telemetry = tmp_path / "decisions.jsonl"
+        records = run_tournament(
+            _spec(games=2), path, workers=1, telemetry_path=str(telemetry)
+        )
+        assert all("decisions" not in r for r in records)
+        decisions = [json.loads(line) for line in telemetry.read_text().splitlines()]
+        assert decisions
+        assert {d["player"] for d in decisions} == {"MC"}
+        assert {d["game"] for d in decisions} <= {0, 1}
+        assert all(d["matchup"] == "test" and d["controller"] == "MC" for d in decisions)
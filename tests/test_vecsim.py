@@ -0,0 +1,150 @@
+"""
+Tests for the vectorized NumPy simulator (skipped without NumPy).
+"""
+
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from yoot import PackedState, RandomController, YutGame, YutThrow  # noqa: E402
+from yoot.match import play_game  # noqa: E402
+from yoot.packed import FINISHED  # noqa: E402
+from yoot.vecsim import (  # noqa: E402
+    THROW_VALUES,
+    VecRolloutEvaluator,
+    VecSim,
+    throw_probabilities,
+)
+
+
+def _random_games(num_players, count):
+    """count games of RandomController seats; returns (rankings, turns) arrays."""
+    rankings, turns = [], []
+    for seed in range(count):
+        rng = random.Random(seed)
+        game = YutGame(None, num_players, rng=rng)
+        controllers = [RandomController(rng) for _ in range(num_players)]
+        turns.append(play_game(game, controllers))
+        rankings.append(game.rankings)
+    return np.array(rankings), np.array(turns, dtype=float)
+
+
+class TestThrows:
+    """Test the vectorized throw distribution."""
+
+    def test_probabilities_match_stick_model(self):
+        probs = throw_probabilities()
+        assert probs.sum() == pytest.approx(1.0)
+        p = YutThrow.FLAT_PROBABILITY
+        assert probs[list(THROW_VALUES).index(5)] == pytest.approx((1 - p) ** 4)
+        assert probs[list(THROW_VALUES).index(-1)] == pytest.approx(p * (1 - p) ** 3)
+
+
+class TestVecSim:
+    """Test lockstep random games."""
+
+    @pytest.mark.parametrize("num_players", [2, 3, 4])
+    def test_games_finish_with_full_rankings(self, num_players):
+        sim = VecSim(500, num_players, seed=0).run()
+        assert sim.done.all()
+        assert (np.sort(sim.rankings, axis=1) == np.arange(num_players)).all()
+        assert sim.rank_rates(0).sum() == pytest.approx(1.0)
+
+    def test_seeded_runs_are_reproducible(self):
+        first = VecSim(200, 2, seed=3).run()
+        second = VecSim(200, 2, seed=3).run()
+        assert (first.rankings == second.rankings).all()
+        assert (first.turns == second.turns).all()
+
+    @pytest.mark.parametrize("num_players, count", [(2, 300), (3, 200), (4, 150)])
+    def test_matches_random_controller_games(self, num_players, count):
+        ref_rankings, ref_turns = _random_games(num_players, count)
+        sim = VecSim(4000, num_players, seed=11).run()
+        vec_turns = sim.turns.astype(float)
+
+        # Each player's share of every finishing place (so later places, the
+        # "next available rank" of a search, too) agrees within 4 SE
+        se = math.sqrt(0.25 / count + 0.25 / sim.num_games)
+        for rank in range(num_players):
+            ref_rates = np.bincount(ref_rankings[:, rank], minlength=num_players) / count
+            assert np.abs(sim.rank_rates(rank) - ref_rates).max() < 4 * se, rank
+
+        # Mean game length too
+        turns_se = math.sqrt(
+            ref_turns.var() / len(ref_turns) + vec_turns.var() / len(vec_turns)
+        )
+        assert abs(vec_turns.mean() - ref_turns.mean()) < 4 * turns_se
+
+    def test_from_packed_continues_the_turn(self):
+        state = PackedState(2)
+        for slot in range(3):
+            state.positions[slot] = FINISHED
+        state.finished[0] = 3
+        state.waiting[0] = 0
+        state.positions[3] = 0  # last piece back at 00, any throw exits
+        state.accumulated_moves = [2]
+
+        sim = VecSim.from_packed(state, 100, seed=0).run()
+        assert (sim.rankings[:, 0] == 0).all()
+        assert sim.rank_rates(0)[0] == 1.0
+
+    def test_from_states_keeps_batch_order(self):
+        fresh = PackedState(2)
+        fresh.accumulated_moves = [1]
+        won = PackedState(2)
+        for slot in range(4):
+            won.positions[slot] = FINISHED
+        won.finished[0] = 4
+        won.waiting[0] = 0
+        won.rankings = [0, 1]
+        won.game_state = "finished"
+
+        sim = VecSim.from_states([fresh, won], repeats=5, seed=0)
+        assert sim.num_games == 10
+        assert not sim.done[:5].any()
+        assert sim.done[5:].all()
+
+
+class TestVecRolloutEvaluator:
+    """Test the NumPy leaf evaluator for batched MCTS."""
+
+    def test_scores_each_leaf(self):
+        certain = PackedState(2)
+        for slot in range(3):
+            certain.positions[slot] = FINISHED
+        certain.finished[0] = 3
+        certain.waiting[0] = 0
+        certain.positions[3] = 0
+        certain.accumulated_moves = [2]
+        hopeless = PackedState(2)
+        for slot in range(4, 8):
+            hopeless.positions[slot] = FINISHED
+        hopeless.finished[1] = 4
+        hopeless.waiting[1] = 0
+        hopeless.rankings = [1, 0]
+        hopeless.game_state = "finished"
+
+        scores = VecRolloutEvaluator(rollouts=20, seed=0)([certain, hopeless], 0)
+        assert list(scores) == [1.0, 0.0]
+
+    def test_drives_batched_mcts(self):
+        from yoot import MCTSController
+
+        game = YutGame(["A", "B"], num_players=2)
+        game.players[0].pieces[0].enter_board("03")
+        game.players[1].pieces[0].enter_board("12")
+        game.accumulated_moves = [4, 3]
+        ctrl = MCTSController(
+            game,
+            0,
+            num_iterations=64,
+            batch_size=32,
+            evaluator=VecRolloutEvaluator(rollouts=8, seed=1),
+        )
+        legal = game.get_legal_moves(0)
+        move, stats = ctrl.search(game.get_game_state(), legal)
+        assert move in legal
+        assert stats["root_visits"] == 64
@@ -2,6 +2,8 @@
 Tests for yut stick throwing mechanics.
 """
 
+import random
+
 import pytest
 
 from yoot import YutThrow
@@ -81,3 +83,67 @@ class TestYutThrow:
             assert 0.15 < back_do_ratio < 0.35, (
                 f"Back Do ratio: {back_do_ratio:.2f} (expected ~0.25)"
             )
+
+    def test_distribution_is_exact(self):
+        """Test the outcome table matches the four-stick model."""
+        dist = {name: prob for name, _, prob in YutThrow.distribution()}
+        assert sum(dist.values()) == pytest.approx(1.0)
+        assert dist["mo"] == pytest.approx(0.4**4)
+        assert dist["back_do"] == pytest.approx(0.6 * 0.4**3)
+        assert dist["do"] == pytest.approx(3 * 0.6 * 0.4**3)
+
+    def test_one_draw_per_throw(self):
+        """Test seeded throws repeat and consume a single draw each."""
+        rng_state = random.getstate()
+        try:
+            random.seed(42)
+            first = [YutThrow.throw() for _ in range(50)]
+            after = random.random()
+            random.seed(42)
+            for _ in range(50):
+                random.random()
+            assert random.random() == after
+            random.seed(42)
+            assert [YutThrow.throw() for _ in range(50)] == first
+        finally:
+            random.setstate(rng_state)
+
+    def test_table_follows_flat_probability(self, monkeypatch):
+        """Test house-rule changes to FLAT_PROBABILITY take effect."""
+        monkeypatch.setattr(YutThrow, "FLAT_PROBABILITY", 1.0)
+        assert {YutThrow.throw() for _ in range(20)} == {("yut", 4)}
+        monkeypatch.setattr(YutThrow, "FLAT_PROBABILITY", 0.0)
+        assert {YutThrow.throw() for _ in range(20)} == {("mo", 5)}
+
+
+class TestTurnDistribution:
+    """Test the exact whole-turn outcome distribution."""
+
+    def test_sums_to_one(self):
+        dist = YutThrow.turn_distribution()
+        assert sum(p for _, p in dist) == pytest.approx(1.0)
+        assert all(list(moves) == sorted(moves) for moves, _ in dist)
+
+    def test_chain_probabilities(self):
+        p = {name: prob for name, _, prob in YutThrow.distribution()}
+        dist = dict(YutThrow.turn_distribution())
+        assert dist[(2,)] == pytest.approx(p["gae"])
+        assert dist[(2, 4)] == pytest.approx(p["yut"] * p["gae"])
+        # yut-mo-gae and mo-yut-gae are the same multiset
+        assert dist[(2, 4, 5)] == pytest.approx(2 * p["yut"] * p["mo"] * p["gae"])
+        assert (4,) not in dist  # a turn never ends on yut below the cut
+
+    def test_truncation_keeps_mass(self):
+        p = {name: prob for name, _, prob in YutThrow.distribution()}
+        dist = dict(YutThrow.turn_distribution(max_throws=1))
+        assert len(dist) == 6
+        assert dist[(4,)] == pytest.approx(p["yut"])
+        assert sum(dist.values()) == pytest.approx(1.0)
+        with pytest.raises(ValueError):
+            YutThrow.turn_distribution(max_throws=0)
+
+    def test_cached_per_flat_probability(self, monkeypatch):
+        assert YutThrow.turn_distribution() is YutThrow.turn_distribution()
+        monkeypatch.setattr(YutThrow, "FLAT_PROBABILITY", 0.5)
+        dist = dict(YutThrow.turn_distribution())
+        assert dist[(1,)] == pytest.approx(3 / 16)
@@ -0,0 +1,125 @@
+"""
+Tests for Zobrist hashing of game states.
+"""
+
+import random
+
+import pytest
+
+from yoot import PackedState, YutGame
+from yoot.zobrist import MoveList, hash_game, hash_moves
+
+
+class TestIncrementalHash:
+    """The O(1) incremental hash must always equal the from-scratch hash."""
+
+    @pytest.mark.parametrize("num_players", [2, 4, 6])
+    def test_matches_full_hash_through_play(self, num_players):
+        rng = random.Random(num_players)
+        game = YutGame(None, num_players)
+        for _ in range(300):
+            if game.game_state != "playing":
+                break
+            pid = game.current_player_idx
+            game.throw_phase()
+            assert game.state_hash() == hash_game(game)
+            while game.accumulated_moves:
+                legal = game.get_legal_moves_idx(pid)
+                if not legal:
+                    break
+                _, captured = game.move_piece_idx(pid, *rng.choice(legal))
+                if captured:
+                    game.throw_phase(is_bonus=True)
+                assert game.state_hash() == hash_game(game)
+                if game.check_win_condition():
+                    break
+            game.next_turn()
+            assert game.state_hash() == hash_game(game)
+
+    def test_undo_restores_hash(self):
+        game = YutGame(["A", "B"], num_players=2)
+        game.players[0].pieces[0].enter_board("01")
+        game.players[1].pieces[0].enter_board("03")
+        game.accumulated_moves = [2, 4]
+        before = game.state_hash()
+
+        undo = game.apply_move(0, 0, 2, bonus=[5, 1])
+        assert game.state_hash() != before
+        game.undo_move(undo)
+        assert game.state_hash() == before
+
+    def test_direct_piece_changes_tracked(self):
+        game = YutGame(["A", "B"], num_players=2)
+        piece = game.players[1].pieces[2]
+        piece.position = "cc"
+        piece.is_active = True
+        piece.has_moved = True
+        game.accumulated_moves.append(3)
+        assert game.state_hash() == hash_game(game)
+
+    def test_packed_state_hash_agrees(self):
+        game = YutGame(["A", "B", "C"], num_players=3)
+        game.players[0].pieces[1].enter_board("aa")
+        game.players[2].pieces[0].enter_board("01")
+        game.players[2].pieces[0].finish()
+        game.accumulated_moves = [4, 4, 2]
+        game.current_player_idx = 2
+        assert PackedState.from_game(game).state_hash() == game.state_hash()
+
+
+class TestTranspositions:
+    """Equivalent states reached by different paths hash the same."""
+
+    def test_move_order_transposes(self):
+        a = YutGame(["A", "B"], num_players=2)
+        a.players[0].pieces[0].enter_board("01")
+        a.accumulated_moves = [2, 3]
+        b = a.clone()
+
+        a.move_piece(0, 0, 2)
+        a.move_piece(0, 0, 3)
+        b.move_piece(0, 0, 3)
+        b.move_piece(0, 0, 2)
+
+        assert a.state_hash() == b.state_hash()
+
+    def test_piece_identity_ignored(self):
+        a = YutGame(["A", "B"], num_players=2)
+        b = YutGame(["A", "B"], num_players=2)
+        a.players[0].pieces[0].enter_board("03")
+        b.players[0].pieces[3].enter_board("03")
+        assert a.state_hash() == b.state_hash()
+
+    def test_side_to_move_and_owner_distinguished(self):
+        a = YutGame(["A", "B"], num_players=2)
+        b = a.clone()
+        b.next_turn()
+        assert a.state_hash() != b.state_hash()
+
+        c = YutGame(["A", "B"], num_players=2)
+        d = YutGame(["A", "B"], num_players=2)
+        c.players[0].pieces[0].enter_board("03")
+        d.players[1].pieces[0].enter_board("03")
+        assert c.state_hash() != d.state_hash()
+
+
+class TestMoveList:
+    """Test the hash-tracking accumulated moves list."""
+
+    def test_list_operations_keep_hash(self):
+        moves = MoveList([4, 2])
+        moves.append(4)
+        moves.extend([5, -1])
+        moves.insert(0, 3)
+        moves.remove(4)
+        moves.pop()
+        del moves[1:2]
+        moves[0] = 1
+        moves += [2]
+        assert moves.zobrist == hash_moves(moves)
+        moves.clear()
+        assert moves.zobrist == 0
+
+    def test_order_independent(self):
+        assert MoveList([2, 3, 2]).zobrist == MoveList([3, 2, 2]).zobrist
+        assert MoveList([2, 3]).zobrist != MoveList([2, 3, 3]).zobrist
@@ -13,6 +13,8 @@ from .controller import (
 )
 from .game import YutGame
 from .mcts_controller import MCTSController
+from .multi_turn_mcts import MultiTurnMCTSController
+from .packed import PackedState
 from .piece import Piece
 from .player import Player
 from .yut_throw import YutThrow
@@ -28,4 +30,6 @@ __all__ = [
     "RandomController",
     "MonteCarloController",
     "MCTSController",
+    "MultiTurnMCTSController",
+    "PackedState",
 ]
@@ -23,11 +23,18 @@ Diagonal paths (both go through cc, crossing at center):
   From 05: aa -> bb -> cc -> uu -> vv -> exits at 15 (continues outer)
   From 10: xx -> yy -> cc -> pp -> qq -> exits at 00 (goal)
   From cc: always pp -> qq -> 00 (toward goal)
+
+Compiled integer topology (hot path):
+  Positions are also numbered 0..28 -- outer cells keep their number
+  (00 -> 0 ... 19 -> 19), diagonals follow as aa=20 bb=21 cc=22 pp=23
+  qq=24 xx=25 yy=26 uu=27 vv=28. MOVE_INDEX and BACK_DO_INDEX mirror
+  MOVE_TABLE/BACK_DO over those integers so simulations never hash strings;
+  to_index()/to_name() translate at the API edge.
 """
 
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 class Board:
@@ -42,7 +49,8 @@ class Board:
     - Landing on 10 -> next move enters left diagonal (xx->yy->cc->pp->qq->00)
     - Starting from cc -> always goes toward 00 (pp->qq->00)
 
-    Movement is fully stateless -- just a dictionary lookup.
+    Movement is fully stateless -- just a dictionary lookup (or, on the
+    integer form, a flat tuple index).
     """
 
     NUM_POSITIONS = 29
@@ -173,6 +181,28 @@ class Board:
         """Return all possible back-do destinations (may be >1 at merge points)."""
         return self.BACK_DO.get(current_pos, [])
 
+    @staticmethod
+    def to_index(position: Optional[str]) -> int:
+        """Translate a position name to its integer index (None -> OFF_BOARD)."""
+        if position is None:
+            return OFF_BOARD
+        return POSITION_INDEX[position]
+
+    @staticmethod
+    def to_name(index: int) -> Optional[str]:
+        """Translate an integer position index back to its name (OFF_BOARD -> None)."""
+        if index < 0:
+            return None
+        return POSITION_NAMES[index]
+
+    @staticmethod
+    def next_index(current: int, steps: int) -> int:
+        """Integer form of get_next_position(); returns OFF_BOARD if invalid."""
+        if steps == -1:
+            dests = BACK_DO_INDEX[current]
+            return dests[0] if dests else OFF_BOARD
+        return MOVE_INDEX[current * MOVE_STRIDE + steps]
+
     def triggers_shortcut(self, position: str) -> bool:
         """Check if landing on this position triggers a diagonal shortcut."""
         return position in ("05", "10")
@@ -240,3 +270,46 @@ class Board:
     def is_finish_position(position: str, has_moved: bool) -> bool:
         """Check if piece finishes at this position."""
         return position == "00" and has_moved
+
+
+# ---------------------------------------------------------------------------
+# Compiled integer topology
+# ---------------------------------------------------------------------------
+
+OFF_BOARD = -1
+"""Integer position of a piece that is not on the board (entering or finished)."""
+
+GOAL_INDEX = 0
+"""Integer index of 00 (start and goal)."""
+
+POSITION_NAMES: Tuple[str, ...] = tuple(Board.OUTER_POSITIONS) + (
+    "aa",
+    "bb",
+    "cc",
+    "pp",
+    "qq",
+    "xx",
+    "yy",
+    "uu",
+    "vv",
+)
+POSITION_INDEX = {name: idx for idx, name in enumerate(POSITION_NAMES)}
+
+SHORTCUT_INDICES = frozenset(POSITION_INDEX[p] for p in ("05", "10"))
+
+# MOVE_INDEX[pos * MOVE_STRIDE + steps] = destination index, OFF_BOARD if the
+# move overshoots. steps 0 maps to the position itself, like get_next_position.
+MOVE_STRIDE = 6
+MOVE_INDEX: Tuple[int, ...] = tuple(
+    idx
+    if steps == 0
+    else POSITION_INDEX.get(Board.MOVE_TABLE[name].get(steps, ""), OFF_BOARD)
+    for idx, name in enumerate(POSITION_NAMES)
+    for steps in range(MOVE_STRIDE)
+)
+
+# BACK_DO_INDEX[pos] = tuple of back-do destination indices (same order as BACK_DO)
+BACK_DO_INDEX: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(POSITION_INDEX[d] for d in Board.BACK_DO.get(name, []))
+    for name in POSITION_NAMES
+)
@@ -2,13 +2,41 @@
 Player controllers for Yut Nori — ABC plus human and AI implementations.
 """
 
-import copy
 import random
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from . import counters
+from .board import POSITION_INDEX
+from .counters import COUNTERS
+from .packed import PackedState
+from .telemetry import NULL_SINK, candidate_records
+from .yut_throw import YutThrow
 
 
 class PlayerController(ABC):
-    """Abstract base for all player controllers (human, random, RL, MCTS, …)."""
+    """
+    Abstract base for all player controllers (human, random, RL, MCTS, …).
+
+    AI controllers take rng, a random.Random-compatible generator used for
+    every random choice they make, including the throws of their rollouts.
+    Left as None they use the global random module for both. Rollouts never
+    draw from the live game's throw_source (see YutGame.clone()).
+
+    AI controllers also take telemetry, a yoot.telemetry sink that gets one
+    record per decision (default NULL_SINK: nothing is recorded).
+    """
+
+    rng = random
+    telemetry = NULL_SINK
+    _throw = None  # rollout throw_source bound to rng (None = the global module)
+
+    def _use_rng(self, rng):
+        """Make rng (None = the global random module) drive this controller."""
+        self.rng = random if rng is None else rng
+        self._throw = None if rng is None else partial(YutThrow.throw, rng)
 
     @abstractmethod
     def choose_move(
@@ -29,10 +57,13 @@ class PlayerController(ABC):
 class RandomController(PlayerController):
     """Baseline AI — picks moves uniformly at random."""
 
+    def __init__(self, rng=None):
+        self._use_rng(rng)
+
     def choose_move(
         self, game_state: dict, legal_moves: list
     ) -> tuple[int, int, str | None]:
-        piece_id, steps, dest = random.choice(legal_moves)
+        piece_id, steps, dest = self.rng.choice(legal_moves)
         return piece_id, steps, dest
 
 
@@ -154,65 +185,205 @@ class HumanController(PlayerController):
 
 
 class MonteCarloController(PlayerController):
-    """Monte Carlo Tree Search AI — evaluates moves via random rollout simulations."""
+    """
+    Monte Carlo Tree Search AI — evaluates moves via random rollout simulations.
+
+    With time_budget_ms set, each candidate gets an equal slice of the budget
+    and num_simulations becomes a per-candidate cap (None = no cap). Stats of
+    the last search are kept in last_stats (see search()).
+
+    With workers=N, each candidate's rollouts are split into N batches run on
+    a ProcessPoolExecutor that is created on first use and kept until
+    close(). Batches get a PackedState snapshot and their own seed drawn from
+    rng, so a seeded run is reproducible (though not identical to serial
+    mode).
+    """
 
     MAX_ROLLOUT_TURNS = 200
 
-    def __init__(self, game, player_id, num_simulations=100):
+    def __init__(
+        self,
+        game,
+        player_id,
+        num_simulations=100,
+        time_budget_ms=None,
+        workers=None,
+        rng=None,
+        telemetry=None,
+    ):
+        if num_simulations is None and time_budget_ms is None:
+            raise ValueError("Need num_simulations, time_budget_ms, or both")
+        self._use_rng(rng)
+        if telemetry is not None:
+            self.telemetry = telemetry
         self.game = game
         self.player_id = player_id
         self.num_simulations = num_simulations
+        self.time_budget_ms = time_budget_ms
+        self.workers = workers
+        self.last_stats = None
+        self._pool = None
+
+    def close(self):
+        """Shut down the worker pool (if one was started)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
     def choose_move(
         self, game_state: dict, legal_moves: list
     ) -> tuple[int, int, str | None]:
+        return self.search(game_state, legal_moves)[0]
+
+    def search(
+        self, game_state: dict, legal_moves: list
+    ) -> tuple[tuple[int, int, str | None], dict]:
+        """
+        Pick a move and report how the search went.
+
+        Returns:
+            (move, stats) where stats has iterations (total rollouts),
+            elapsed_ms, time_budget_ms and moves: [(move, rollouts, win_rate)]
+            best first
+        """
+        start = time.perf_counter()
         # Deduplicate: stacked pieces at the same position produce identical outcomes,
         # so group by (position_or_entry, steps, dest) and keep one representative.
         seen = {}  # key -> (piece_id, steps, dest)
+        pieces = self.game.players[self.player_id].pieces
         for pid, steps, dest in legal_moves:
             if pid == -1:
                 key = ("entry", steps, dest)
             else:
-                pos = self.game.players[self.player_id].get_piece_by_id(pid).position
-                key = (pos, steps, dest)
+                key = (pieces[pid].pos, steps, dest)
             if key not in seen:
                 seen[key] = (pid, steps, dest)
-        candidates = list(seen.values())
-
-        if len(candidates) == 1:
-            return candidates[0]
+        moves = list(seen.values())
+
+        if len(moves) == 1:
+            results = [(moves[0], 0, 0.0)]
+        elif self.workers:
+            results = self._evaluate_parallel(moves)
+        else:
+            results = self._evaluate_serial(moves, start)
+
+        results.sort(key=lambda r: r[2], reverse=True)
+        stats = self._stats(start, results)
+        if self.telemetry.enabled:
+            self.telemetry.emit(
+                {
+                    "controller": "MC",
+                    "player_id": self.player_id,
+                    "move": results[0][0],
+                    "iterations": stats["iterations"],
+                    "elapsed_ms": stats["elapsed_ms"],
+                    "time_budget_ms": self.time_budget_ms,
+                    "root_visits": stats["iterations"],
+                    "reused_visits": 0,
+                    "tree_size": None,
+                    "candidates": candidate_records(results),
+                }
+            )
+        return results[0][0], stats
 
+    def _evaluate_serial(self, candidates, start):
+        """[(move, rollouts, win_rate)] for each candidate, in this process."""
+        cap = self.num_simulations
+        budget = self.time_budget_ms
         results = []
-        for piece_id, steps, dest in candidates:
-            wins = sum(
-                self._simulate(piece_id, steps, dest)
-                for _ in range(self.num_simulations)
+        for i, (piece_id, steps, dest) in enumerate(candidates):
+            dest_idx = POSITION_INDEX[dest]
+            deadline = None
+            if budget is not None:
+                deadline = start + budget / 1000.0 * (i + 1) / len(candidates)
+            wins = 0.0
+            sims = 0
+            while cap is None or sims < cap:
+                # Always run at least one rollout so every move gets a score
+                if deadline is not None and sims and time.perf_counter() >= deadline:
+                    break
+                wins += self._simulate(piece_id, steps, dest_idx)
+                sims += 1
+            results.append(((piece_id, steps, dest), sims, wins / sims))
+        return results
+
+    def _evaluate_parallel(self, candidates):
+        """Same as _evaluate_serial, with rollouts fanned out to the worker pool."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        snapshot = PackedState.from_game(self.game)
+        workers = self.workers
+        cap = self.num_simulations
+        budget = self.time_budget_ms
+        # time.monotonic() is system-wide, so deadlines carry across processes
+        start = time.monotonic()
+
+        futures = []
+        for i, (piece_id, steps, dest) in enumerate(candidates):
+            deadline = None
+            if budget is not None:
+                deadline = start + budget / 1000.0 * (i + 1) / len(candidates)
+            batches = [None] * workers
+            if cap is not None:
+                batches = [cap // workers + (b < cap % workers) for b in range(workers)]
+            futures.append(
+                [
+                    self._pool.submit(
+                        _rollout_batch,
+                        snapshot,
+                        self.player_id,
+                        (piece_id, steps, POSITION_INDEX[dest]),
+                        batch,
+                        deadline,
+                        self.rng.getrandbits(64),
+                    )
+                    for batch in batches
+                    if batch != 0
+                ]
             )
-            win_rate = wins / self.num_simulations
-            results.append(((piece_id, steps, dest), win_rate))
-
-        results.sort(key=lambda r: r[1], reverse=True)
 
-        print(
-            f"  [MC] Evaluating {len(results)} moves ({self.num_simulations} sims each):"
-        )
-        for (pid, st, dst), wr in results:
-            marker = " <<" if (pid, st, dst) == results[0][0] else ""
-            print(f"    piece={pid} steps={st} dest={dst}: {wr:.1%}{marker}")
+        results = []
+        for move, move_futures in zip(candidates, futures):
+            wins = 0.0
+            sims = 0
+            for future in move_futures:
+                batch_wins, batch_sims, batch_counts = future.result()
+                wins += batch_wins
+                sims += batch_sims
+                COUNTERS.add(batch_counts)
+            results.append((move, sims, wins / sims))
+        return results
+
+    def _stats(self, start, results):
+        self.last_stats = {
+            "iterations": sum(sims for _, sims, _ in results),
+            "elapsed_ms": (time.perf_counter() - start) * 1000.0,
+            "time_budget_ms": self.time_budget_ms,
+            "moves": results,
+        }
+        return self.last_stats
+
+    def _simulate(self, piece_id: int, steps: int, destination: int = -1) -> float:
+        """
+        Run one random rollout. Win = finishing at the next available rank.
 
-        return results[0][0]
+        destination is a board index (see Board.to_index); the whole rollout
+        runs on a PackedState.
+        """
+        return self._rollout(PackedState.from_game(self.game), piece_id, steps, destination)
 
-    def _simulate(
-        self, piece_id: int, steps: int, destination: str | None = None
-    ) -> float:
-        """Run one random rollout. Win = finishing at the next available rank."""
-        sim = self._clone_game()
+    def _rollout(self, sim, piece_id: int, steps: int, destination: int) -> float:
+        """Rollout body of _simulate(); plays on (and consumes) sim."""
+        COUNTERS.rollouts += 1
         player_id = self.player_id
         # "Winning" means being the next player to finish (best achievable rank)
         target_rank_idx = len(sim.rankings)
+        if self._throw is not None:
+            sim.throw_source = self._throw
 
         # Apply the candidate move
-        success, captured = sim.move_piece(player_id, piece_id, steps, destination)
+        success, captured = sim.move_piece_idx(player_id, piece_id, steps, destination)
         if not success:
             return 0.0
 
@@ -239,6 +410,7 @@ class MonteCarloController(PlayerController):
             if sim.game_state != "playing":
                 break
 
+            COUNTERS.rollout_turns += 1
             current_pid = sim.current_player_idx
             sim.throw_phase()
 
@@ -255,25 +427,16 @@ class MonteCarloController(PlayerController):
 
         return self._heuristic_score(sim)
 
-    def _clone_game(self):
-        """Deepcopy the game, sharing the Board to avoid file I/O."""
-        board = self.game.board
-        self.game.board = None
-        sim = copy.deepcopy(self.game)
-        self.game.board = board
-        sim.board = board
-        return sim
-
     def _play_remaining_moves(self, sim, player_id):
         """Consume all accumulated_moves with random legal choices."""
         while sim.accumulated_moves:
-            legal = sim.get_legal_moves(player_id)
+            legal = sim.get_legal_moves_idx(player_id)
             if not legal:
                 sim.accumulated_moves = []
                 break
 
-            pid, steps, dest = random.choice(legal)
-            success, captured = sim.move_piece(player_id, pid, steps, dest)
+            pid, steps, dest = self.rng.choice(legal)
+            success, captured = sim.move_piece_idx(player_id, pid, steps, dest)
 
             if not success:
                 # Shouldn't happen, but avoid infinite loop
@@ -287,17 +450,39 @@ class MonteCarloController(PlayerController):
                 break
 
     def _heuristic_score(self, sim) -> float:
-        """Score an unfinished game: ratio of finished pieces with a bonus for leading."""
-        my_finished = len(sim.players[self.player_id].get_finished_pieces())
+        """Score an unfinished PackedState: ratio of finished pieces with a bonus for leading."""
+        finished = sim.finished
+        my_finished = finished[self.player_id]
         score = my_finished / 4.0
 
         best_opponent = max(
-            len(p.get_finished_pieces())
-            for p in sim.players
-            if p.player_id != self.player_id
+            finished[pid] for pid in range(sim.num_players) if pid != self.player_id
         )
 
         if my_finished > best_opponent:
             score += 0.1
 
         return score
+
+
+def _rollout_batch(snapshot, player_id, move, count, deadline, seed):
+    """
+    Worker entry point: run up to `count` rollouts of move from snapshot.
+
+    count None means "until deadline" (a time.monotonic() value). At least one
+    rollout always runs. Returns (wins, rollouts, counts), counts being the
+    batch's yoot.counters delta for the parent to add to its own.
+    """
+    before = counters.snapshot()
+    ctrl = MonteCarloController(
+        None, player_id, num_simulations=count or 1, rng=random.Random(seed)
+    )
+    piece_id, steps, dest = move
+    wins = 0.0
+    sims = 0
+    while count is None or sims < count:
+        if deadline is not None and sims and time.monotonic() >= deadline:
+            break
+        wins += ctrl._rollout(snapshot.clone(), piece_id, steps, dest)
+        sims += 1
+    return wins, sims, counters.delta(before)
@@ -0,0 +1,148 @@
+"""
+Process-wide throughput counters.
+
+The engine and the controllers bump plain integer attributes of COUNTERS:
+
+    games           games played through yoot.match.play_game()
+    moves           successful piece moves (YutGame and PackedState)
+    throws          individual throws made by throw_phase()
+    clones          YutGame.clone(), PackedState.from_game() and .clone()
+    rollouts        random playouts run by the AI controllers
+    rollout_turns   full turns played inside those playouts
+
+Counting is one attribute increment per event, always on. The counters
+are not locked: threaded searches may lose the odd increment, which does not
+matter for rates. Every process has its own COUNTERS; the tournament runner
+and the controllers' worker processes report deltas that the parent adds to
+its own.
+
+Take snapshot()s and subtract them with delta() to measure a stretch of
+work, or run a Reporter thread that prints rates every few seconds:
+
+    before = counters.snapshot()
+    ...
+    print(counters.format_rates(counters.delta(before)))
+"""
+
+import sys
+import threading
+import time
+
+FIELDS = ("games", "moves", "throws", "clones", "rollouts", "rollout_turns")
+
+
+class Counters:
+    """Integer event counters (see the module docstring for their meaning)."""
+
+    __slots__ = FIELDS
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for field in FIELDS:
+            setattr(self, field, 0)
+
+    def snapshot(self) -> dict:
+        """Current counts plus "time" (time.perf_counter())."""
+        counts = {field: getattr(self, field) for field in FIELDS}
+        counts["time"] = time.perf_counter()
+        return counts
+
+    def add(self, counts: dict):
+        """Add the counts of a delta (e.g. one reported by another process)."""
+        for field in FIELDS:
+            setattr(self, field, getattr(self, field) + counts.get(field, 0))
+
+
+COUNTERS = Counters()
+
+
+def snapshot() -> dict:
+    return COUNTERS.snapshot()
+
+
+def delta(before: dict, after: dict | None = None) -> dict:
+    """
+    Counts between two snapshots (after defaults to now).
+
+    Returns:
+        dict of FIELDS plus "seconds", the time between the snapshots
+    """
+    if after is None:
+        after = COUNTERS.snapshot()
+    counts = {field: after[field] - before[field] for field in FIELDS}
+    counts["seconds"] = after["time"] - before["time"]
+    return counts
+
+
+def rates(counts: dict) -> dict:
+    """Per-second rates of a delta(), keyed by field."""
+    seconds = counts["seconds"]
+    if seconds <= 0:
+        return dict.fromkeys(FIELDS, 0.0)
+    return {field: counts[field] / seconds for field in FIELDS}
+
+
+def format_rates(counts: dict) -> str:
+    """One-line summary of a delta(): rates and mean rollout length."""
+    per_second = rates(counts)
+    rollouts = counts["rollouts"]
+    mean_turns = counts["rollout_turns"] / rollouts if rollouts else 0.0
+    return (
+        f"{per_second['games']:.2f} games/s, {per_second['rollouts']:.0f} rollouts/s "
+        f"({mean_turns:.1f} turns), {per_second['moves']:.0f} moves/s, "
+        f"{per_second['throws']:.0f} throws/s, {per_second['clones']:.0f} clones/s "
+        f"over {counts['seconds']:.1f}s"
+    )
+
+
+class Reporter:
+    """
+    Background thread that reports counter rates every interval seconds.
+
+    Each report covers the stretch since the previous one. report(counts)
+    defaults to printing format_rates() to stderr. Use as a context manager
+    or call start() and stop(); stop() sends a final report.
+    """
+
+    def __init__(self, interval: float = 10.0, report=None):
+        self.interval = interval
+        self.report = report or _print_rates
+        self._stop = threading.Event()
+        self._thread = None
+        self._last = None
+
+    def start(self):
+        self._last = COUNTERS.snapshot()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self._tick()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._tick()
+
+    def _tick(self):
+        now = COUNTERS.snapshot()
+        counts = delta(self._last, now)
+        self._last = now
+        self.report(counts)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def _print_rates(counts):
+    print(f"  [counters] {format_rates(counts)}", file=sys.stderr, flush=True)
@@ -2,20 +2,90 @@
 Main game engine for Yut Nori.
 """
 
-from typing import Dict, List, Optional, Tuple
-
-from .board import Board
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .board import (
+    BACK_DO_INDEX,
+    GOAL_INDEX,
+    MOVE_INDEX,
+    MOVE_STRIDE,
+    OFF_BOARD,
+    POSITION_INDEX,
+    POSITION_NAMES,
+    SHORTCUT_INDICES,
+    Board,
+)
+from .counters import COUNTERS
 from .piece import Piece
 from .player import Player
 from .yut_throw import YutThrow
+from .zobrist import NUM_PIECE_CODES, PIECE_KEYS, SIDE_KEYS, MoveList, piece_code
+
+_FINISHED_CODE = piece_code(OFF_BOARD, False, True)
+
+
+class MoveUndo:
+    """
+    Compact record of everything an apply_*() call changed.
+
+    Holds the prior state of each touched piece (movers and captured pieces),
+    where the consumed step sat in accumulated_moves, the throw values
+    appended (capture bonus or apply_throw), the replaced moves list and
+    player to move (skip / turn change), and the ranking/winner/state/history
+    lengths. YutGame.undo_move() consumes it.
+    """
+
+    __slots__ = (
+        "pieces",
+        "steps",
+        "step_index",
+        "bonus",
+        "captured",
+        "cleared_moves",
+        "current_player_idx",
+        "rankings_len",
+        "winner",
+        "game_state",
+        "history_len",
+    )
+
+    def __init__(self, game: "YutGame"):
+        self.pieces: List[Tuple[Piece, int, bool, bool]] = []
+        self.steps = 0
+        self.step_index = -1
+        self.bonus: List[int] = []
+        self.captured = False
+        self.cleared_moves: Optional[List[int]] = None
+        self.current_player_idx: Optional[int] = None
+        self.rankings_len = len(game.rankings)
+        self.winner = game.winner
+        self.game_state = game.game_state
+        self.history_len = len(game.move_history)
+
+    def save_piece(self, piece: Piece):
+        """Remember a piece's state before it is changed."""
+        self.pieces.append((piece, piece.pos, piece.is_active, piece.has_moved))
 
 
 class YutGame:
     """
     Main game engine managing game state and rules.
+
+    throw_source is the zero-argument callable throw_phase() draws throws
+    from, returning (throw_name, move_value) like YutThrow.throw; see
+    yoot.throw_stream for a bulk NumPy source. Without one, throws come from
+    `rng` (a random.Random-compatible generator), or the global random
+    module if no rng is given either.
     """
 
-    def __init__(self, player_names: Optional[List[str]] = None, num_players: int = 4):
+    def __init__(
+        self,
+        player_names: Optional[List[str]] = None,
+        num_players: int = 4,
+        throw_source: Optional[Callable[[], Tuple[str, int]]] = None,
+        rng=None,
+    ):
         if num_players < 2 or num_players > 6:
             raise ValueError("Number of players must be between 2 and 6")
 
@@ -32,8 +102,147 @@ class YutGame:
         self.game_state = "playing"
         self.winner: Optional[int] = None  # first player to finish (back-compat)
         self.rankings: List[int] = []  # player_ids in finish order
-        self.accumulated_moves: List[int] = []
+        self.accumulated_moves = []
         self.move_history: List[str] = []
+        self.rng = rng
+        if throw_source is None:
+            throw_source = YutThrow.throw if rng is None else partial(YutThrow.throw, rng)
+        self.throw_source = throw_source
+        self._track_pieces()
+
+    def clone(self, throw_source=None) -> "YutGame":
+        """
+        Fast copy for simulations -- replaces copy.deepcopy(game).
+
+        Copies only mutable state (piece positions and flags, accumulated moves,
+        rankings, current player, winner). The Board and player names are
+        shared by reference. Move history is not copied; the clone starts
+        with an empty log.
+
+        The clone throws from throw_source, or from the global random module
+        if none is given. It never shares this game's source or rng, so
+        simulating on a clone cannot change the throws this game sees.
+        """
+        sim = YutGame.__new__(YutGame)
+        sim.board = self.board
+        sim.num_players = self.num_players
+        sim.players = players = []
+        sim.current_player_idx = self.current_player_idx
+        sim.game_state = self.game_state
+        sim.winner = self.winner
+        sim.rankings = self.rankings.copy()
+        sim._accumulated_moves = self._accumulated_moves.clone()
+        sim.move_history = []
+        sim.rng = None
+        sim.throw_source = YutThrow.throw if throw_source is None else throw_source
+        # Copy the hash and code counts instead of rehashing; the pieces are
+        # copied inline so the occupancy index and listener are set in the
+        # same pass (this is the hot path of every search)
+        sim._piece_hash = self._piece_hash
+        sim._code_counts = self._code_counts.copy()
+        sim._occupancy = occupancy = {}
+        listener = sim._on_piece_changed
+        new_player = Player.__new__
+        new_piece = Piece.__new__
+        for player in self.players:
+            copy = new_player(Player)
+            copy.player_id = player.player_id
+            copy.name = player.name
+            copy.pieces = pieces = []
+            for piece in player.pieces:
+                clone = new_piece(Piece)
+                clone.piece_id = piece.piece_id
+                clone.player_id = piece.player_id
+                clone._pos = pos = piece._pos
+                clone._active = active = piece._active
+                clone._moved = piece._moved
+                clone._listener = listener
+                if active and pos >= 0:
+                    stack = occupancy.get(pos)
+                    if stack is None:
+                        occupancy[pos] = [clone]
+                    else:
+                        stack.append(clone)
+                pieces.append(clone)
+            players.append(copy)
+        COUNTERS.clones += 1
+        return sim
+
+    @property
+    def accumulated_moves(self) -> MoveList:
+        """Throw values still to be spent this turn (a hash-tracking list)."""
+        return self._accumulated_moves
+
+    @accumulated_moves.setter
+    def accumulated_moves(self, moves: List[int]):
+        self._accumulated_moves = moves if type(moves) is MoveList else MoveList(moves)
+
+    def state_hash(self) -> int:
+        """
+        64-bit Zobrist hash of piece states, accumulated moves (as a
+        multiset) and the player to move. O(1): the parts are maintained
+        incrementally (see yoot.zobrist).
+        """
+        return (
+            self._piece_hash
+            ^ self._accumulated_moves.zobrist
+            ^ SIDE_KEYS[self.current_player_idx]
+        )
+
+    def _track_pieces(self):
+        """Hook every piece's state changes; build the occupancy index and hash."""
+        # _occupancy[pos] = active pieces at board index pos (no entry if
+        # never occupied). Under the rules they all belong to one player (a
+        # stack); captures keep it that way. Flat dicts keep clone() cheap.
+        self._occupancy: Dict[int, List[Piece]] = {}
+        # _code_counts[player_id * NUM_PIECE_CODES + code] = that player's
+        # pieces in state `code`
+        self._code_counts: Dict[int, int] = {}
+        self._piece_hash = 0
+        for player in self.players:
+            for piece in player.pieces:
+                piece._listener = self._on_piece_changed
+                if piece.is_active and piece.pos >= 0:
+                    self._occupancy.setdefault(piece.pos, []).append(piece)
+                self._hash_in(piece)
+
+    def _hash_in(self, piece: Piece):
+        code = piece_code(piece._pos, piece._active, piece._moved)
+        key = piece.player_id * NUM_PIECE_CODES + code
+        count = self._code_counts.get(key, 0) + 1
+        self._code_counts[key] = count
+        self._piece_hash ^= PIECE_KEYS[piece.player_id][code][count - 1]
+
+    def _on_piece_changed(
+        self, piece: Piece, old_pos: int, old_active: bool, old_moved: bool
+    ):
+        """Piece listener: keep the occupancy index and hash in step with the piece."""
+        pos = piece._pos
+        active = piece._active
+        occupancy = self._occupancy
+        if old_active and old_pos >= 0:
+            occupancy[old_pos].remove(piece)
+        if active and pos >= 0:
+            stack = occupancy.get(pos)
+            if stack is None:
+                occupancy[pos] = [piece]
+            else:
+                stack.append(piece)
+
+        # Hash the piece out of its old state and into the new one (piece_code
+        # inlined: this runs for every piece state change)
+        player_id = piece.player_id
+        counts = self._code_counts
+        keys = PIECE_KEYS[player_id]
+        base = player_id * NUM_PIECE_CODES
+        code = ((old_pos + 1) << 2) | (old_active << 1) | old_moved
+        count = counts[base + code]
+        counts[base + code] = count - 1
+        h = self._piece_hash ^ keys[code][count - 1]
+        code = ((pos + 1) << 2) | (active << 1) | piece._moved
+        count = counts.get(base + code, 0) + 1
+        counts[base + code] = count
+        self._piece_hash = h ^ keys[code][count - 1]
 
     def get_current_player(self) -> Player:
         """Get the current player whose turn it is."""
@@ -50,7 +259,7 @@ class YutGame:
             self.accumulated_moves = []
 
         while True:
-            throw_name, move_value = YutThrow.throw()
+            throw_name, move_value = self.throw_source()
             throws.append((throw_name, move_value))
             self.accumulated_moves.append(move_value)
 
@@ -62,6 +271,7 @@ class YutGame:
             if not YutThrow.grants_extra_turn(throw_name):
                 break
 
+        COUNTERS.throws += len(throws)
         return throws
 
     def get_legal_moves(self, player_id: int) -> List[Tuple[int, int, str]]:
@@ -72,25 +282,43 @@ class YutGame:
             List of (piece_id, steps, destination) tuples
             piece_id = -1 means entering a new piece
         """
+        return [
+            (piece_id, steps, POSITION_NAMES[dest])
+            for piece_id, steps, dest in self.get_legal_moves_idx(player_id)
+        ]
+
+    def get_legal_moves_idx(self, player_id: int) -> List[Tuple[int, int, int]]:
+        """
+        Integer form of get_legal_moves() -- destinations are board indices.
+
+        Same moves in the same order; simulations use this to stay off strings.
+        """
         player = self.players[player_id]
+        accumulated = self._accumulated_moves
         legal_moves = []
 
-        for piece in player.get_active_pieces():
-            for steps in self.accumulated_moves:
+        can_enter = False
+        for piece in player.pieces:
+            if not piece._active:
+                if not (piece._moved and piece._pos < 0):  # not finished
+                    can_enter = True
+                continue
+            pos = piece._pos
+            base = pos * MOVE_STRIDE
+            for steps in accumulated:
                 if steps == -1:
-                    for dest in self.board.get_back_do_destinations(piece.position):
+                    for dest in BACK_DO_INDEX[pos]:
                         legal_moves.append((piece.piece_id, steps, dest))
                 else:
-                    dest = self.board.get_next_position(piece.position, steps)
-                    if dest is not None:
+                    dest = MOVE_INDEX[base + steps]
+                    if dest >= 0:
                         legal_moves.append((piece.piece_id, steps, dest))
 
-        # Check if new piece can enter
-        if player.can_enter_new_piece() and self.accumulated_moves:
-            for steps in self.accumulated_moves:
+        # Check if new piece can enter (entry index == steps for 1..5)
+        if can_enter:
+            for steps in accumulated:
                 if 1 <= steps <= 5:
-                    entry_pos = f"{steps:02d}"
-                    legal_moves.append((-1, steps, entry_pos))
+                    legal_moves.append((-1, steps, steps))
 
         return legal_moves
 
@@ -103,134 +331,282 @@ class YutGame:
         Returns:
             Tuple of (success, captured)
         """
+        if destination is None:
+            dest = OFF_BOARD
+        elif destination in POSITION_INDEX:
+            dest = POSITION_INDEX[destination]
+        elif steps == -1:
+            return False, False  # unknown back-do branch
+        else:
+            dest = OFF_BOARD  # forward moves ignore the destination
+        return self.move_piece_idx(player_id, piece_id, steps, dest)
+
+    def move_piece_idx(
+        self,
+        player_id: int,
+        piece_id: int,
+        steps: int,
+        destination: int = OFF_BOARD,
+        undo: Optional[MoveUndo] = None,
+    ) -> tuple[bool, bool]:
+        """
+        Integer form of move_piece() -- destination is a board index.
+
+        Only back-do reads the destination (to pick a branch at merge points);
+        OFF_BOARD means "use the default". If `undo` is given, the prior state
+        of every touched piece and the consumed step are recorded in it, and
+        nothing is logged: the move belongs to a search, whose undo_move()
+        would drop the entries again.
+        """
         player = self.players[player_id]
 
         # Handle entering new piece
         if piece_id == -1:
             if not player.can_enter_new_piece():
                 return False, False
-            if steps not in self.accumulated_moves:
+            if steps not in self._accumulated_moves:
                 return False, False
             if not (1 <= steps <= 5):
                 return False, False
 
-            entry_position = f"{steps:02d}"
+            entry_position = steps  # entry index == throw value
             new_piece = player.get_inactive_pieces()[0]
-            new_piece.enter_board(entry_position)
-            self.accumulated_moves.remove(steps)
+            if undo is not None:
+                undo.save_piece(new_piece)
+            new_piece.set_state(entry_position, True, True)
+            self._consume_step(steps, undo)
 
-            shortcut = self.board.triggers_shortcut(entry_position)
-            if shortcut:
+            if undo is None:
+                note = " (shortcut position)" if entry_position in SHORTCUT_INDICES else ""
                 self.log_move(
-                    f"{player.name} entered new piece (Piece {new_piece.piece_id}) at position {entry_position} (shortcut position)"
-                )
-            else:
-                self.log_move(
-                    f"{player.name} entered new piece (Piece {new_piece.piece_id}) at position {entry_position}"
+                    f"{player.name} entered new piece (Piece {new_piece.piece_id}) at position {POSITION_NAMES[entry_position]}{note}"
                 )
 
-            captured = self.check_capture(player_id, new_piece.position)
+            captured = self._capture_at(player_id, entry_position, undo)
             return True, captured
 
         # Handle moving existing piece
-        piece = player.get_piece_by_id(piece_id)
+        piece = player.pieces[piece_id]
 
         if not piece.is_active:
             return False, False
 
-        if steps not in self.accumulated_moves:
+        if steps not in self._accumulated_moves:
             return False, False
 
-        current_pos = piece.position
+        current_pos = piece.pos
 
         # Special case: at 00 with has_moved → piece exits the board (but not on back-do)
-        if current_pos == "00" and piece.has_moved and steps != -1:
-            stack = self._get_stack_at_position(player_id, current_pos)
-            piece_str = (
-                f"Piece {piece_id}" if len(stack) == 1 else f"Stack (x{len(stack)})"
-            )
+        if current_pos == GOAL_INDEX and piece.has_moved and steps != -1:
+            stack = self._stack_at(player_id, current_pos)
 
             for stacked_piece in stack:
-                stacked_piece.finish()
-
-            self.accumulated_moves.remove(steps)
-            self.log_move(f"{player.name}'s {piece_str} exited the board!")
+                if undo is not None:
+                    undo.save_piece(stacked_piece)
+                stacked_piece.set_state(OFF_BOARD, False, stacked_piece.has_moved)
+
+            self._consume_step(steps, undo)
+            if undo is None:
+                piece_str = (
+                    f"Piece {piece_id}" if len(stack) == 1 else f"Stack (x{len(stack)})"
+                )
+                self.log_move(f"{player.name}'s {piece_str} exited the board!")
             return True, False
 
         # For back-do with explicit destination, use it directly
-        if steps == -1 and destination is not None:
-            valid = self.board.get_back_do_destinations(current_pos)
-            if destination not in valid:
-                return False, False
-            new_pos = destination
+        if steps == -1:
+            valid = BACK_DO_INDEX[current_pos]
+            if destination >= 0:
+                if destination not in valid:
+                    return False, False
+                new_pos = destination
+            else:
+                new_pos = valid[0] if valid else OFF_BOARD
+        elif 0 <= steps < MOVE_STRIDE:
+            new_pos = MOVE_INDEX[current_pos * MOVE_STRIDE + steps]
         else:
-            new_pos = self.board.get_next_position(current_pos, steps)
+            new_pos = OFF_BOARD
 
-        if new_pos is None:
+        if new_pos < 0:
             return False, False
 
         # Get all pieces in stack at current position
-        stack = self._get_stack_at_position(player_id, current_pos)
+        stack = self._stack_at(player_id, current_pos)
 
         # Move all pieces in stack
         for stacked_piece in stack:
-            stacked_piece.move_to(new_pos)
+            if undo is not None:
+                undo.save_piece(stacked_piece)
+            stacked_piece.set_state(new_pos, True, True)
+
+        self._consume_step(steps, undo)
+        if undo is None:
+            self._log_piece_move(player, piece_id, len(stack), steps, new_pos)
+
+        captured = self._capture_at(player_id, new_pos, undo)
 
-        self.accumulated_moves.remove(steps)
+        return True, captured
 
-        piece_str = f"Piece {piece_id}" if len(stack) == 1 else f"Stack (x{len(stack)})"
+    def _log_piece_move(self, player, piece_id, stack_size, steps, new_pos):
+        """History entry for a piece (or stack) moved to new_pos."""
+        piece_str = f"Piece {piece_id}" if stack_size == 1 else f"Stack (x{stack_size})"
+        new_name = POSITION_NAMES[new_pos]
 
-        if new_pos == "00":
+        if new_pos == GOAL_INDEX:
             self.log_move(
                 f"{player.name} moved {piece_str} {steps} spaces to position 00 (at goal - next move exits)"
             )
-        elif self.board.triggers_shortcut(new_pos):
+        elif new_pos in SHORTCUT_INDICES:
             self.log_move(
-                f"{player.name} moved {piece_str} {steps} spaces to {new_pos} (shortcut position - next move uses diagonal)"
+                f"{player.name} moved {piece_str} {steps} spaces to {new_name} (shortcut position - next move uses diagonal)"
             )
         else:
             self.log_move(
-                f"{player.name} moved {piece_str} {steps} spaces to {new_pos}"
+                f"{player.name} moved {piece_str} {steps} spaces to {new_name}"
             )
 
-        captured = self.check_capture(player_id, new_pos)
+    def _consume_step(self, steps: int, undo: Optional[MoveUndo]):
+        """Remove one used throw value from accumulated_moves."""
+        COUNTERS.moves += 1
+        moves = self._accumulated_moves
+        if undo is None:
+            moves.remove(steps)
+            return
+        index = moves.index(steps)
+        del moves[index]
+        undo.steps = steps
+        undo.step_index = index
+
+    def apply_move(
+        self,
+        player_id: int,
+        piece_id: int,
+        steps: int,
+        destination: int = OFF_BOARD,
+        bonus: Optional[List[int]] = None,
+    ) -> Optional[MoveUndo]:
+        """
+        Reversible move: move_piece_idx + bonus throw on capture + win check.
 
-        return True, captured
+        Args:
+            bonus: throw values to grant on capture instead of throwing, so a
+                   search can replay a previously sampled bonus outcome
 
-    def _get_stack_at_position(self, player_id: int, position: str) -> List[Piece]:
-        """Get all pieces of a player at a specific position."""
-        player = self.players[player_id]
-        return [p for p in player.get_active_pieces() if p.position == position]
+        Returns:
+            MoveUndo to pass to undo_move(), or None if the move was illegal
+            (the game is left unchanged)
+        """
+        undo = MoveUndo(self)
+        success, captured = self.move_piece_idx(
+            player_id, piece_id, steps, destination, undo
+        )
+        if not success:
+            return None
+
+        if captured:
+            undo.captured = True
+            before = len(self.accumulated_moves)
+            if bonus is None:
+                self.throw_phase(is_bonus=True)
+            else:
+                self.accumulated_moves.extend(bonus)
+            undo.bonus = self.accumulated_moves[before:]
 
-    def check_capture(self, player_id: int, position: str) -> bool:
-        """Check if a piece at position captures opponent pieces."""
+        self.check_win_condition()
+        return undo
 
-        captured_any = False
+    def apply_skip(self) -> MoveUndo:
+        """Reversible form of giving up the remaining accumulated moves."""
+        undo = MoveUndo(self)
+        undo.cleared_moves = self.accumulated_moves
+        self.accumulated_moves = []
+        return undo
+
+    def apply_throw(self, move_value: int) -> MoveUndo:
+        """Reversible single throw with a given outcome (a search chance event)."""
+        undo = MoveUndo(self)
+        self.accumulated_moves.append(move_value)
+        undo.bonus = [move_value]
+        return undo
+
+    def apply_next_turn(self) -> MoveUndo:
+        """Reversible form of next_turn()."""
+        undo = MoveUndo(self)
+        undo.cleared_moves = self.accumulated_moves
+        undo.current_player_idx = self.current_player_idx
+        self.next_turn()
+        return undo
+
+    def undo_move(self, undo: MoveUndo):
+        """
+        Restore the exact state before the apply_*() call that produced
+        `undo`. Undos must be applied in reverse (LIFO) order.
+        """
+        del self.move_history[undo.history_len :]
+        del self.rankings[undo.rankings_len :]
+        self.winner = undo.winner
+        self.game_state = undo.game_state
+
+        if undo.current_player_idx is not None:
+            self.current_player_idx = undo.current_player_idx
+        if undo.cleared_moves is not None:
+            self.accumulated_moves = undo.cleared_moves
+        else:
+            moves = self.accumulated_moves
+            if undo.bonus:
+                del moves[len(moves) - len(undo.bonus) :]
+            if undo.step_index >= 0:
+                moves.insert(undo.step_index, undo.steps)
 
-        for other_player in self.players:
-            if other_player.player_id == player_id:
-                continue
+        for piece, pos, is_active, has_moved in reversed(undo.pieces):
+            piece.set_state(pos, is_active, has_moved)
 
-            captured_pieces = [
-                p for p in other_player.get_active_pieces() if p.position == position
-            ]
+    def _get_stack_at_position(self, player_id: int, position: str) -> List[Piece]:
+        """Get all pieces of a player at a specific position."""
+        return self._stack_at(player_id, POSITION_INDEX[position])
 
-            if captured_pieces:
-                captured_any = True
-                for piece in captured_pieces:
-                    piece.capture()
-                    self.log_move(
-                        f"{self.players[player_id].name} captured "
-                        f"{other_player.name}'s Piece {piece.piece_id}!"
-                    )
+    def _stack_at(self, player_id: int, pos: int) -> List[Piece]:
+        """Integer form of _get_stack_at_position() -- an occupancy index lookup."""
+        stack = [p for p in self._occupancy.get(pos, ()) if p.player_id == player_id]
+        if len(stack) > 1:
+            stack.sort(key=lambda p: p.piece_id)
+        return stack
+
+    def check_capture(self, player_id: int, position: str) -> bool:
+        """Check if a piece at position captures opponent pieces."""
+        return self._capture_at(player_id, POSITION_INDEX[position])
+
+    def _capture_at(
+        self, player_id: int, pos: int, undo: Optional[MoveUndo] = None
+    ) -> bool:
+        """Integer form of check_capture() -- an occupancy index lookup."""
+        captured_pieces = [
+            p for p in self._occupancy.get(pos, ()) if p.player_id != player_id
+        ]
+        if not captured_pieces:
+            return False
+
+        captured_pieces.sort(key=lambda p: (p.player_id, p.piece_id))
+        for piece in captured_pieces:
+            if undo is not None:
+                undo.save_piece(piece)
+            piece.capture()
+            if undo is None:
+                self.log_move(
+                    f"{self.players[player_id].name} captured "
+                    f"{self.players[piece.player_id].name}'s Piece {piece.piece_id}!"
+                )
 
-        return captured_any
+        return True
 
     def check_win_condition(self) -> bool:
         """Check if any player has newly finished. Game ends when only one remains."""
         changed = False
+        # A player has finished when all their pieces share the finished code
+        counts = self._code_counts
         for player in self.players:
-            if player.has_finished() and player.player_id not in self.rankings:
+            finished = counts.get(player.player_id * NUM_PIECE_CODES + _FINISHED_CODE)
+            if finished == len(player.pieces) and player.player_id not in self.rankings:
                 self.rankings.append(player.player_id)
                 place = len(self.rankings)
                 self.log_move(f"{player.name} finishes in place #{place}!")
@@ -3,291 +3,911 @@ MCTS (Monte Carlo Tree Search) controller for Yut Nori.
 
 Builds a search tree within the current player's turn, exploring
 different move sequences (including skip) via UCB1 selection.
+
+Nodes do not own a game copy: each iteration walks one mutable game down
+the tree with YutGame.apply_move() and rewinds it with undo_move().
+
+With use_transpositions=True the tree becomes a DAG: nodes are stored in a
+table keyed by YutGame.state_hash(), so spending throws in a different order
+(2 then 3 vs 3 then 2) lands on the same node and shares its statistics.
+Moves only consume throws and captures cannot be reversed within a turn, so
+the graph stays acyclic.
+
+With profile=True the serial search also times its phases; see SearchProfile.
 """
 
+import contextlib
 import copy
 import math
+import multiprocessing
 import random
+import threading
+import time
 
+from . import counters
+from .board import POSITION_INDEX, POSITION_NAMES
 from .controller import PlayerController
+from .counters import COUNTERS
+from .packed import PackedState
+from .seeding import split_rng
+from .telemetry import candidate_records
+
+# Stand-in node lock when only one thread touches the tree (batched mode)
+_NO_LOCK = contextlib.nullcontext()
+
+# Only allow skip when a piece is on a late-game position
+SKIP_POSITIONS = frozenset(
+    POSITION_INDEX[p]
+    for p in ("xx", "yy", "cc", "pp", "qq", "15", "16", "17", "18", "19")
+)
+
+
+def candidate_actions(game, player_id):
+    """
+    Distinct tree actions for player_id in the game's current state.
+
+    Actions are (source, steps, dest): the moving piece's board index, or
+    -1 to enter a new piece (see MCTSNode). Stacked pieces at the same
+    position produce identical outcomes, so this also deduplicates them.
+    Skip (None) is offered only when a piece is on a late-game position.
+    """
+    if not game.accumulated_moves:
+        return []
+
+    legal = game.get_legal_moves_idx(player_id)
+    if not legal:
+        return []
+
+    pieces = game.players[player_id].pieces
+    actions: list[tuple[int, int, int] | None] = []
+    seen = set()
+    for pid, steps, dest in legal:
+        action = (-1 if pid == -1 else pieces[pid].pos, steps, dest)
+        if action not in seen:
+            seen.add(action)
+            actions.append(action)
+
+    if any(p.is_active and p.pos in SKIP_POSITIONS for p in pieces):
+        actions.append(None)
+
+    return actions
+
+
+def resolve_action(game, player_id, action):
+    """(piece_id, steps, dest) of a tree action in the game's current state."""
+    source, steps, dest = action
+    if source < 0:
+        return -1, steps, dest
+    for piece in game.players[player_id].pieces:
+        if piece.is_active and piece.pos == source:
+            return piece.piece_id, steps, dest
+    return None
+
+
+class SearchProfile:
+    """
+    Where the time of MCTS searches went.
+
+    seconds and calls are keyed by phase: "select", "expand", "clone" (the
+    root game copy and each rollout's PackedState snapshot), "simulate"
+    (the playout itself) and "backpropagate". elapsed is the wall time of
+    the searches, so elapsed minus the phases is the loop's own overhead
+    (mostly rewinding the walk with undo_move()).
+
+    Rollouts count playout turns after the leaf's own turn; a rollout that
+    ends within that turn counts zero. cap_hits are rollouts cut off at
+    MAX_ROLLOUT_TURNS and heuristic_fallbacks those scored by
+    _heuristic_score() instead of a finish (cap hits plus games that ended
+    without settling the searcher's rank).
+    """
+
+    PHASES = ("select", "expand", "clone", "simulate", "backpropagate")
+
+    def __init__(self):
+        self.decisions = 0
+        self.iterations = 0
+        self.elapsed = 0.0
+        self.seconds = dict.fromkeys(self.PHASES, 0.0)
+        self.calls = dict.fromkeys(self.PHASES, 0)
+        self.rollouts = 0
+        self.rollout_turns = 0
+        self.max_rollout_turns = 0
+        self.cap_hits = 0
+        self.heuristic_fallbacks = 0
+
+    def add(self, phase, seconds):
+        """Count one call of phase that took seconds."""
+        self.seconds[phase] += seconds
+        self.calls[phase] += 1
+
+    def add_rollout(self, turns, capped, fallback):
+        self.rollouts += 1
+        self.rollout_turns += turns
+        if turns > self.max_rollout_turns:
+            self.max_rollout_turns = turns
+        self.cap_hits += capped
+        self.heuristic_fallbacks += fallback
+
+    def merge(self, other):
+        """Add other's counts to this profile (e.g. the decisions of a game)."""
+        self.decisions += other.decisions
+        self.iterations += other.iterations
+        self.elapsed += other.elapsed
+        for phase in self.PHASES:
+            self.seconds[phase] += other.seconds[phase]
+            self.calls[phase] += other.calls[phase]
+        self.rollouts += other.rollouts
+        self.rollout_turns += other.rollout_turns
+        self.max_rollout_turns = max(self.max_rollout_turns, other.max_rollout_turns)
+        self.cap_hits += other.cap_hits
+        self.heuristic_fallbacks += other.heuristic_fallbacks
+        return self
+
+    @property
+    def mean_rollout_turns(self):
+        return self.rollout_turns / self.rollouts if self.rollouts else 0.0
+
+    def as_dict(self):
+        """Plain-data form (for telemetry records and JSON)."""
+        return {
+            "decisions": self.decisions,
+            "iterations": self.iterations,
+            "elapsed_ms": self.elapsed * 1000.0,
+            "phase_ms": {p: s * 1000.0 for p, s in self.seconds.items()},
+            "phase_calls": dict(self.calls),
+            "rollouts": self.rollouts,
+            "mean_rollout_turns": self.mean_rollout_turns,
+            "max_rollout_turns": self.max_rollout_turns,
+            "cap_hits": self.cap_hits,
+            "heuristic_fallbacks": self.heuristic_fallbacks,
+        }
+
+    def format(self):
+        """Human-readable phase table."""
+        total = self.elapsed or 1.0
+        lines = [
+            f"{self.decisions} decisions, {self.iterations} iterations, "
+            f"{self.elapsed * 1000.0:.0f}ms"
+        ]
+        for phase in self.PHASES:
+            seconds = self.seconds[phase]
+            lines.append(
+                f"  {phase:>13s}: {seconds * 1000.0:9.1f}ms {seconds / total:6.1%} "
+                f"({self.calls[phase]} calls)"
+            )
+        other = self.elapsed - sum(self.seconds.values())
+        lines.append(f"  {'other':>13s}: {other * 1000.0:9.1f}ms {other / total:6.1%}")
+        lines.append(
+            f"  rollouts: {self.rollouts}, {self.mean_rollout_turns:.1f} turns mean, "
+            f"{self.max_rollout_turns} max, {self.cap_hits} hit the turn cap, "
+            f"{self.heuristic_fallbacks} heuristic fallbacks"
+        )
+        return "\n".join(lines)
 
 
 class MCTSNode:
-    """A node in the MCTS tree. Each node = a game state with remaining accumulated_moves."""
+    """
+    A node in the MCTS tree. Each node = a game state with remaining accumulated_moves.
+
+    The state itself is not stored; it is reached by replaying the edges on
+    the path from the root. Actions are (source, steps, dest_index) on the
+    integer board form, or None (skip). source is the moving piece's board
+    index, or -1 to enter a new piece: states that hash alike may hold the
+    same pieces under other piece ids, so actions name pieces by position
+    and resolve_action() finds the piece again when an edge is replayed.
+    `edges[i]` is the (action, bonus) leading to `children[i]`, where bonus
+    holds the bonus throw values sampled when the action captured, so
+    replays are exact. `action` is the action that first created the node
+    (in a DAG other parents may reach it by other actions). `lock` guards
+    the node in tree-parallel search (None otherwise).
+    """
 
     __slots__ = (
-        "game",
         "player_id",
         "parent",
         "children",
+        "edges",
         "untried_actions",
         "action",
         "visits",
         "wins",
+        "lock",
     )
 
-    def __init__(self, game, player_id, parent=None, action=None):
-        self.game = game
+    def __init__(self, player_id, parent=None, action=None):
         self.player_id = player_id
         self.parent = parent
         self.children = []
-        self.action = action  # (piece_id, steps, dest) or None (skip)
+        self.edges = []
+        self.action = action  # (source, steps, dest) or None (skip)
         self.visits = 0
         self.wins = 0.0
         self.untried_actions = None  # lazily computed
+        self.lock = None
 
-    def get_untried_actions(self):
-        if self.untried_actions is not None:
-            return self.untried_actions
-
-        if not self.game.accumulated_moves:
-            self.untried_actions = []
-            return self.untried_actions
-
-        legal = self.game.get_legal_moves(self.player_id)
-        if not legal:
-            self.untried_actions = []
-            return self.untried_actions
-
-        # Deduplicate: stacked pieces at same position produce identical outcomes
-        seen = {}
-        for pid, steps, dest in legal:
-            if pid == -1:
-                key = ("entry", steps, dest)
-            else:
-                pos = self.game.players[self.player_id].get_piece_by_id(pid).position
-                key = (pos, steps, dest)
-            if key not in seen:
-                seen[key] = (pid, steps, dest)
-
-        actions: list[tuple[int, int, str | None] | None] = list(seen.values())
-
-        # Only allow skip when a piece is on a late-game position
-        skip_positions = {"xx", "yy", "cc", "pp", "qq", "15", "16", "17", "18", "19"}
-        player = self.game.players[self.player_id]
-        if any(p.position in skip_positions for p in player.get_active_pieces()):
-            actions.append(None)
-
-        self.untried_actions = actions
+    def get_untried_actions(self, game):
+        """Untried actions; `game` must be positioned at this node."""
+        if self.untried_actions is None:
+            self.untried_actions = candidate_actions(game, self.player_id)
         return self.untried_actions
 
-    def is_terminal(self):
-        """Terminal if no moves left or game finished."""
+    def is_terminal(self, game):
+        """Terminal if no moves left or game finished; `game` is at this node."""
         return (
-            not self.game.accumulated_moves
-            or self.game.game_state != "playing"
-            or self.game.check_win_condition()
+            not game.accumulated_moves
+            or game.game_state != "playing"
+            or game.check_win_condition()
         )
 
-    def ucb1(self, c=1.414):
+    def ucb1(self, c=1.414, parent_visits=None):
         if self.visits == 0:
             return float("inf")
+        if parent_visits is None:
+            parent_visits = self.parent.visits
         return (self.wins / self.visits) + c * math.sqrt(
-            math.log(self.parent.visits) / self.visits
+            math.log(parent_visits) / self.visits
+        )
+
+    def best_index(self):
+        """Index of the child with the highest UCB1 score."""
+        visits = self.visits
+        children = self.children
+        return max(
+            range(len(children)), key=lambda i: children[i].ucb1(parent_visits=visits)
         )
 
     def best_child(self):
-        return max(self.children, key=lambda ch: ch.ucb1())
+        return self.children[self.best_index()]
+
+    def most_visited_index(self):
+        children = self.children
+        return max(range(len(children)), key=lambda i: children[i].visits)
 
     def most_visited_child(self):
-        return max(self.children, key=lambda ch: ch.visits)
+        return self.children[self.most_visited_index()]
 
 
 class MCTSController(PlayerController):
-    """MCTS AI — builds a search tree within the current turn."""
+    """
+    MCTS AI — builds a search tree within the current turn.
+
+    With time_budget_ms set, the search is anytime: it stops when the budget
+    runs out and plays the most visited move so far, with num_iterations as
+    an optional hard cap (None = no cap). Stats of the last search are kept
+    in last_stats (see search()).
+
+    With workers=K the search is root-parallel: K worker processes, started
+    on first use and kept until close(), each grow an independent tree from
+    a PackedState snapshot with their own seed and share of the iterations.
+    Root-child visits and wins are summed across trees before picking the
+    most visited move. Each worker keeps its own subtree for reuse.
+
+    With threads=T the search is tree-parallel: T threads share one tree,
+    each walking its own game clone. Selection adds a virtual loss (a visit
+    with no win) to every node on the path so concurrent threads spread
+    out; backpropagation then only adds the score. Node updates happen under
+    per-node locks, so the mode is correct under the GIL and scales on
+    free-threaded builds.
+
+    With batch_size=B the search selects B leaves (spread out by the same
+    virtual loss), evaluates them in one call and then backpropagates all
+    the scores. `evaluator(states, player_id)` gets the leaves as
+    PackedStates and returns, for each, the estimated chance that player_id
+    takes the next open rank (len(state.rankings)); it defaults to one
+    random playout per leaf. See yoot.vecsim.VecRolloutEvaluator for a
+    NumPy backend.
+
+    With rng set, every random choice of the search (rollout moves and
+    throws, worker seeds) comes from it; threads get child generators split
+    from it, root-parallel workers a seed drawn from it.
+
+    With profile=True (serial search only) each decision leaves a
+    SearchProfile in last_profile, and game_profile sums them over the
+    controller's lifetime (one game, as controllers are built per game).
+    Telemetry records then carry it as "profile".
+    """
 
     MAX_ROLLOUT_TURNS = 200
-
-    def __init__(self, game, player_id, num_iterations=1000):
+    TELEMETRY_NAME = "MCTS"
+
+    def __init__(
+        self,
+        game,
+        player_id,
+        num_iterations=1000,
+        use_transpositions=False,
+        time_budget_ms=None,
+        workers=None,
+        threads=None,
+        batch_size=None,
+        evaluator=None,
+        rng=None,
+        telemetry=None,
+        profile=False,
+    ):
+        if num_iterations is None and time_budget_ms is None:
+            raise ValueError("Need num_iterations, time_budget_ms, or both")
+        if threads and (workers or use_transpositions):
+            raise ValueError("threads cannot be combined with workers or transpositions")
+        if batch_size and (threads or use_transpositions):
+            raise ValueError("batch_size cannot be combined with threads or transpositions")
+        if profile and (workers or threads or batch_size):
+            raise ValueError("profile only applies to the serial search")
         self.game = game
         self.player_id = player_id
         self.num_iterations = num_iterations
+        self.time_budget_ms = time_budget_ms
+        self.use_transpositions = use_transpositions
+        self.workers = workers
+        self.threads = threads
+        self.batch_size = batch_size
+        self.evaluator = evaluator
+        self._use_rng(rng)
+        if telemetry is not None:
+            self.telemetry = telemetry
+        self.last_stats = None
+        self.profile = profile
+        self.last_profile = None
+        self.game_profile = SearchProfile() if profile else None
+        self._profiling = None  # SearchProfile of the search in progress
+        self.transpositions = 0  # nodes merged by the table in the last search
+        self._table = None  # state_hash -> MCTSNode (transposition mode)
         self._reuse_root = None
+        self._reuse_game = None  # game positioned at _reuse_root
+        self._trees = None  # [(process, connection)] in root-parallel mode
+
+    def close(self):
+        """Stop the worker processes (if any were started)."""
+        if self._trees is not None:
+            for process, conn in self._trees:
+                conn.send(None)
+                process.join()
+                conn.close()
+            self._trees = None
 
     def choose_move(
         self, game_state: dict, legal_moves: list
     ) -> tuple[int, int, str | None] | None:
+        return self.search(game_state, legal_moves)[0]
+
+    def search(
+        self, game_state: dict, legal_moves: list
+    ) -> tuple[tuple[int, int, str | None] | None, dict]:
+        """
+        Pick a move and report how the search went.
+
+        Returns:
+            (move, stats) where stats has iterations, elapsed_ms,
+            time_budget_ms, root_visits and moves: [(move, visits, win_rate)]
+            most visited first
+        """
+        start = time.perf_counter()
+        if self.profile:
+            self._profiling = SearchProfile()
         # Deduplicate candidates
+        pieces = self.game.players[self.player_id].pieces
         seen = {}
         for pid, steps, dest in legal_moves:
             if pid == -1:
                 key = ("entry", steps, dest)
             else:
-                pos = self.game.players[self.player_id].get_piece_by_id(pid).position
-                key = (pos, steps, dest)
+                key = (pieces[pid].pos, steps, dest)
             if key not in seen:
                 seen[key] = (pid, steps, dest)
         candidates = list(seen.values())
 
         if len(candidates) == 1:
             self._reuse_root = None
-            return candidates[0]
+            self._reuse_game = None
+            self._table = None
+            return self._publish(candidates[0], self._stats(start, 0, 0))
 
+        if self.workers:
+            return self._search_parallel(candidates, start)
+
+        root, game, iterations, prior_visits = self._grow(
+            self.num_iterations, self._deadline()
+        )
+
+        # Pick most-visited root child
+        if not root.children:
+            self._table = None
+            return self._publish(candidates[0], self._stats(start, iterations, 0))
+
+        best_action = self._keep_subtree(root, game, root.most_visited_index())
+
+        ranked = sorted(
+            (
+                (action, ch.visits, ch.wins)
+                for ch, (action, _) in zip(root.children, root.edges)
+            ),
+            key=lambda r: r[1],
+            reverse=True,
+        )
+        stats = self._stats(start, iterations, root.visits, ranked)
+        return self._publish(self._to_move(best_action), stats, prior_visits, root)
+
+    def _grow(self, max_iterations, deadline):
+        """
+        Run iterations on the reused subtree (or a fresh root) for self.game.
+
+        Returns:
+            (root, game, iterations, prior_visits) with game positioned at root
+        """
         # Try to reuse saved subtree from previous move in this turn
         root = None
+        game = None
         prior_visits = 0
         if self._reuse_root is not None:
-            if self._reuse_root.game.accumulated_moves == list(
-                self.game.accumulated_moves
-            ):
+            if self._reuse_game.accumulated_moves == list(self.game.accumulated_moves):
                 root = self._reuse_root
+                game = self._reuse_game
                 prior_visits = root.visits
                 root.parent = None
             self._reuse_root = None
+            self._reuse_game = None
 
         if root is None:
-            root = MCTSNode(self._clone_game(), self.player_id)
-
-        for _ in range(self.num_iterations):
-            node = self._select(root)
-            child = self._expand(node)
-            score = self._simulate(child)
-            self._backpropagate(child, score)
-
-        # Pick most-visited root child
-        if not root.children:
-            self._reuse_root = None
-            return candidates[0]
-
-        best = root.most_visited_child()
+            root = MCTSNode(self.player_id)
+            clone_start = time.perf_counter()
+            game = self.game.clone()
+            if self._profiling is not None:
+                self._profiling.add("clone", time.perf_counter() - clone_start)
+            if self.use_transpositions:
+                self._table = {game.state_hash(): root}
+        if self._throw is not None:
+            game.throw_source = self._throw
+
+        self.transpositions = 0
+        if self.threads and self.threads > 1:
+            iterations = self._grow_shared(root, game, max_iterations, deadline)
+            return root, game, iterations, prior_visits
+        if self.batch_size:
+            iterations = self._grow_batched(root, game, max_iterations, deadline)
+            return root, game, iterations, prior_visits
+        if self._profiling is not None:
+            iterations = self._grow_profiled(root, game, max_iterations, deadline)
+            return root, game, iterations, prior_visits
+
+        path = []  # undo records from root to the current node
+        nodes = []  # nodes visited this iteration (a DAG has no unique parent)
+        iterations = 0
+        while max_iterations is None or iterations < max_iterations:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            nodes.append(root)
+            node = self._select(root, game, path, nodes)
+            self._expand(node, game, path, nodes)
+            score = self._simulate(game)
+            self._backpropagate(nodes, score)
+            while path:
+                game.undo_move(path.pop())
+            nodes.clear()
+            iterations += 1
+        return root, game, iterations, prior_visits
+
+    def _grow_profiled(self, root, game, max_iterations, deadline):
+        """The serial loop of _grow(), timing each phase into self._profiling."""
+        profile = self._profiling
+        clock = time.perf_counter
+        path = []
+        nodes = []
+        iterations = 0
+        while max_iterations is None or iterations < max_iterations:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            nodes.append(root)
+            t0 = clock()
+            node = self._select(root, game, path, nodes)
+            t1 = clock()
+            self._expand(node, game, path, nodes)
+            t2 = clock()
+            sim = PackedState.from_game(game, self._throw)
+            t3 = clock()
+            score = self._playout(sim)
+            t4 = clock()
+            self._backpropagate(nodes, score)
+            t5 = clock()
+            profile.add("select", t1 - t0)
+            profile.add("expand", t2 - t1)
+            profile.add("clone", t3 - t2)
+            profile.add("simulate", t4 - t3)
+            profile.add("backpropagate", t5 - t4)
+            while path:
+                game.undo_move(path.pop())
+            nodes.clear()
+            iterations += 1
+        return iterations
+
+    def _grow_shared(self, root, game, max_iterations, deadline):
+        """Tree-parallel iterations on root; returns the number run by all threads."""
+        if root.lock is None:
+            root.lock = threading.Lock()
+        threads = self.threads
+        counts = [0] * threads
+
+        def run(slot, limit, walker, agent):
+            path = []
+            nodes = []
+            while limit is None or counts[slot] < limit:
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                with root.lock:
+                    root.visits += 1
+                nodes.append(root)
+                node = self._select_shared(root, walker, path, nodes)
+                self._expand_shared(node, walker, path, nodes)
+                score = agent._simulate(walker)
+                for visited in nodes:
+                    with visited.lock:
+                        visited.wins += score
+                while path:
+                    walker.undo_move(path.pop())
+                nodes.clear()
+                counts[slot] += 1
+
+        workers = []
+        for slot, rng in enumerate(split_rng(self.rng, threads)):
+            limit = None
+            if max_iterations is not None:
+                limit = max_iterations // threads + (slot < max_iterations % threads)
+            # Each thread rolls out with its own generator
+            agent = copy.copy(self)
+            agent._use_rng(rng)
+            walker = game.clone(agent._throw)
+            thread = threading.Thread(target=run, args=(slot, limit, walker, agent))
+            thread.start()
+            workers.append(thread)
+        for thread in workers:
+            thread.join()
+        return sum(counts)
+
+    def _grow_batched(self, root, game, max_iterations, deadline):
+        """Batched-evaluation iterations on root; returns the number run."""
+        if root.lock is None:
+            root.lock = _NO_LOCK
+        evaluate = self.evaluator or self._evaluate_leaves
+        path = []
+        iterations = 0
+        while max_iterations is None or iterations < max_iterations:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            size = self.batch_size
+            if max_iterations is not None:
+                size = min(size, max_iterations - iterations)
+
+            leaves = []
+            states = []
+            for _ in range(size):
+                root.visits += 1
+                nodes = [root]
+                node = self._select_shared(root, game, path, nodes)
+                self._expand_shared(node, game, path, nodes)
+                states.append(PackedState.from_game(game, self._throw))
+                leaves.append(nodes)
+                while path:
+                    game.undo_move(path.pop())
+
+            for nodes, score in zip(leaves, evaluate(states, self.player_id)):
+                for node in nodes:
+                    node.wins += score
+            iterations += size
+        return iterations
+
+    def _evaluate_leaves(self, states, player_id):
+        """Default batch evaluator: one random playout per leaf."""
+        return [self._playout(state) for state in states]
+
+    def _select_shared(self, node, game, path, nodes):
+        """_select() with virtual loss, locking each node (threaded and batched modes)."""
+        while True:
+            with node.lock:
+                if node.is_terminal(game):
+                    return node
+                if node.get_untried_actions(game) or not node.children:
+                    return node
+                i = node.best_index()
+                edge = node.edges[i]
+                child = node.children[i]
+                with child.lock:
+                    child.visits += 1
+            path.append(self._apply(game, *edge))
+            node = child
+            nodes.append(node)
+
+    def _expand_shared(self, node, game, path, nodes):
+        """_expand() counterpart of _select_shared() (no transposition table)."""
+        with node.lock:
+            untried = node.get_untried_actions(game)
+            if not untried or node.is_terminal(game):
+                return node
+            action = untried.pop()
+            undo = self._apply(game, action, None)
+            if undo is None:
+                return node
+            path.append(undo)
+            child = MCTSNode(self.player_id, parent=node, action=action)
+            child.lock = threading.Lock() if self.threads else _NO_LOCK
+            child.visits = 1
+            node.children.append(child)
+            node.edges.append((action, undo.bonus))
+        nodes.append(child)
+        return child
 
-        # Save subtree for potential reuse on next call within this turn
-        if best.action is not None:
-            self._reuse_root = best
+    def _keep_subtree(self, root, game, index):
+        """Save root.children[index] for reuse on the next call; returns its action."""
+        action, bonus = root.edges[index]
+        if action is not None:
+            self._apply(game, action, bonus)
+            self._reuse_root = root.children[index]
+            self._reuse_game = game
         else:
-            self._reuse_root = None
+            self._table = None
+        return action
+
+    def _search_parallel(self, candidates, start):
+        """Root-parallel search: grow one tree per worker and merge root children."""
+        if self._trees is None:
+            self._start_trees()
+
+        snapshot = PackedState.from_game(self.game)
+        deadline = self._deadline()
+        cap = self.num_iterations
+        workers = len(self._trees)
+        for i, (_, conn) in enumerate(self._trees):
+            share = None if cap is None else cap // workers + (i < cap % workers)
+            conn.send(("search", snapshot, share, deadline, self.rng.getrandbits(64)))
+
+        merged = {}  # action -> [visits, wins]
+        iterations = prior_visits = root_visits = 0
+        self.transpositions = 0
+        for _, conn in self._trees:
+            done, prior, visits, transpositions, children, counts = conn.recv()
+            COUNTERS.add(counts)
+            iterations += done
+            prior_visits += prior
+            root_visits += visits
+            self.transpositions += transpositions
+            for action, child_visits, child_wins in children:
+                totals = merged.setdefault(action, [0, 0.0])
+                totals[0] += child_visits
+                totals[1] += child_wins
+
+        if not merged:
+            return self._publish(candidates[0], self._stats(start, iterations, 0))
+
+        ranked = sorted(
+            ((action, visits, wins) for action, (visits, wins) in merged.items()),
+            key=lambda r: r[1],
+            reverse=True,
+        )
+        best_action = ranked[0][0]
+        for _, conn in self._trees:
+            conn.send(("advance", best_action))
 
-        # Log tree stats
-        reuse_str = f" (reused {prior_visits} prior visits)" if prior_visits else ""
-        print(
-            f"  [MCTS] {self.num_iterations} iterations{reuse_str}, {len(root.children)} root children:"
+        stats = self._stats(start, iterations, root_visits, ranked)
+        return self._publish(
+            self._to_move(best_action), stats, prior_visits, trees=workers
         )
-        ranked = sorted(root.children, key=lambda c: c.visits, reverse=True)
-        for ch in ranked:
-            wr = ch.wins / ch.visits if ch.visits > 0 else 0
-            action_str = (
-                "skip"
-                if ch.action is None
-                else f"piece={ch.action[0]} steps={ch.action[1]} dest={ch.action[2]}"
+
+    def _start_trees(self):
+        self._trees = []
+        for _ in range(self.workers):
+            conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_tree_worker,
+                args=(child_conn, self.player_id, self.use_transpositions),
+                daemon=True,
             )
-            marker = " <<" if ch is best else ""
-            print(f"    {action_str}: {ch.visits} visits, {wr:.1%} winrate{marker}")
+            process.start()
+            child_conn.close()
+            self._trees.append((process, conn))
+
+    def _publish(self, move, stats, reused_visits=0, root=None, trees=1):
+        """Send the telemetry record of a finished search; returns (move, stats)."""
+        profile = self._profiling
+        if profile is not None:
+            self._profiling = None
+            profile.decisions = 1
+            profile.iterations = stats["iterations"]
+            profile.elapsed = stats["elapsed_ms"] / 1000.0
+            self.last_profile = profile
+            self.game_profile.merge(profile)
+        if self.telemetry.enabled:
+            record = {
+                "controller": self.TELEMETRY_NAME,
+                "player_id": self.player_id,
+                "move": move,
+                "iterations": stats["iterations"],
+                "elapsed_ms": stats["elapsed_ms"],
+                "time_budget_ms": self.time_budget_ms,
+                "root_visits": stats["root_visits"],
+                "reused_visits": reused_visits,
+                "tree_size": None if root is None else self._tree_size(root),
+                "candidates": candidate_records(stats["moves"]),
+            }
+            record.update(self._telemetry_extras(trees))
+            if profile is not None:
+                record["profile"] = profile.as_dict()
+            self.telemetry.emit(record)
+        return move, stats
+
+    def _telemetry_extras(self, trees):
+        """Controller-specific telemetry fields."""
+        extras = {"trees": trees}
+        if self.use_transpositions:
+            extras["transpositions"] = self.transpositions
+        return extras
+
+    @staticmethod
+    def _tree_size(root):
+        """Number of distinct nodes reachable from root (a DAG shares nodes)."""
+        seen = set()
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if id(node) not in seen:
+                seen.add(id(node))
+                stack.extend(node.children)
+        return len(seen)
+
+    def _deadline(self):
+        """time.monotonic() value at which the time budget runs out (None = no budget)."""
+        if self.time_budget_ms is None:
+            return None
+        return time.monotonic() + self.time_budget_ms / 1000.0
+
+    def _stats(self, start, iterations, root_visits, ranked=()):
+        """Build (and remember) the stats dict for a finished search."""
+        self.last_stats = {
+            "iterations": iterations,
+            "elapsed_ms": (time.perf_counter() - start) * 1000.0,
+            "time_budget_ms": self.time_budget_ms,
+            "root_visits": root_visits,
+            "moves": [
+                (self._to_move(action), visits, wins / visits if visits else 0.0)
+                for action, visits, wins in ranked
+            ],
+        }
+        return self.last_stats
+
+    def _to_move(self, action):
+        """Translate a root action back to the public move form (on self.game)."""
+        if action is None:
+            return None
+        piece_id, steps, dest = resolve_action(self.game, self.player_id, action)
+        return piece_id, steps, POSITION_NAMES[dest]
 
-        return best.action
+    def _apply(self, game, action, bonus):
+        """
+        Replay an edge's action (and its recorded bonus throw) on game.
 
-    def _select(self, node):
+        Returns:
+            The MoveUndo, or None if the action is not legal in game
+        """
+        if action is None:
+            return game.apply_skip()
+        move = resolve_action(game, self.player_id, action)
+        if move is None:
+            return None
+        piece_id, steps, dest = move
+        return game.apply_move(self.player_id, piece_id, steps, dest, bonus)
+
+    def _select(self, node, game, path, nodes):
         """Descend tree via UCB1 until we find a node with untried actions or a terminal."""
-        while not node.is_terminal():
-            untried = node.get_untried_actions()
+        while not node.is_terminal(game):
+            untried = node.get_untried_actions(game)
             if untried:
                 return node
             if not node.children:
                 return node
-            node = node.best_child()
+            i = node.best_index()
+            undo = self._apply(game, *node.edges[i])
+            if undo is None:
+                return node  # only a hash collision in the table gets here
+            path.append(undo)
+            node = node.children[i]
+            nodes.append(node)
         return node
 
-    def _expand(self, node):
-        """Add one untried child."""
-        untried = node.get_untried_actions()
-        if not untried or node.is_terminal():
+    def _expand(self, node, game, path, nodes):
+        """Add one untried child, leaving game positioned at it."""
+        untried = node.get_untried_actions(game)
+        if not untried or node.is_terminal(game):
             return node
 
         action = untried.pop()
-        child_game = self._clone_from(node.game)
+        undo = self._apply(game, action, None)
+        if undo is None:
+            # Invalid move — return parent for rollout
+            return node
 
-        if action is None:
-            # Skip: clear accumulated moves
-            child_game.accumulated_moves = []
+        path.append(undo)
+        child = None
+        if self._table is not None:
+            key = game.state_hash()
+            child = self._table.get(key)
+            if child is not None:
+                self.transpositions += 1
+                if child in node.children:
+                    # Another action from this node already leads here
+                    nodes.append(child)
+                    return child
+            else:
+                child = self._table[key] = MCTSNode(
+                    self.player_id, parent=node, action=action
+                )
         else:
-            piece_id, steps, dest = action
-            success, captured = child_game.move_piece(
-                self.player_id, piece_id, steps, dest
-            )
-            if not success:
-                # Invalid move — return parent for rollout
-                return node
-            if captured:
-                child_game.throw_phase(is_bonus=True)
-            child_game.check_win_condition()
-
-        child = MCTSNode(child_game, self.player_id, parent=node, action=action)
+            child = MCTSNode(self.player_id, parent=node, action=action)
         node.children.append(child)
+        node.edges.append((action, undo.bonus))
+        nodes.append(child)
         return child
 
-    def _simulate(self, node):
-        """Random rollout from node to game end."""
-        sim = self._clone_from(node.game)
+    def _simulate(self, game):
+        """Random rollout from the game's current (tree leaf) state to game end."""
+        return self._playout(PackedState.from_game(game, self._throw))
+
+    def _playout(self, sim):
+        """Rollout body of _simulate(); plays on (and consumes) sim."""
+        COUNTERS.rollouts += 1
         player_id = self.player_id
         target_rank_idx = len(sim.rankings)
 
         # Check if already won
         if len(sim.rankings) > target_rank_idx:
             return 1.0 if sim.rankings[target_rank_idx] == player_id else 0.0
-
         # Consume remaining moves randomly (no skip in random rollout)
         self._play_remaining_moves(sim, player_id)
 
-        if len(sim.rankings) > target_rank_idx:
-            return 1.0 if sim.rankings[target_rank_idx] == player_id else 0.0
-
-        if sim.game_state != "playing":
+        if len(sim.rankings) > target_rank_idx or sim.game_state != "playing":
+            if self._profiling is not None:
+                self._profiling.add_rollout(0, False, False)
+            if len(sim.rankings) > target_rank_idx:
+                return 1.0 if sim.rankings[target_rank_idx] == player_id else 0.0
             return 0.0
 
         # Full random playout
         sim.next_turn()
 
-        for _ in range(self.MAX_ROLLOUT_TURNS):
-            if sim.game_state != "playing":
-                break
-
+        turns = 0
+        while turns < self.MAX_ROLLOUT_TURNS and sim.game_state == "playing":
+            turns += 1
             current_pid = sim.current_player_idx
             sim.throw_phase()
             self._play_remaining_moves(sim, current_pid)
 
             if len(sim.rankings) > target_rank_idx:
-                return 1.0 if sim.rankings[target_rank_idx] == player_id else 0.0
+                break
 
             sim.next_turn()
 
-        if len(sim.rankings) > target_rank_idx:
+        COUNTERS.rollout_turns += turns
+        decided = len(sim.rankings) > target_rank_idx
+        if self._profiling is not None:
+            capped = not decided and sim.game_state == "playing"
+            self._profiling.add_rollout(turns, capped, not decided)
+        if decided:
             return 1.0 if sim.rankings[target_rank_idx] == player_id else 0.0
 
         return self._heuristic_score(sim)
 
-    def _backpropagate(self, node, score):
-        while node is not None:
+    def _backpropagate(self, nodes, score):
+        """Credit every node on this iteration's path (root first)."""
+        for node in nodes:
             node.visits += 1
             node.wins += score
-            node = node.parent
-
-    def _clone_game(self):
-        """Deepcopy the live game, sharing the Board to avoid file I/O."""
-        board = self.game.board
-        self.game.board = None
-        sim = copy.deepcopy(self.game)
-        self.game.board = board
-        sim.board = board
-        return sim
-
-    def _clone_from(self, game):
-        """Deepcopy an already-cloned game, sharing the Board."""
-        board = game.board
-        game.board = None
-        sim = copy.deepcopy(game)
-        game.board = board
-        sim.board = board
-        return sim
 
     def _play_remaining_moves(self, sim, player_id):
         """Consume all accumulated_moves with random legal choices (no skip)."""
         while sim.accumulated_moves:
-            legal = sim.get_legal_moves(player_id)
+            legal = sim.get_legal_moves_idx(player_id)
             if not legal:
                 sim.accumulated_moves = []
                 break
 
-            pid, steps, dest = random.choice(legal)
-            success, captured = sim.move_piece(player_id, pid, steps, dest)
+            pid, steps, dest = self.rng.choice(legal)
+            success, captured = sim.move_piece_idx(player_id, pid, steps, dest)
 
             if not success:
                 sim.accumulated_moves = []
@@ -300,17 +920,64 @@ class MCTSController(PlayerController):
                 break
 
     def _heuristic_score(self, sim) -> float:
-        """Score an unfinished game: ratio of finished pieces with a bonus for leading."""
-        my_finished = len(sim.players[self.player_id].get_finished_pieces())
+        """Score an unfinished PackedState: ratio of finished pieces with a bonus for leading."""
+        finished = sim.finished
+        my_finished = finished[self.player_id]
         score = my_finished / 4.0
 
         best_opponent = max(
-            len(p.get_finished_pieces())
-            for p in sim.players
-            if p.player_id != self.player_id
+            finished[pid] for pid in range(sim.num_players) if pid != self.player_id
         )
 
         if my_finished > best_opponent:
             score += 0.1
 
         return score
+
+
+def _tree_worker(conn, player_id, use_transpositions):
+    """
+    Root-parallel worker loop: keeps one tree (and its reusable subtree).
+
+    Messages: ("search", snapshot, max_iterations, deadline, seed) replies
+    (iterations, prior_visits, root_visits, transpositions,
+    [(action, visits, wins)], counts) where counts is the search's
+    yoot.counters delta for the parent to add; ("advance", action) keeps that child for
+    reuse; None stops the worker.
+    """
+    ctrl = MCTSController(None, player_id, use_transpositions=use_transpositions)
+    root = game = None
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        if message[0] == "search":
+            _, snapshot, max_iterations, deadline, seed = message
+            before = counters.snapshot()
+            ctrl._use_rng(random.Random(seed))
+            ctrl.game = snapshot.to_game()
+            root, game, iterations, prior_visits = ctrl._grow(max_iterations, deadline)
+            children = [
+                (action, child.visits, child.wins)
+                for child, (action, _) in zip(root.children, root.edges)
+            ]
+            conn.send(
+                (
+                    iterations,
+                    prior_visits,
+                    root.visits,
+                    ctrl.transpositions,
+                    children,
+                    counters.delta(before),
+                )
+            )
+        else:
+            action = message[1]
+            index = next(
+                (i for i, (edge, _) in enumerate(root.edges) if edge == action), None
+            )
+            if index is None:
+                ctrl._table = None
+            else:
+                ctrl._keep_subtree(root, game, index)
+    conn.close()
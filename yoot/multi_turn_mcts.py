@@ -0,0 +1,317 @@
+"""
+Multi-turn MCTS controller for Yut Nori.
+
+Extends the within-turn MCTS search across turn boundaries. The tree mixes
+two kinds of nodes:
+
+- decision nodes, where the player to move (the searching player or an
+  opponent) picks a move, a skip, or ends the turn when no moves remain
+- chance nodes, where a throw phase is pending (start of a turn, or the
+  bonus throw after a capture); the outcome is the whole yut/mo chain as a
+  sorted tuple of move values, as in YutThrow.turn_distribution()
+
+Outcomes are sampled from game.throw_source, so each outcome child is
+visited in proportion to its probability. A chance node's value is not the
+mean of those samples, though, but the turn_distribution()-weighted mean of
+its children's values: a run of lucky or unlucky throws then only moves the
+estimate of the outcome it landed on. Decision nodes above pass that
+weighted value on rather than the raw rollout scores.
+
+Search stops expanding `search_turns` turns past the current one and falls
+back to a random rollout there. Opponent decision nodes pick the move that
+is worst for the searching player (paranoid search), so the same
+"next available rank" score is backed up everywhere.
+
+Like MCTSController, one mutable game is walked down the tree with the
+apply_*/undo_move API.
+"""
+
+import math
+import time
+
+from .counters import COUNTERS
+from .mcts_controller import MCTSController, candidate_actions, resolve_action
+from .packed import PackedState
+from .yut_throw import YutThrow
+
+CHANCE = 0
+DECISION = 1
+
+END_TURN = "end"  # decision action when the player has nothing left to play
+
+# Chance outcomes cut yut/mo chains after this many throws (see
+# YutThrow.turn_distribution())
+MAX_CHANCE_THROWS = 8
+
+
+class TurnNode:
+    """
+    A node in the multi-turn tree.
+
+    Chance nodes map throw-phase outcomes (sorted tuples of move values)
+    to children. Decision nodes keep
+    `children[i]` reached by `edges[i]` (a tree action, None for skip or
+    END_TURN). `depth` counts turn changes from the root. `terminal_value`
+    is set once the searching player's target rank is decided.
+    """
+
+    __slots__ = (
+        "kind",
+        "player_id",
+        "depth",
+        "children",
+        "edges",
+        "untried_actions",
+        "visits",
+        "wins",
+        "terminal_value",
+    )
+
+    def __init__(self, kind, player_id, depth):
+        self.kind = kind
+        self.player_id = player_id  # player to act (throw or move)
+        self.depth = depth
+        self.children = {} if kind == CHANCE else []
+        self.edges = []
+        self.untried_actions = None  # lazily computed (decision nodes)
+        self.visits = 0
+        self.wins = 0.0
+        self.terminal_value = None
+
+    def best_index(self, root_player_id, c=1.414):
+        """UCB1 over children from the acting player's point of view."""
+        log_visits = math.log(self.visits) if self.visits else 0.0
+        mine = self.player_id == root_player_id
+        best_i, best_score = 0, -1.0
+        for i, child in enumerate(self.children):
+            if child.visits == 0:
+                return i
+            mean = child.wins / child.visits
+            if not mine:
+                mean = 1.0 - mean
+            score = mean + c * (log_visits / child.visits) ** 0.5
+            if score > best_score:
+                best_i, best_score = i, score
+        return best_i
+
+
+class MultiTurnMCTSController(MCTSController):
+    """MCTS AI — searches several turns ahead with chance nodes for throws."""
+
+    TELEMETRY_NAME = "MT-MCTS"
+
+    def __init__(
+        self,
+        game,
+        player_id,
+        num_iterations=1000,
+        search_turns=2,
+        time_budget_ms=None,
+        rng=None,
+        telemetry=None,
+    ):
+        super().__init__(
+            game,
+            player_id,
+            num_iterations,
+            time_budget_ms=time_budget_ms,
+            rng=rng,
+            telemetry=telemetry,
+        )
+        self.search_turns = search_turns
+
+    def search(
+        self, game_state: dict, legal_moves: list
+    ) -> tuple[tuple[int, int, str | None] | None, dict]:
+        start = time.perf_counter()
+        game = self.game.clone(self._throw)
+        actions = candidate_actions(game, self.player_id)
+        moves = [a for a in actions if a is not None]
+        if len(moves) == 1 and len(actions) == 1:
+            return self._publish(self._to_move(moves[0]), self._stats(start, 0, 0))
+        if not moves:
+            move = legal_moves[0] if legal_moves else None
+            return self._publish(move, self._stats(start, 0, 0))
+
+        self._target_rank_idx = len(game.rankings)
+        self._outcome_probabilities = dict(
+            YutThrow.turn_distribution(MAX_CHANCE_THROWS)
+        )
+        root = TurnNode(DECISION, self.player_id, 0)
+        root.untried_actions = actions
+
+        path = []  # undo records
+        nodes = []
+        deadline = self._deadline()
+        iterations = 0
+        while self.num_iterations is None or iterations < self.num_iterations:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            score = self._iterate(root, game, path, nodes)
+            self._backpropagate(nodes, score)
+            while path:
+                game.undo_move(path.pop())
+            nodes.clear()
+            iterations += 1
+        if not root.children:
+            return self._publish(
+                self._to_move(moves[0]), self._stats(start, iterations, 0)
+            )
+
+        best_i = max(range(len(root.children)), key=lambda i: root.children[i].visits)
+        ranked = sorted(
+            (
+                (action, child.visits, child.wins)
+                for child, action in zip(root.children, root.edges)
+            ),
+            key=lambda r: r[1],
+            reverse=True,
+        )
+        stats = self._stats(start, iterations, root.visits, ranked)
+        return self._publish(self._to_move(root.edges[best_i]), stats, root=root)
+
+    def _telemetry_extras(self, trees):
+        return {"search_turns": self.search_turns}
+
+    @staticmethod
+    def _tree_size(root):
+        """Number of nodes in a TurnNode tree."""
+        size = 0
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            size += 1
+            children = node.children
+            stack.extend(children.values() if node.kind == CHANCE else children)
+        return size
+
+    def _iterate(self, root, game, path, nodes):
+        """One select/expand/evaluate pass; returns the score to back up."""
+        node = root
+        nodes.append(node)
+        while True:
+            if node.terminal_value is not None:
+                return node.terminal_value
+            if node.depth > self.search_turns:
+                return self._rollout(game, throw_pending=node.kind == CHANCE)
+
+            if node.kind == CHANCE:
+                outcome = self._throw_phase(game, path)
+                child = node.children.get(outcome)
+                if child is None:
+                    child = node.children[outcome] = self._new_node(
+                        game, DECISION, node.depth
+                    )
+                    nodes.append(child)
+                    return self._evaluate(child, game)
+                node = child
+                nodes.append(node)
+                continue
+
+            if node.untried_actions is None:
+                node.untried_actions = candidate_actions(game, node.player_id) or [
+                    END_TURN
+                ]
+            if node.untried_actions:
+                action = node.untried_actions.pop()
+                kind, depth = self._step(game, node, action, path)
+                child = self._new_node(game, kind, depth)
+                node.children.append(child)
+                node.edges.append(action)
+                nodes.append(child)
+                return self._evaluate(child, game)
+
+            i = node.best_index(self.player_id)
+            self._step(game, node, node.edges[i], path)
+            node = node.children[i]
+            nodes.append(node)
+
+    @staticmethod
+    def _throw_phase(game, path):
+        """Throw until no yut/mo (or MAX_CHANCE_THROWS); returns the outcome."""
+        values = []
+        while True:
+            name, value = game.throw_source()
+            path.append(game.apply_throw(value))
+            values.append(value)
+            if len(values) == MAX_CHANCE_THROWS or not YutThrow.grants_extra_turn(name):
+                return tuple(sorted(values))
+
+    def _backpropagate(self, nodes, score):
+        """
+        Credit the path leaf first. Chance nodes take the probability-weighted
+        mean of their children instead of adding score, and the nodes above
+        them add the change in that total, so every decision node's wins stay
+        the sum of its children's.
+        """
+        probabilities = self._outcome_probabilities
+        delta = score
+        for node in reversed(nodes):
+            node.visits += 1
+            if node.kind == CHANCE and node.children:
+                mass = value = 0.0
+                for outcome, child in node.children.items():
+                    p = probabilities[outcome]
+                    mass += p
+                    value += p * child.wins / child.visits
+                wins = value / mass * node.visits
+                delta = wins - node.wins
+                node.wins = wins
+            else:
+                node.wins += delta
+
+    def _step(self, game, node, action, path):
+        """Apply a decision edge; returns (kind, depth) of the node it leads to."""
+        if action == END_TURN:
+            path.append(game.apply_next_turn())
+            return CHANCE, node.depth + 1
+        if action is None:
+            path.append(game.apply_skip())
+            return DECISION, node.depth
+        piece_id, steps, dest = resolve_action(game, node.player_id, action)
+        undo = game.apply_move(node.player_id, piece_id, steps, dest, bonus=[])
+        path.append(undo)
+        # A capture's bonus throw becomes a chance node of its own
+        return (CHANCE if undo.captured else DECISION), node.depth
+
+    def _new_node(self, game, kind, depth):
+        node = TurnNode(kind, game.current_player_idx, depth)
+        target = self._target_rank_idx
+        if len(game.rankings) > target:
+            node.terminal_value = 1.0 if game.rankings[target] == self.player_id else 0.0
+        elif game.game_state != "playing":
+            node.terminal_value = 0.0
+        return node
+
+    def _evaluate(self, node, game):
+        if node.terminal_value is not None:
+            return node.terminal_value
+        return self._rollout(game, throw_pending=node.kind == CHANCE)
+
+    def _rollout(self, game, throw_pending):
+        """Random playout from any point of a turn (possibly mid-throw)."""
+        COUNTERS.rollouts += 1
+        sim = PackedState.from_game(game, self._throw)
+        player_id = self.player_id
+        target_rank_idx = self._target_rank_idx
+
+        if throw_pending:
+            sim.throw_phase(is_bonus=True)
+        self._play_remaining_moves(sim, sim.current_player_idx)
+
+        for _ in range(self.MAX_ROLLOUT_TURNS):
+            if len(sim.rankings) > target_rank_idx:
+                return 1.0 if sim.rankings[target_rank_idx] == player_id else 0.0
+            if sim.game_state != "playing":
+                return 0.0
+            sim.next_turn()
+            COUNTERS.rollout_turns += 1
+            current_pid = sim.current_player_idx
+            sim.throw_phase()
+            self._play_remaining_moves(sim, current_pid)
+
+        if len(sim.rankings) > target_rank_idx:
+            return 1.0 if sim.rankings[target_rank_idx] == player_id else 0.0
+
+        return self._heuristic_score(sim)
+
@@ -0,0 +1,347 @@
+"""
+Compact array-backed game state for simulations.
+
+A PackedState holds the same information as a YutGame without the Player /
+Piece object graph: one signed byte per piece plus per-player counters. It
+mirrors the integer rules API of YutGame (get_legal_moves_idx,
+move_piece_idx, throw_phase, check_win_condition, next_turn), producing the
+same moves in the same order and consuming the RNG identically, so rollout
+code can run on either.
+
+Piece encoding (positions[player_id * NUM_PIECES + piece_id]):
+    0..28      on the board (compiled board index, see board.POSITION_NAMES)
+    WAITING    not entered yet (or captured)
+    FINISHED   exited the board
+"""
+
+from array import array
+from typing import List, Optional, Tuple
+
+from .board import (
+    BACK_DO_INDEX,
+    GOAL_INDEX,
+    MOVE_INDEX,
+    MOVE_STRIDE,
+    OFF_BOARD,
+)
+from .counters import COUNTERS
+from .player import Player
+from .yut_throw import YutThrow
+
+NUM_PIECES = Player.NUM_PIECES
+
+WAITING = OFF_BOARD  # -1
+FINISHED = -2
+
+
+class PackedState:
+    """
+    Packed game state with a rules engine that works on it directly.
+
+    Attributes:
+        positions: array('b') of piece codes, NUM_PIECES per player
+        waiting: bytearray, pieces not yet entered per player
+        finished: bytearray, pieces that exited per player
+        current_player_idx, accumulated_moves, rankings, winner, game_state,
+        throw_source: same meaning as on YutGame (throw_source is not part
+            of the state for comparisons)
+    """
+
+    __slots__ = (
+        "num_players",
+        "positions",
+        "waiting",
+        "finished",
+        "current_player_idx",
+        "accumulated_moves",
+        "rankings",
+        "winner",
+        "game_state",
+        "throw_source",
+    )
+
+    def __init__(self, num_players: int):
+        self.num_players = num_players
+        self.positions = array("b", [WAITING]) * (num_players * NUM_PIECES)
+        self.waiting = bytearray([NUM_PIECES]) * num_players
+        self.finished = bytearray(num_players)
+        self.current_player_idx = 0
+        self.accumulated_moves: List[int] = []
+        self.rankings: List[int] = []
+        self.winner: Optional[int] = None
+        self.game_state = "playing"
+        self.throw_source = YutThrow.throw
+
+    # -- conversion ---------------------------------------------------------
+
+    @classmethod
+    def from_game(cls, game, throw_source=None) -> "PackedState":
+        """
+        Pack a YutGame.
+
+        Like YutGame.clone(), the state throws from throw_source or the
+        global random module, never from the game's own source.
+
+        Raises:
+            ValueError: if a piece is in a state the rules cannot produce
+                        (on the board without has_moved)
+        """
+        state = cls.__new__(cls)
+        num_players = game.num_players
+        state.num_players = num_players
+        positions = array("b")
+        waiting = bytearray(num_players)
+        finished = bytearray(num_players)
+        for player in game.players:
+            pid = player.player_id
+            for piece in player.pieces:
+                if piece.is_active:
+                    if not piece.has_moved:
+                        raise ValueError(f"{piece!r} is on the board but never moved")
+                    positions.append(piece.pos)
+                elif piece.has_moved and piece.pos < 0:
+                    positions.append(FINISHED)
+                    finished[pid] += 1
+                else:
+                    positions.append(WAITING)
+                    waiting[pid] += 1
+        state.positions = positions
+        state.waiting = waiting
+        state.finished = finished
+        state.current_player_idx = game.current_player_idx
+        state.accumulated_moves = game.accumulated_moves.copy()
+        state.rankings = game.rankings.copy()
+        state.winner = game.winner
+        state.game_state = game.game_state
+        state.throw_source = YutThrow.throw if throw_source is None else throw_source
+        COUNTERS.clones += 1
+        return state
+
+    def apply_to(self, game):
+        """Write this state into an existing YutGame (names, board and history kept)."""
+        if game.num_players != self.num_players:
+            raise ValueError(
+                f"State has {self.num_players} players, game has {game.num_players}"
+            )
+        positions = self.positions
+        for player in game.players:
+            base = player.player_id * NUM_PIECES
+            for piece in player.pieces:
+                code = positions[base + piece.piece_id]
+                if code >= 0:
+                    piece.set_state(code, True, True)
+                elif code == FINISHED:
+                    piece.set_state(OFF_BOARD, False, True)
+                else:
+                    piece.set_state(OFF_BOARD, False, False)
+        game.current_player_idx = self.current_player_idx
+        game.accumulated_moves = self.accumulated_moves.copy()
+        game.rankings = self.rankings.copy()
+        game.winner = self.winner
+        game.game_state = self.game_state
+
+    def to_game(self, player_names: Optional[List[str]] = None):
+        """Build a fresh YutGame holding this state."""
+        from .game import YutGame
+
+        game = YutGame(player_names, self.num_players)
+        self.apply_to(game)
+        return game
+
+    def clone(self) -> "PackedState":
+        """Copy the state (a handful of small buffer copies)."""
+        state = PackedState.__new__(PackedState)
+        state.num_players = self.num_players
+        state.positions = array("b", self.positions)
+        state.waiting = bytearray(self.waiting)
+        state.finished = bytearray(self.finished)
+        state.current_player_idx = self.current_player_idx
+        state.accumulated_moves = self.accumulated_moves.copy()
+        state.rankings = self.rankings.copy()
+        state.winner = self.winner
+        state.game_state = self.game_state
+        state.throw_source = self.throw_source
+        COUNTERS.clones += 1
+        return state
+
+    def __eq__(self, other):
+        if not isinstance(other, PackedState):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__slots__
+            if name != "throw_source"
+        )
+
+    __hash__ = None
+
+    # -- queries ------------------------------------------------------------
+
+    def piece_positions(self, player_id: int) -> array:
+        """Piece codes for one player (a copy)."""
+        base = player_id * NUM_PIECES
+        return self.positions[base : base + NUM_PIECES]
+
+    def state_hash(self) -> int:
+        """Zobrist hash computed from scratch; equals YutGame.state_hash()."""
+        from .zobrist import hash_packed
+
+        return hash_packed(self)
+
+    def has_finished(self, player_id: int) -> bool:
+        """Check if all of a player's pieces have exited."""
+        return self.finished[player_id] == NUM_PIECES
+
+    def can_enter_new_piece(self, player_id: int) -> bool:
+        """Check if a player has any pieces not yet on board."""
+        return self.waiting[player_id] > 0
+
+    # -- rules --------------------------------------------------------------
+
+    def throw_phase(self, is_bonus: bool = False) -> List[Tuple[str, int]]:
+        """Same as YutGame.throw_phase, without logging."""
+        throws = []
+        if not is_bonus:
+            self.accumulated_moves = []
+        while True:
+            throw_name, move_value = self.throw_source()
+            throws.append((throw_name, move_value))
+            self.accumulated_moves.append(move_value)
+            if not YutThrow.grants_extra_turn(throw_name):
+                break
+        COUNTERS.throws += len(throws)
+        return throws
+
+    def get_legal_moves_idx(self, player_id: int) -> List[Tuple[int, int, int]]:
+        """Same moves, same order as YutGame.get_legal_moves_idx."""
+        positions = self.positions
+        accumulated = self.accumulated_moves
+        base = player_id * NUM_PIECES
+        legal_moves = []
+
+        for piece_id in range(NUM_PIECES):
+            pos = positions[base + piece_id]
+            if pos < 0:
+                continue
+            row = pos * MOVE_STRIDE
+            for steps in accumulated:
+                if steps == -1:
+                    for dest in BACK_DO_INDEX[pos]:
+                        legal_moves.append((piece_id, steps, dest))
+                else:
+                    dest = MOVE_INDEX[row + steps]
+                    if dest >= 0:
+                        legal_moves.append((piece_id, steps, dest))
+
+        if self.waiting[player_id]:
+            for steps in accumulated:
+                if 1 <= steps <= 5:
+                    legal_moves.append((-1, steps, steps))
+
+        return legal_moves
+
+    def move_piece_idx(
+        self, player_id: int, piece_id: int, steps: int, destination: int = OFF_BOARD
+    ) -> Tuple[bool, bool]:
+        """Same semantics as YutGame.move_piece_idx. Returns (success, captured)."""
+        positions = self.positions
+        base = player_id * NUM_PIECES
+
+        if steps not in self.accumulated_moves:
+            return False, False
+
+        if piece_id == -1:
+            if not self.waiting[player_id] or not (1 <= steps <= 5):
+                return False, False
+            for slot in range(base, base + NUM_PIECES):
+                if positions[slot] == WAITING:
+                    positions[slot] = steps  # entry index == throw value
+                    break
+            self.waiting[player_id] -= 1
+            self.accumulated_moves.remove(steps)
+            COUNTERS.moves += 1
+            return True, self._capture_at(player_id, steps)
+
+        current_pos = positions[base + piece_id]
+        if current_pos < 0:
+            return False, False
+
+        # At 00 after moving: the whole stack exits (except on back-do)
+        if current_pos == GOAL_INDEX and steps != -1:
+            exited = 0
+            for slot in range(base, base + NUM_PIECES):
+                if positions[slot] == GOAL_INDEX:
+                    positions[slot] = FINISHED
+                    exited += 1
+            self.finished[player_id] += exited
+            self.accumulated_moves.remove(steps)
+            COUNTERS.moves += 1
+            return True, False
+
+        if steps == -1:
+            valid = BACK_DO_INDEX[current_pos]
+            if destination >= 0:
+                if destination not in valid:
+                    return False, False
+                new_pos = destination
+            else:
+                new_pos = valid[0] if valid else OFF_BOARD
+        elif 0 <= steps < MOVE_STRIDE:
+            new_pos = MOVE_INDEX[current_pos * MOVE_STRIDE + steps]
+        else:
+            new_pos = OFF_BOARD
+
+        if new_pos < 0:
+            return False, False
+
+        for slot in range(base, base + NUM_PIECES):
+            if positions[slot] == current_pos:
+                positions[slot] = new_pos
+
+        self.accumulated_moves.remove(steps)
+        COUNTERS.moves += 1
+        return True, self._capture_at(player_id, new_pos)
+
+    def _capture_at(self, player_id: int, pos: int) -> bool:
+        """Send every opponent piece at pos back to waiting."""
+        positions = self.positions
+        captured_any = False
+        for other in range(self.num_players):
+            if other == player_id:
+                continue
+            base = other * NUM_PIECES
+            for slot in range(base, base + NUM_PIECES):
+                if positions[slot] == pos:
+                    positions[slot] = WAITING
+                    self.waiting[other] += 1
+                    captured_any = True
+        return captured_any
+
+    def check_win_condition(self) -> bool:
+        """Same as YutGame.check_win_condition, without logging."""
+        changed = False
+        rankings = self.rankings
+        for pid in range(self.num_players):
+            if self.finished[pid] == NUM_PIECES and pid not in rankings:
+                rankings.append(pid)
+                if self.winner is None:
+                    self.winner = pid
+                changed = True
+
+        # Game over when all but one player have finished
+        if len(rankings) >= self.num_players - 1:
+            for pid in range(self.num_players):
+                if pid not in rankings:
+                    rankings.append(pid)
+            self.game_state = "finished"
+            return True
+
+        return changed
+
+    def next_turn(self):
+        """Advance to next player's turn, skipping finished players."""
+        for _ in range(self.num_players):
+            self.current_player_idx = (self.current_player_idx + 1) % self.num_players
+            if self.current_player_idx not in self.rankings:
+                break
+        self.accumulated_moves = []
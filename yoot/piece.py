@@ -2,7 +2,9 @@
 Game piece representation for Yut Nori.
 """
 
-from typing import Optional
+from typing import Callable, Optional
+
+from .board import OFF_BOARD, POSITION_INDEX, POSITION_NAMES
 
 
 class Piece:
@@ -12,44 +14,100 @@ class Piece:
     Attributes:
         piece_id: Unique identifier for this piece within the player (0-3)
         player_id: Which player owns this piece (0-3)
-        position: Current board position (string: '00'-'19', 'aa'-'qq', 'xx'-'vv')
-                  None = not entered yet
+        pos: Current board position as a compiled integer index (0-28),
+             OFF_BOARD (-1) = not on the board. This is what the engine uses.
+        position: Same position as a string ('00'-'19', 'aa'-'qq', 'xx'-'vv'),
+                  None = not entered yet. Translated from/to `pos` on access.
         is_active: Whether piece is currently on board and moveable
         has_moved: Whether piece has started moving (to distinguish 00 start vs finish)
+
+    Every state change goes through set_state(), which reports the previous
+    (pos, is_active, has_moved) to the owning game's listener, so indexes the
+    game keeps over its pieces stay exact however a piece was changed.
     """
 
+    __slots__ = ("piece_id", "player_id", "_pos", "_active", "_moved", "_listener")
+
     def __init__(self, piece_id: int, player_id: int):
         self.piece_id = piece_id
         self.player_id = player_id
-        self.position: Optional[str] = None
-        self.is_active = False
-        self.has_moved = False
+        self._pos = OFF_BOARD
+        self._active = False
+        self._moved = False
+        self._listener: Optional[Callable[["Piece", int, bool, bool], None]] = None
+
+    def set_state(self, pos: int, is_active: bool, has_moved: bool):
+        """Set all piece state at once and notify the listener (if any)."""
+        old_pos, old_active, old_moved = self._pos, self._active, self._moved
+        self._pos = pos
+        self._active = is_active
+        self._moved = has_moved
+        if self._listener is not None:
+            self._listener(self, old_pos, old_active, old_moved)
+
+    @property
+    def pos(self) -> int:
+        return self._pos
+
+    @pos.setter
+    def pos(self, value: int):
+        self.set_state(value, self._active, self._moved)
+
+    @property
+    def is_active(self) -> bool:
+        return self._active
+
+    @is_active.setter
+    def is_active(self, value: bool):
+        self.set_state(self._pos, value, self._moved)
+
+    @property
+    def has_moved(self) -> bool:
+        return self._moved
+
+    @has_moved.setter
+    def has_moved(self, value: bool):
+        self.set_state(self._pos, self._active, value)
+
+    @property
+    def position(self) -> Optional[str]:
+        pos = self._pos
+        return None if pos < 0 else POSITION_NAMES[pos]
+
+    @position.setter
+    def position(self, value: Optional[str]):
+        self.pos = OFF_BOARD if value is None else POSITION_INDEX[value]
 
     def enter_board(self, entry_position: str):
         """Place piece on board."""
-        self.position = entry_position
-        self.is_active = True
-        self.has_moved = True
+        self.set_state(POSITION_INDEX[entry_position], True, True)
 
     def move_to(self, position: str):
         """Move piece to a new position."""
-        self.position = position
-        self.has_moved = True
+        self.set_state(POSITION_INDEX[position], self._active, True)
 
     def finish(self):
         """Mark piece as finished (returned to 00 after going around)."""
-        self.position = None
-        self.is_active = False
+        self.set_state(OFF_BOARD, False, self._moved)
 
     def capture(self):
         """Remove piece from board (captured by opponent)."""
-        self.position = None
-        self.is_active = False
-        self.has_moved = False
+        self.set_state(OFF_BOARD, False, False)
+
+    def clone(self) -> "Piece":
+        """Copy this piece's state without going through __init__ (no listener)."""
+        piece = Piece.__new__(Piece)
+        piece.piece_id = self.piece_id
+        piece.player_id = self.player_id
+        piece._pos = self._pos
+        piece._active = self._active
+        piece._moved = self._moved
+        piece._listener = None
+        return piece
 
     def has_finished(self) -> bool:
         """Check if piece has reached the goal (finished)."""
-        return not self.is_active and self.has_moved and self.position is None
+        return not self._active and self._moved and self._pos < 0
 
     def __repr__(self):
         return f"Piece(P{self.player_id}#{self.piece_id}, pos={self.position})"
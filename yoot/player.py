@@ -23,6 +23,14 @@ class Player:
             Piece(piece_id=i, player_id=player_id) for i in range(self.NUM_PIECES)
         ]
 
+    def clone(self) -> "Player":
+        """Copy this player with fresh pieces; the name is shared."""
+        player = Player.__new__(Player)
+        player.player_id = self.player_id
+        player.name = self.name
+        player.pieces = [piece.clone() for piece in self.pieces]
+        return player
+
     def get_active_pieces(self) -> List[Piece]:
         """Get all pieces currently on the board."""
         return [p for p in self.pieces if p.is_active]
@@ -37,7 +45,7 @@ class Player:
 
     def has_finished(self) -> bool:
         """Check if all pieces have reached the goal."""
-        return len(self.get_finished_pieces()) == self.NUM_PIECES
+        return all(p.has_finished() for p in self.pieces)
 
     def get_stacks(self) -> Dict[str, List[Piece]]:
         """
@@ -61,7 +69,7 @@ class Player:
 
     def can_enter_new_piece(self) -> bool:
         """Check if player has any pieces not yet on board."""
-        return len(self.get_inactive_pieces()) > 0
+        return any(not p.is_active and not p.has_finished() for p in self.pieces)
 
     def __repr__(self):
         active = len(self.get_active_pieces())
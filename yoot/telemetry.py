@@ -0,0 +1,134 @@
+"""
+Search telemetry: one structured record per AI decision.
+
+The AI controllers take a `telemetry` sink. The default, NULL_SINK, is
+disabled, and controllers skip building records entirely when
+sink.enabled is false, so headless runs pay nothing.
+
+A record is a plain dict:
+
+    controller      "MC", "MCTS" or "MT-MCTS"
+    player_id       the deciding player
+    move            chosen (piece_id, steps, destination) or None for skip
+    iterations      rollouts (MC) or search iterations (MCTS) this decision
+    elapsed_ms, time_budget_ms
+    root_visits     visits of the search root (MCTS; MC reports iterations)
+    reused_visits   visits inherited from the previous decision's subtree
+    tree_size       nodes in the search tree (None if not known)
+    candidates      [{"move", "visits", "win_rate"}] best first
+
+plus controller-specific extras (trees, transpositions, search_turns).
+
+Sinks: NullSink, MemorySink (keeps records), JsonlSink (one JSON object per
+line) and TextSink (the per-move tables the controllers used to print).
+"""
+
+import json
+import sys
+from abc import ABC, abstractmethod
+
+
+class TelemetrySink(ABC):
+    """Abstract base: receives one record per decision through emit()."""
+
+    enabled = True
+
+    @abstractmethod
+    def emit(self, record: dict):
+        """Take one decision record (see the module docstring)."""
+
+    def close(self):
+        """Release any resources held by the sink."""
+
+
+class NullSink(TelemetrySink):
+    """Discards everything; controllers do not even build records for it."""
+
+    enabled = False
+
+    def emit(self, record: dict):
+        pass
+
+
+NULL_SINK = NullSink()
+
+
+class MemorySink(TelemetrySink):
+    """Keeps records in a list (for tests and in-process analysis)."""
+
+    def __init__(self):
+        self.records = []
+
+    def emit(self, record: dict):
+        self.records.append(record)
+
+
+class JsonlSink(TelemetrySink):
+    """Appends each record as one JSON line to a path or an open text file."""
+
+    def __init__(self, target):
+        if isinstance(target, str):
+            self._file = open(target, "a")
+            self._owned = True
+        else:
+            self._file = target
+            self._owned = False
+
+    def emit(self, record: dict):
+        self._file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class TextSink(TelemetrySink):
+    """Writes a human-readable table per decision (default: sys.stdout)."""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def emit(self, record: dict):
+        stream = sys.stdout if self.stream is None else self.stream
+        stream.write(format_record(record) + "\n")
+
+
+def format_record(record: dict) -> str:
+    """Human-readable summary of a telemetry record."""
+    parts = [f"{record['iterations']} iterations"]
+    trees = record.get("trees", 1)
+    if trees > 1:
+        parts[0] += f" over {trees} trees"
+    if record.get("search_turns") is not None:
+        parts.append(f"{record['search_turns']} turns deep")
+    if record["reused_visits"]:
+        parts.append(f"reused {record['reused_visits']} prior visits")
+    if record.get("transpositions") is not None:
+        parts.append(f"{record['transpositions']} transpositions merged")
+    if record["tree_size"] is not None:
+        parts.append(f"{record['tree_size']} nodes")
+    parts.append(f"{len(record['candidates'])} candidates")
+    parts.append(f"{record['elapsed_ms']:.0f}ms")
+
+    lines = [f"  [{record['controller']}] " + ", ".join(parts) + ":"]
+    for candidate in record["candidates"]:
+        move = candidate["move"]
+        move_str = (
+            "skip" if move is None else f"piece={move[0]} steps={move[1]} dest={move[2]}"
+        )
+        marker = " <<" if move == record["move"] else ""
+        lines.append(
+            f"    {move_str}: {candidate['visits']} visits, "
+            f"{candidate['win_rate']:.1%} winrate{marker}"
+        )
+    return "\n".join(lines)
+
+
+def candidate_records(moves):
+    """Record form of a stats "moves" list [(move, visits, win_rate)]."""
+    return [
+        {"move": move, "visits": visits, "win_rate": win_rate}
+        for move, visits, win_rate in moves
+    ]
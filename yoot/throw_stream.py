@@ -0,0 +1,78 @@
+"""
+Bulk throw streams drawn with NumPy.
+
+A ThrowStream is a drop-in throw_source for YutGame / PackedState: calling
+it returns (throw_name, move_value) like YutThrow.throw(). Outcomes are
+pre-drawn in blocks of `block_size` with one vectorized
+numpy.random.Generator call and handed out one by one; the next block is
+drawn when the current one runs out.
+
+Streams are reproducible: ThrowStream(seed, stream=k) always yields the same
+sequence, and different `stream` numbers (e.g. one per game of a batch)
+give independent sequences, whatever order the games consume them in.
+
+Needs NumPy, which the rest of the package does not.
+"""
+
+from typing import Iterator, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError("yoot.throw_stream needs NumPy (pip install numpy)") from exc
+
+from .yut_throw import YutThrow
+
+DEFAULT_BLOCK_SIZE = 1 << 16
+
+
+class ThrowStream:
+    """
+    Callable throw source backed by pre-drawn NumPy blocks.
+
+    Args:
+        seed: root seed (int or None for fresh entropy)
+        stream: per-game stream number; (seed, stream) fixes the sequence
+        block_size: throws drawn per refill
+    """
+
+    def __init__(self, seed=None, stream: int = 0, block_size: int = DEFAULT_BLOCK_SIZE):
+        self.seed = seed
+        self.stream = stream
+        self.block_size = block_size
+        self.rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(stream,)))
+        self._throws: Iterator[Tuple[str, int]] = iter(())
+        self._probability = None
+        self._cumulative = None
+        self._outcomes = None
+
+    @classmethod
+    def for_games(cls, num_games: int, seed=None, block_size: int = DEFAULT_BLOCK_SIZE):
+        """One independent stream per game: streams 0..num_games-1 of seed."""
+        return [cls(seed, stream=i, block_size=block_size) for i in range(num_games)]
+
+    def __call__(self) -> Tuple[str, int]:
+        if self._probability != YutThrow.FLAT_PROBABILITY:
+            self._refill()
+        try:
+            return next(self._throws)
+        except StopIteration:
+            self._refill()
+            return next(self._throws)
+
+    def _refill(self):
+        """
+        Draw the next block. A FLAT_PROBABILITY change rebuilds the table
+        and drops the rest of the current block.
+        """
+        if self._probability != YutThrow.FLAT_PROBABILITY:
+            self._probability = YutThrow.FLAT_PROBABILITY
+            distribution = [d for d in YutThrow.distribution() if d[2] > 0]
+            self._outcomes = [(name, value) for name, value, _ in distribution]
+            cumulative = np.cumsum([probability for _, _, probability in distribution])
+            cumulative[-1] = 1.0
+            self._cumulative = cumulative
+        draws = self.rng.random(self.block_size)
+        indices = np.searchsorted(self._cumulative, draws, side="right")
+        outcomes = self._outcomes
+        self._throws = iter([outcomes[i] for i in indices.tolist()])
@@ -0,0 +1,444 @@
+"""
+Parallel, resumable tournaments between controllers.
+
+A tournament is a list of matchups, usually loaded from a JSON file:
+
+    [
+      {
+        "name": "mcts-vs-mc",
+        "games": 1000,
+        "players": [
+          {"name": "MCTS", "controller": "MCTSController",
+           "params": {"num_iterations": 1000}},
+          {"name": "MC", "controller": "MonteCarloController",
+           "params": {"num_simulations": 100}}
+        ]
+      }
+    ]
+
+A matchup has 2-6 players. `controller` is a class exported by yoot or a
+"module:Class" path, and `params` are its keyword arguments. The class is
+built as cls(game, player_id, rng=rng, **params), or as
+cls(rng=rng, **params) when its constructor takes no game (like
+RandomController). Optional keys:
+
+- rotate_seats (default true): game i seats players[(s + i) % n] at seat s,
+  so each player gets every seat equally often
+- common_throws (default false): the n games of one seat rotation share
+  per-seat throw streams, so each player meets the same dice from each seat
+  (common random numbers, see yoot.match); it needs rotate_seats
+- seed (default 0) and max_turns (default 500)
+
+Each game is seeded from (seed, matchup name, game index) alone. Games are
+spread over a process pool and every finished game is appended to a JSONL
+results file as soon as it arrives. The file starts with the spec; running
+the same spec against an existing file skips the games it already holds,
+so a killed run picks up where it stopped.
+
+With a telemetry path, every search decision's yoot.telemetry record is
+also appended there, tagged with matchup, game and player.
+
+Each record also carries the game's yoot.counters delta ("counters"), so the
+summary can report rollouts/s per core. The parent adds the workers' deltas
+to its own counters, which --report-every prints periodically.
+
+Command line:
+
+    python -m yoot.tournament SPEC.json RESULTS.jsonl [--workers N] [--telemetry PATH]
+        [--report-every SECONDS]
+"""
+
+import argparse
+import contextlib
+import importlib
+import inspect
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from . import counters
+from .game import YutGame
+from .match import SeatThrows, paired_estimate, play_game, wilson_interval
+from .seeding import make_rng
+from .telemetry import MemorySink
+
+MIN_PLAYERS = 2
+MAX_PLAYERS = 6
+
+
+def load_spec(path):
+    """Read and validate a tournament spec (a matchup or a list of them)."""
+    with open(path) as f:
+        spec = json.load(f)
+    return normalize_spec(spec)
+
+
+def normalize_spec(spec):
+    """Validate spec and fill in defaults; returns a list of matchup dicts."""
+    if isinstance(spec, dict):
+        spec = [spec]
+    matchups = []
+    names = set()
+    for entry in spec:
+        matchup = {
+            "rotate_seats": True,
+            "common_throws": False,
+            "seed": 0,
+            "max_turns": 500,
+            **entry,
+        }
+        name = matchup.get("name")
+        if not name or name in names:
+            raise ValueError(f"Each matchup needs a unique name (got {name!r})")
+        names.add(name)
+        players = matchup.get("players", [])
+        if not MIN_PLAYERS <= len(players) <= MAX_PLAYERS:
+            raise ValueError(
+                f"Matchup {name!r} needs {MIN_PLAYERS}-{MAX_PLAYERS} players"
+            )
+        player_names = [p.get("name") for p in players]
+        if None in player_names or len(set(player_names)) != len(player_names):
+            raise ValueError(f"Players of matchup {name!r} need unique names")
+        for player in players:
+            player.setdefault("params", {})
+            resolve_controller(player["controller"])
+        if int(matchup.get("games", 0)) < 1:
+            raise ValueError(f"Matchup {name!r} needs a positive number of games")
+        if matchup["common_throws"] and not matchup["rotate_seats"]:
+            # Without rotation every game repeats the same dice from the same
+            # seats, so the pairing only multiplies one game's luck
+            raise ValueError(f"Matchup {name!r} needs rotate_seats for common_throws")
+        matchups.append(matchup)
+    return matchups
+
+
+def resolve_controller(name):
+    """Controller class for an exported yoot name or a "module:Class" path."""
+    if ":" in name:
+        module_name, _, attr = name.partition(":")
+        module = importlib.import_module(module_name)
+    else:
+        module, attr = importlib.import_module("yoot"), name
+    try:
+        return getattr(module, attr)
+    except AttributeError:
+        raise ValueError(f"Unknown controller {name!r}") from None
+
+
+def seat_order(matchup, game_index):
+    """Player indices by seat for game game_index."""
+    n = len(matchup["players"])
+    if not matchup["rotate_seats"]:
+        return list(range(n))
+    return [(seat + game_index) % n for seat in range(n)]
+
+
+def play_tournament_game(matchup, game_index, telemetry=False):
+    """
+    Play one game of matchup (worker entry point).
+
+    Returns:
+        Result record: matchup, game, seats and rankings (player names by
+        seat and in finish order), turns, seconds and counters (the
+        game's yoot.counters delta without "seconds"). With telemetry, also
+        "decisions": the controllers' telemetry records tagged with player.
+    """
+    start = time.perf_counter()
+    before = counters.snapshot()
+    players = matchup["players"]
+    n = len(players)
+    order = seat_order(matchup, game_index)
+    seed = matchup["seed"]
+    name = matchup["name"]
+
+    game = YutGame([players[p]["name"] for p in order], n)
+    if matchup["common_throws"]:
+        rotation = game_index // n
+        game.throw_source = SeatThrows(
+            game, [make_rng(seed, name, "rotation", rotation, seat) for seat in range(n)]
+        )
+    else:
+        game.throw_source = SeatThrows(
+            game, [make_rng(seed, name, "game", game_index, seat) for seat in range(n)]
+        )
+
+    controllers = {}
+    sinks = {}
+    for seat, p in enumerate(order):
+        player = players[p]
+        cls = resolve_controller(player["controller"])
+        params = dict(player["params"])
+        params["rng"] = make_rng(seed, name, "game", game_index, "player", p)
+        accepted = inspect.signature(cls).parameters
+        if telemetry and "telemetry" in accepted:
+            params["telemetry"] = sinks[player["name"]] = MemorySink()
+        if "game" in accepted:
+            controllers[seat] = cls(game, seat, **params)
+        else:
+            controllers[seat] = cls(**params)
+
+    try:
+        turns = play_game(game, controllers, matchup["max_turns"])
+    finally:
+        for ctrl in controllers.values():
+            close = getattr(ctrl, "close", None)
+            if close is not None:
+                close()
+
+    result = {
+        "matchup": name,
+        "game": game_index,
+        "seats": [players[p]["name"] for p in order],
+        "rankings": [players[order[seat]]["name"] for seat in game.rankings],
+        "turns": turns,
+        "seconds": round(time.perf_counter() - start, 4),
+        "counters": {
+            field: count
+            for field, count in counters.delta(before).items()
+            if field != "seconds"
+        },
+    }
+    if telemetry:
+        result["decisions"] = [
+            {"player": player, **record}
+            for player, sink in sinks.items()
+            for record in sink.records
+        ]
+    return result
+
+
+def read_results(path):
+    """(spec, records) from a results file; (None, []) if it does not exist."""
+    if not os.path.exists(path):
+        return None, []
+    spec = None
+    records = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn last line of a killed run
+            if "spec" in entry:
+                spec = entry["spec"]
+            else:
+                records.append(entry)
+    return spec, records
+
+
+def _ends_mid_line(path):
+    if not os.path.exists(path) or not os.path.getsize(path):
+        return False
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+def run_tournament(
+    matchups, results_path, workers=None, progress=None, telemetry_path=None
+):
+    """
+    Play every game of matchups not yet in results_path, appending records.
+
+    Args:
+        matchups: normalize_spec() output
+        results_path: JSONL file, created with a spec header if missing
+        workers: process count (default os.cpu_count(); 1 plays in-process)
+        progress: optional callback(record, done, total) per finished game
+        telemetry_path: JSONL file to append the games' decision records to
+
+    Returns:
+        All records of the results file (old and new)
+    """
+    spec, records = read_results(results_path)
+    if spec is not None and spec != matchups:
+        raise ValueError(f"{results_path} holds results of a different spec")
+    done = {(r["matchup"], r["game"]) for r in records}
+    todo = [
+        (matchup, i)
+        for matchup in matchups
+        for i in range(matchup["games"])
+        if (matchup["name"], i) not in done
+    ]
+    total = len(todo) + len(done)
+
+    want_telemetry = telemetry_path is not None
+    torn = _ends_mid_line(results_path)
+    with contextlib.ExitStack() as stack:
+        out = stack.enter_context(open(results_path, "a"))
+        decisions_out = None
+        if want_telemetry:
+            decisions_out = stack.enter_context(open(telemetry_path, "a"))
+        if torn:
+            out.write("\n")
+        if spec is None:
+            out.write(json.dumps({"spec": matchups}) + "\n")
+            out.flush()
+
+        def record(result):
+            if decisions_out is not None:
+                tags = {"matchup": result["matchup"], "game": result["game"]}
+                for decision in result.pop("decisions"):
+                    decisions_out.write(json.dumps({**tags, **decision}) + "\n")
+                decisions_out.flush()
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            records.append(result)
+            if progress is not None:
+                progress(result, len(records), total)
+
+        if workers == 1:
+            for matchup, i in todo:
+                record(play_tournament_game(matchup, i, want_telemetry))
+        elif todo:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(play_tournament_game, matchup, i, want_telemetry)
+                    for matchup, i in todo
+                ]
+                for future in as_completed(futures):
+                    result = future.result()
+                    counters.COUNTERS.add(result["counters"])
+                    record(result)
+    return records
+
+
+def summarize(matchups, records):
+    """
+    Per-matchup, per-player results.
+
+    Returns:
+        {matchup name: {"games": n, "players": {player name: {"games",
+        "wins", "win_rate", "interval", "mean_rank"}}, "rollouts_per_second":
+        rollouts per second of game time, i.e. per core}} where win means
+        finishing first and unfinished players share the last rank.
+        Two-player common_throws matchups also get "paired": the
+        yoot.match.paired_estimate() of the first player against the
+        second over complete seat rotations.
+    """
+    summary = {}
+    for matchup in matchups:
+        names = [p["name"] for p in matchup["players"]]
+        games = [r for r in records if r["matchup"] == matchup["name"]]
+        players = {}
+        for player in names:
+            wins = sum(1 for r in games if r["rankings"][:1] == [player])
+            ranks = [_rank(r, player) for r in games]
+            players[player] = {
+                "games": len(games),
+                "wins": wins,
+                "win_rate": wins / len(games) if games else 0.0,
+                "interval": wilson_interval(wins, len(games)),
+                "mean_rank": sum(ranks) / len(ranks) if ranks else math.nan,
+            }
+        seconds = sum(r["seconds"] for r in games)
+        rollouts = sum(r.get("counters", {}).get("rollouts", 0) for r in games)
+        summary[matchup["name"]] = {
+            "games": len(games),
+            "players": players,
+            "rollouts_per_second": rollouts / seconds if seconds else 0.0,
+        }
+        if matchup["common_throws"] and len(names) == 2:
+            summary[matchup["name"]]["paired"] = _paired(games, names[0])
+    return summary
+
+
+def _paired(games, player):
+    """paired_estimate() of player over the complete rotations in games."""
+    rotations = {}
+    for r in games:
+        score = 0
+        if r["rankings"]:
+            score = 1 if r["rankings"][0] == player else -1
+        rotations.setdefault(r["game"] // 2, {})[r["game"] % 2] = score
+    pairs = [(s[0], s[1]) for s in rotations.values() if len(s) == 2]
+    return paired_estimate(pairs)
+
+
+def _rank(record, player):
+    rankings = record["rankings"]
+    if player in rankings:
+        return rankings.index(player) + 1
+    return len(rankings) + 1
+
+
+def format_summary(summary):
+    """Human-readable table of summarize() output."""
+    lines = []
+    for name, result in summary.items():
+        lines.append(
+            f"{name} ({result['games']} games, "
+            f"{result['rollouts_per_second']:.0f} rollouts/s per core)"
+        )
+        for player, stats in result["players"].items():
+            low, high = stats["interval"]
+            lines.append(
+                f"  {player:>12s}: {stats['wins']:5d} wins  {stats['win_rate']:6.1%} "
+                f"(95% CI {low:.1%} - {high:.1%})  mean rank {stats['mean_rank']:.2f}"
+            )
+        paired = result.get("paired")
+        if paired is not None and paired["pairs"]:
+            lines.append(
+                f"  paired: first - second player win rate {paired['diff']:+.1%} "
+                f"± {paired['stderr']:.1%} over {paired['pairs']} pairs"
+            )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m yoot.tournament",
+        description="Run (or resume) a tournament between Yut Nori controllers.",
+    )
+    parser.add_argument("spec", help="JSON tournament spec")
+    parser.add_argument("results", help="JSONL results file (appended to)")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="worker processes (default: all cores)"
+    )
+    parser.add_argument(
+        "--summary-only", action="store_true", help="summarize the results file and exit"
+    )
+    parser.add_argument(
+        "--telemetry", help="JSONL file for per-decision search telemetry"
+    )
+    parser.add_argument(
+        "--report-every",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="print throughput counters to stderr at this interval",
+    )
+    args = parser.parse_args(argv)
+
+    matchups = load_spec(args.spec)
+    if args.summary_only:
+        records = read_results(args.results)[1]
+    else:
+        start = time.time()
+
+        def progress(record, done, total):
+            if done % 50 == 0 or done == total:
+                print(
+                    f"  {done}/{total} games ({time.time() - start:.0f}s)",
+                    file=sys.stderr,
+                    flush=True,
+                )
+
+        reporter = contextlib.nullcontext()
+        if args.report_every:
+            reporter = counters.Reporter(args.report_every)
+        with reporter:
+            records = run_tournament(
+                matchups, args.results, args.workers, progress, args.telemetry
+            )
+    print(format_summary(summarize(matchups, records)))
+
+
+if __name__ == "__main__":
+    main()
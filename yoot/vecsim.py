@@ -0,0 +1,317 @@
+"""
+Vectorized random-play simulator: N Yut Nori games advanced in lockstep.
+
+Every game is a row in a (games x players x pieces) position tensor using
+the PackedState encoding (board index 0..28, WAITING, FINISHED). Each step
+every live game makes one uniformly random legal move -- the same choice
+RandomController makes from YutGame.get_legal_moves() -- with throws,
+stacking, captures, bonus throws, exits and rankings all done as NumPy
+array operations over the compiled board tables.
+
+Needs NumPy, which the rest of the package does not:
+
+    from yoot.vecsim import VecSim
+
+    sim = VecSim(10_000, num_players=2, seed=1).run()
+    sim.rank_rates(0)          # share of games each player won
+
+VecSim.from_packed() replicates one PackedState N times, for Monte Carlo
+evaluation of a position; VecSim.from_states() does the same for a batch of
+positions, and VecRolloutEvaluator plugs that into batched MCTS.
+"""
+
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError("yoot.vecsim needs NumPy (pip install numpy)") from exc
+
+from .board import BACK_DO_INDEX, GOAL_INDEX, MOVE_INDEX, MOVE_STRIDE, POSITION_NAMES
+from .counters import COUNTERS
+from .packed import FINISHED, NUM_PIECES, WAITING
+from .yut_throw import YutThrow
+
+NUM_POSITIONS = len(POSITION_NAMES)
+MAX_BACK_DO = max(len(dests) for dests in BACK_DO_INDEX)
+
+# MOVE_TABLE[pos, steps] -> destination index or -1 (steps 0..5)
+MOVE_TABLE = np.array(MOVE_INDEX, dtype=np.int8).reshape(NUM_POSITIONS, MOVE_STRIDE)
+
+# BACK_DO_TABLE[pos, i] -> i-th back-do destination or -1
+BACK_DO_TABLE = np.full((NUM_POSITIONS, MAX_BACK_DO), -1, dtype=np.int8)
+for _pos, _dests in enumerate(BACK_DO_INDEX):
+    BACK_DO_TABLE[_pos, : len(_dests)] = _dests
+
+# DEST_TABLE[pos, value + 1, i] -> destination of the i-th way to play a
+# throw value from pos, or -1. Only back-do (value -1) has a second way.
+# Row NUM_POSITIONS (off the board) and column 1 (value 0, "no throw") are
+# all -1, so pieces off the board and unused throw slots need no masking.
+DEST_TABLE = np.full((NUM_POSITIONS + 1, MOVE_STRIDE + 1, MAX_BACK_DO), -1, np.int8)
+DEST_TABLE[:NUM_POSITIONS, 0] = BACK_DO_TABLE
+DEST_TABLE[:NUM_POSITIONS, 2:, 0] = MOVE_TABLE[:, 1:]
+
+_DEST_ROWS = DEST_TABLE.reshape(-1, MAX_BACK_DO)  # indexed by pos * 7 + value + 1
+
+THROW_VALUES = np.array([-1, 1, 2, 3, 4, 5], dtype=np.int8)
+
+
+def throw_probabilities(flat_probability: Optional[float] = None) -> np.ndarray:
+    """Probabilities of THROW_VALUES, from YutThrow.distribution()."""
+    by_value = {
+        value: probability
+        for _, value, probability in YutThrow.distribution(flat_probability)
+    }
+    return np.array([by_value[value] for value in THROW_VALUES.tolist()])
+
+
+class VecSim:
+    """
+    A batch of independent random games.
+
+    Attributes:
+        positions: int8 (games, players, NUM_PIECES) piece codes
+        moves: int8 (games, K) accumulated throw values, `num_moves` used per row
+        current: current player per game
+        rankings: int8 (games, players) finishing order, -1 where undecided
+        num_ranked: players ranked so far per game
+        done: games that are over (finished, or stopped by max_turns)
+        turns: turns played per game
+    """
+
+    def __init__(self, num_games: int, num_players: int = 2, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.num_games = num_games
+        self.num_players = num_players
+        self.positions = np.full((num_games, num_players, NUM_PIECES), WAITING, np.int8)
+        self.moves = np.zeros((num_games, 8), np.int8)
+        self.num_moves = np.zeros(num_games, np.int64)
+        self.current = np.zeros(num_games, np.int64)
+        self.rankings = np.full((num_games, num_players), -1, np.int8)
+        self.num_ranked = np.zeros(num_games, np.int64)
+        self.done = np.zeros(num_games, bool)
+        self.turns = np.zeros(num_games, np.int64)
+        self._cumulative = np.cumsum(throw_probabilities())
+        self._throw(np.arange(num_games))
+
+    @classmethod
+    def from_packed(cls, state, num_games: int, seed=None) -> "VecSim":
+        """
+        num_games copies of a PackedState, continuing its current turn.
+
+        The current player keeps playing state.accumulated_moves; with none
+        left the turn passes to the next player, as in a rollout.
+        """
+        return cls.from_states([state], num_games, seed)
+
+    @classmethod
+    def from_states(cls, states, repeats: int = 1, seed=None) -> "VecSim":
+        """
+        `repeats` consecutive copies of each PackedState (same player count).
+
+        Game i starts from states[i // repeats]; turns continue as in
+        from_packed().
+        """
+        num_players = states[0].num_players
+        num_games = len(states) * repeats
+        sim = cls(0, num_players, seed)
+        sim.num_games = num_games
+        width = max(8, max(len(state.accumulated_moves) for state in states))
+
+        positions = np.empty((len(states), num_players, NUM_PIECES), np.int8)
+        moves = np.zeros((len(states), width), np.int8)
+        num_moves = np.empty(len(states), np.int64)
+        current = np.empty(len(states), np.int64)
+        rankings = np.full((len(states), num_players), -1, np.int8)
+        num_ranked = np.empty(len(states), np.int64)
+        done = np.empty(len(states), bool)
+        for i, state in enumerate(states):
+            positions[i] = np.array(state.positions, np.int8).reshape(
+                num_players, NUM_PIECES
+            )
+            moves[i, : len(state.accumulated_moves)] = state.accumulated_moves
+            num_moves[i] = len(state.accumulated_moves)
+            current[i] = state.current_player_idx
+            rankings[i, : len(state.rankings)] = state.rankings
+            num_ranked[i] = len(state.rankings)
+            done[i] = state.game_state != "playing"
+
+        sim.positions = np.repeat(positions, repeats, axis=0)
+        sim.moves = np.repeat(moves, repeats, axis=0)
+        sim.num_moves = np.repeat(num_moves, repeats)
+        sim.current = np.repeat(current, repeats)
+        sim.rankings = np.repeat(rankings, repeats, axis=0)
+        sim.num_ranked = np.repeat(num_ranked, repeats)
+        sim.done = np.repeat(done, repeats)
+        sim.turns = np.zeros(num_games, np.int64)
+        sim._end_turn(np.nonzero(~sim.done & (sim.num_moves == 0))[0])
+        return sim
+
+    def run(self, max_turns: int = 1000) -> "VecSim":
+        """Play every game to the end (or max_turns turns); returns self."""
+        while True:
+            live = np.nonzero(~self.done)[0]
+            if live.size == 0:
+                return self
+            self._step(live)
+            self.done |= self.turns >= max_turns
+
+    def rank_rates(self, rank: int = 0) -> np.ndarray:
+        """Share of games in which each player took `rank` (0 = first)."""
+        taken = self.rankings[:, rank]
+        return np.bincount(taken[taken >= 0], minlength=self.num_players) / self.num_games
+
+    # -- internals ----------------------------------------------------------
+
+    def _throw(self, games):
+        """Throw phase for `games`: append throws until one is not yut/mo."""
+        while games.size:
+            draws = self.rng.random(games.size)
+            values = THROW_VALUES[np.searchsorted(self._cumulative, draws, side="right")]
+            slots = self.num_moves[games]
+            if slots.max() >= self.moves.shape[1]:
+                self.moves = np.pad(self.moves, ((0, 0), (0, self.moves.shape[1])))
+            self.moves[games, slots] = values
+            self.num_moves[games] += 1
+            games = games[values >= 4]
+
+    def _end_turn(self, games):
+        """Pass the turn to the next unranked player and throw for them."""
+        if games.size == 0:
+            return
+        self.turns[games] += 1
+        current = self.current[games]
+        pending = np.ones(games.size, bool)
+        for _ in range(self.num_players):
+            current[pending] = (current[pending] + 1) % self.num_players
+            pending &= self._is_ranked(games, current)
+        self.current[games] = current
+        self.num_moves[games] = 0
+        self._throw(games)
+
+    def _is_ranked(self, games, players):
+        return (self.rankings[games] == players[:, None]).any(axis=1)
+
+    def _step(self, games):
+        """One uniformly random legal move (or forfeited turn) in every game."""
+        num = games.size
+        width = int(self.num_moves[games].max())  # only the columns in use
+        player = self.current[games]
+        own = self.positions[games, player]  # (num, pieces)
+        steps = self.moves[games, :width]  # (num, width)
+        usable = np.arange(width) < self.num_moves[games][:, None]
+
+        # Piece moves: (num, piece, move slot, back-do alternative)
+        at = np.where(own >= 0, own, NUM_POSITIONS).astype(np.intp)
+        column = np.where(usable, steps + 1, 1).astype(np.intp)
+        cell = at[:, :, None] * (MOVE_STRIDE + 1) + column[:, None, :]
+        dest = _DEST_ROWS.take(cell, axis=0).reshape(num, -1)
+        piece_ok = dest >= 0
+
+        # Entries: one per usable positive throw while pieces wait
+        waiting = (own == WAITING).any(axis=1)
+        entry_ok = usable & (steps >= 1) & waiting[:, None]
+
+        legal = np.concatenate([piece_ok, entry_ok], axis=1)
+        has_move = legal.any(axis=1)
+        forfeited = games[~has_move]
+        if not has_move.any():
+            self._end_turn(forfeited)
+            return
+
+        games, player, own, steps, legal = (
+            games[has_move],
+            player[has_move],
+            own[has_move],
+            steps[has_move],
+            legal[has_move],
+        )
+        dest = dest[has_move]
+        num = games.size
+        rows = np.arange(num)
+
+        # Uniform choice among legal moves: the r-th legal column
+        counts = np.cumsum(legal, axis=1, dtype=np.int32)
+        pick = (self.rng.random(num) * counts[:, -1]).astype(counts.dtype)
+        choice = (counts > pick[:, None]).argmax(axis=1)
+
+        num_piece_slots = NUM_PIECES * width * MAX_BACK_DO
+        is_entry = choice >= num_piece_slots
+        slot = np.where(
+            is_entry,
+            choice - num_piece_slots,
+            (choice // MAX_BACK_DO) % width,
+        )
+        value = steps[rows, slot]
+        piece = np.where(is_entry, (own == WAITING).argmax(axis=1), choice // (width * MAX_BACK_DO))
+        from_pos = own[rows, piece]
+        to_pos = np.where(
+            is_entry, value, dest[rows, np.minimum(choice, num_piece_slots - 1)]
+        ).astype(np.int8)
+
+        # Leaving from the goal: the whole stack exits (except on back-do)
+        exiting = ~is_entry & (from_pos == GOAL_INDEX) & (value != -1)
+        to_pos[exiting] = FINISHED
+
+        # Move the piece (or its whole stack)
+        stack = own == from_pos[:, None]
+        stack[is_entry] = False
+        stack[rows[is_entry], piece[is_entry]] = True
+        own = np.where(stack, to_pos[:, None], own)
+        self.positions[games, player] = own
+
+        # Capture opponents on the destination
+        board = self.positions[games]
+        hit = (board == to_pos[:, None, None]) & (to_pos >= 0)[:, None, None]
+        hit[rows, player] = False
+        captured = hit.any(axis=(1, 2))
+        self.positions[games] = np.where(hit, np.int8(WAITING), board)
+
+        # Spend the throw
+        cols = np.arange(width)[None, :]
+        shift = np.minimum(cols + (cols >= slot[:, None]), width - 1)
+        self.moves[games, :width] = np.take_along_axis(steps, shift, axis=1)
+        self.num_moves[games] -= 1
+
+        self._throw(games[captured])
+
+        # Rankings: only the mover can have just finished
+        finished = (own == FINISHED).all(axis=1) & ~self._is_ranked(games, player)
+        won = games[finished]
+        self.rankings[won, self.num_ranked[won]] = player[finished]
+        self.num_ranked[won] += 1
+        # Game over with one player left: they take last place
+        over = won[self.num_ranked[won] == self.num_players - 1]
+        pids = np.arange(self.num_players)
+        ranked = (self.rankings[over][:, :, None] == pids).any(axis=1)
+        self.rankings[over, -1] = (~ranked).argmax(axis=1)
+        self.num_ranked[over] += 1
+        self.done[over] = True
+
+        turn_over = finished | (self.num_moves[games] == 0)
+        self._end_turn(np.concatenate([forfeited, games[turn_over & ~self.done[games]]]))
+
+
+class VecRolloutEvaluator:
+    """
+    Batch leaf evaluator for MCTSController(batch_size=..., evaluator=...).
+
+    Plays `rollouts` random games from every leaf in one VecSim and scores
+    each leaf by the share of them in which player_id took the leaf's next
+    open rank.
+    """
+
+    def __init__(self, rollouts: int = 16, seed=None, max_turns: int = 1000):
+        self.rollouts = rollouts
+        self.max_turns = max_turns
+        self.rng = np.random.default_rng(seed)
+
+    def __call__(self, states, player_id: int) -> np.ndarray:
+        sim = VecSim.from_states(states, self.rollouts, seed=self.rng)
+        sim.run(self.max_turns)
+        COUNTERS.rollouts += sim.num_games
+        COUNTERS.rollout_turns += int(sim.turns.sum())
+        target = np.repeat([len(state.rankings) for state in states], self.rollouts)
+        taken = sim.rankings[np.arange(sim.num_games), np.minimum(target, sim.num_players - 1)]
+        hits = (taken == player_id) & (target < sim.num_players)
+        return hits.reshape(len(states), self.rollouts).mean(axis=1)
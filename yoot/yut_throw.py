@@ -3,7 +3,9 @@ Yut stick throwing mechanics.
 """
 
 import random
-from typing import Tuple
+from bisect import bisect_right
+from math import comb
+from typing import Dict, List, Tuple
 
 
 class YutThrow:
@@ -11,6 +13,14 @@ class YutThrow:
     Handles yut stick throwing simulation.
 
     Four sticks are thrown, each can land flat or round side up.
+
+    throw() samples the exact outcome distribution of the four sticks with a
+    single random.random() draw through a cumulative table. The table is
+    rebuilt on the next throw whenever FLAT_PROBABILITY changes.
+
+    turn_distribution() gives the exact distribution of a whole turn's
+    accumulated moves (yut/mo chains included) for search and analysis that
+    sums over outcomes instead of sampling them.
     """
 
     # Throw results mapped to Korean names
@@ -40,38 +50,120 @@ class YutThrow:
     # Research shows approximately 60% probability of flat side up
     FLAT_PROBABILITY = 0.6  # 60% chance flat side up, 40% convex side up
 
+    # Sampling table for FLAT_PROBABILITY == _table_probability
+    _table_probability = None
+    _cumulative: List[float] = []
+    _outcomes: List[Tuple[str, int]] = []
+
+    # (flat_probability, max_throws) -> turn_distribution() result
+    _turn_cache: Dict[Tuple[float, int], Tuple[Tuple[Tuple[int, ...], float], ...]] = {}
+
     @staticmethod
-    def throw() -> Tuple[str, int]:
+    def distribution(flat_probability=None) -> List[Tuple[str, int, float]]:
         """
-        Simulate throwing 4 yut sticks.
+        Exact outcome probabilities as [(throw_name, move_value, probability)].
+
+        One stick is designated as "back Do": a Do whose one flat stick is
+        that stick is back Do (move backwards).
+        """
+        p = YutThrow.FLAT_PROBABILITY if flat_probability is None else flat_probability
+        q = 1.0 - p
+        probabilities = {
+            "back_do": p * q**3,  # only the back Do stick is flat
+            "do": 3 * p * q**3,  # one of the other three
+            "gae": 6 * p**2 * q**2,
+            "geol": 4 * p**3 * q,
+            "yut": p**4,
+            "mo": q**4,
+        }
+        return [
+            (name, YutThrow.MOVE_VALUES[name], probability)
+            for name, probability in probabilities.items()
+        ]
+
+    @staticmethod
+    def turn_distribution(
+        max_throws: int = 8,
+    ) -> Tuple[Tuple[Tuple[int, ...], float], ...]:
+        """
+        Exact distribution of one turn's accumulated moves.
 
-        One stick is designated as "back Do" - if Do is thrown and that
-        stick is the flat one, it's back Do (move backwards).
+        A turn keeps throwing while it gets yut or mo, so its moves are any
+        number of 4s and 5s followed by one non-extra throw. The order of the
+        moves does not matter to the player, so outcomes are multisets, given
+        as sorted tuples of move values (back Do is -1).
 
-        Yut sticks are unfair coins: 60% chance of landing flat side up.
+        The chain is cut after max_throws throws: a yut/mo as the last
+        allowed throw ends the turn, so the probabilities still sum to 1.
+        The default loses less than 1e-6 of the mass to the cut.
+
+        The result is cached per (FLAT_PROBABILITY, max_throws).
 
         Returns:
-            Tuple of (throw_name, move_value)
+            ((moves, probability), ...) most likely first
         """
-        # Simulate which sticks land flat (0-3 indices)
-        sticks = [
-            1 if random.random() < YutThrow.FLAT_PROBABILITY else 0 for _ in range(4)
-        ]
-        flat_count = sum(sticks)
+        if max_throws < 1:
+            raise ValueError("max_throws must be at least 1")
+        key = (YutThrow.FLAT_PROBABILITY, max_throws)
+        cached = YutThrow._turn_cache.get(key)
+        if cached is not None:
+            return cached
+
+        outcomes = YutThrow.distribution()
+        chains = YutThrow.EXTRA_TURN_THROWS
+        extra = {name: p for name, _, p in outcomes if name in chains}
+        p_yut, p_mo = extra["yut"], extra["mo"]
+        finals = [(value, p) for name, value, p in outcomes if name not in chains]
+        cut = [(value, p) for _, value, p in outcomes]
+
+        totals: Dict[Tuple[int, ...], float] = {}
+        for chained in range(max_throws):  # yut/mo throws before the last one
+            last = cut if chained == max_throws - 1 else finals
+            for yuts in range(chained + 1):
+                mos = chained - yuts
+                weight = comb(chained, yuts) * p_yut**yuts * p_mo**mos
+                for value, p in last:
+                    moves = tuple(sorted([4] * yuts + [5] * mos + [value]))
+                    totals[moves] = totals.get(moves, 0.0) + weight * p
+
+        result = tuple(sorted(totals.items(), key=lambda item: (-item[1], item[0])))
+        YutThrow._turn_cache[key] = result
+        return result
 
-        throw_name = YutThrow.THROW_NAMES[flat_count]
+    @staticmethod
+    def _build_table():
+        cumulative = []
+        outcomes = []
+        total = 0.0
+        for name, value, probability in YutThrow.distribution():
+            if probability > 0:
+                total += probability
+                cumulative.append(total)
+                outcomes.append((name, value))
+        cumulative[-1] = 1.0  # absorb rounding so every draw lands in the table
+        YutThrow._cumulative = cumulative
+        YutThrow._outcomes = outcomes
+        YutThrow._table_probability = YutThrow.FLAT_PROBABILITY
+
+    @staticmethod
+    def throw(rng=None) -> Tuple[str, int]:
+        """
+        Simulate throwing 4 yut sticks.
 
-        # Special case: if Do (1 flat), check if it's the back Do stick
-        if throw_name == "do":
-            # Find which stick is flat (0-3)
-            flat_stick_idx = sticks.index(1)
-            # Stick 0 is designated as the "back Do" stick
-            if flat_stick_idx == 0:
-                throw_name = "back_do"
+        Yut sticks are unfair coins: 60% chance of landing flat side up.
+        Uses exactly one rng.random() draw, so seeded runs repeat.
 
-        move_value = YutThrow.MOVE_VALUES[throw_name]
+        Args:
+            rng: random.Random-compatible generator (default: the global
+                 random module)
 
-        return throw_name, move_value
+        Returns:
+            Tuple of (throw_name, move_value)
+        """
+        if YutThrow._table_probability != YutThrow.FLAT_PROBABILITY:
+            YutThrow._build_table()
+        draw = random.random() if rng is None else rng.random()
+        return YutThrow._outcomes[bisect_right(YutThrow._cumulative, draw)]
 
     @staticmethod
     def grants_extra_turn(throw_name: str) -> bool:
@@ -0,0 +1,228 @@
+"""
+Zobrist hashing of Yut Nori game states.
+
+A state hash is the XOR of 64-bit keys for:
+- every piece, keyed by (player, piece state, how many of that player's
+  pieces share the state) -- so stacked / interchangeable pieces hash the
+  same whichever piece_id sits where
+- every accumulated move value, keyed by (value, copy number) -- a multiset
+- the player to move
+
+YutGame keeps the piece part up to date from its piece listener and the
+moves part inside MoveList, so YutGame.state_hash() is O(1). hash_game() and
+hash_packed() compute the same value from scratch.
+
+Keys come from fixed-seed generators, so hashes agree across processes.
+"""
+
+import random
+from typing import Dict, Iterable, List
+
+from .board import POSITION_NAMES
+from .player import Player
+
+MAX_PLAYERS = 6
+NUM_PIECE_CODES = (len(POSITION_NAMES) + 1) * 4
+_PRECOMPUTED_MOVE_COPIES = 16
+
+_rng = random.Random(0x59_55_54_4E)  # "YUTN"
+
+# PIECE_KEYS[player_id][code][count - 1]
+PIECE_KEYS: List[List[List[int]]] = [
+    [
+        [_rng.getrandbits(64) for _ in range(Player.NUM_PIECES)]
+        for _ in range(NUM_PIECE_CODES)
+    ]
+    for _ in range(MAX_PLAYERS)
+]
+
+SIDE_KEYS: List[int] = [_rng.getrandbits(64) for _ in range(MAX_PLAYERS)]
+
+# _MOVE_KEYS[value][copy - 1]; extended on demand for very long yut/mo chains
+_MOVE_KEYS: Dict[int, List[int]] = {
+    value: [_rng.getrandbits(64) for _ in range(_PRECOMPUTED_MOVE_COPIES)]
+    for value in (-1, 1, 2, 3, 4, 5)
+}
+
+
+def piece_code(pos: int, is_active: bool, has_moved: bool) -> int:
+    """Small integer identifying a piece state (0..NUM_PIECE_CODES-1)."""
+    return ((pos + 1) << 2) | (is_active << 1) | has_moved
+
+
+def move_key(value: int, copy: int) -> int:
+    """Key for the `copy`-th occurrence (1-based) of a throw value."""
+    keys = _MOVE_KEYS.get(value)
+    if keys is None:
+        keys = _MOVE_KEYS[value] = []
+    while len(keys) < copy:
+        keys.append(
+            random.Random(f"yoot-zobrist:move:{value}:{len(keys) + 1}").getrandbits(64)
+        )
+    return keys[copy - 1]
+
+
+def hash_pieces(codes_by_player: Iterable[Iterable[int]]) -> int:
+    """Piece part of the hash from per-player piece codes."""
+    h = 0
+    for player_id, codes in enumerate(codes_by_player):
+        keys = PIECE_KEYS[player_id]
+        counts: Dict[int, int] = {}
+        for code in codes:
+            count = counts.get(code, 0) + 1
+            counts[code] = count
+            h ^= keys[code][count - 1]
+    return h
+
+
+def hash_moves(moves: Iterable[int]) -> int:
+    """Accumulated-moves part of the hash (order independent)."""
+    h = 0
+    counts: Dict[int, int] = {}
+    for value in moves:
+        count = counts.get(value, 0) + 1
+        counts[value] = count
+        h ^= move_key(value, count)
+    return h
+
+
+def hash_game(game) -> int:
+    """Full (non-incremental) hash of a YutGame."""
+    pieces = hash_pieces(
+        [piece_code(pc.pos, pc.is_active, pc.has_moved) for pc in player.pieces]
+        for player in game.players
+    )
+    return (
+        pieces
+        ^ hash_moves(game.accumulated_moves)
+        ^ SIDE_KEYS[game.current_player_idx]
+    )
+
+
+def hash_packed(state) -> int:
+    """Full hash of a PackedState; equals hash_game() of the same state."""
+    from .packed import FINISHED
+
+    num_pieces = Player.NUM_PIECES
+    positions = state.positions
+    codes_by_player = []
+    for player_id in range(state.num_players):
+        codes = []
+        for code in positions[player_id * num_pieces : (player_id + 1) * num_pieces]:
+            if code >= 0:
+                codes.append(piece_code(code, True, True))
+            else:
+                codes.append(piece_code(-1, False, code == FINISHED))
+        codes_by_player.append(codes)
+    return (
+        hash_pieces(codes_by_player)
+        ^ hash_moves(state.accumulated_moves)
+        ^ SIDE_KEYS[state.current_player_idx]
+    )
+
+
+class MoveList(list):
+    """
+    List of accumulated move values that maintains its own Zobrist hash.
+
+    Every mutating list operation updates `zobrist` in O(1) per value added
+    or removed, so YutGame code (and callers) can keep using ordinary list
+    operations on game.accumulated_moves.
+    """
+
+    __slots__ = ("zobrist", "_counts")
+
+    def __init__(self, values: Iterable[int] = ()):
+        list.__init__(self, values)
+        self.zobrist = 0
+        self._counts = {}
+        for value in self:
+            self._added(value)
+
+    def _added(self, value: int):
+        counts = self._counts
+        count = counts.get(value, 0) + 1
+        counts[value] = count
+        try:
+            self.zobrist ^= _MOVE_KEYS[value][count - 1]
+        except (KeyError, IndexError):
+            self.zobrist ^= move_key(value, count)
+
+    def _removed(self, value: int):
+        counts = self._counts
+        count = counts[value]
+        counts[value] = count - 1
+        try:
+            self.zobrist ^= _MOVE_KEYS[value][count - 1]
+        except (KeyError, IndexError):
+            self.zobrist ^= move_key(value, count)
+
+    def append(self, value: int):
+        list.append(self, value)
+        self._added(value)
+
+    def extend(self, values: Iterable[int]):
+        values = list(values)
+        super().extend(values)
+        for value in values:
+            self._added(value)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def insert(self, index: int, value: int):
+        super().insert(index, value)
+        self._added(value)
+
+    def remove(self, value: int):
+        list.remove(self, value)
+        self._removed(value)
+
+    def pop(self, index: int = -1) -> int:
+        value = super().pop(index)
+        self._removed(value)
+        return value
+
+    def clear(self):
+        super().clear()
+        self.zobrist = 0
+        self._counts = {}
+
+    def __delitem__(self, index):
+        removed = self[index]
+        super().__delitem__(index)
+        for value in removed if isinstance(index, slice) else (removed,):
+            self._removed(value)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            super().__setitem__(index, value)
+            self._rehash()
+            return
+        self._removed(self[index])
+        super().__setitem__(index, value)
+        self._added(value)
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self._rehash()
+        return self
+
+    def _rehash(self):
+        self.zobrist = 0
+        self._counts = {}
+        for value in self:
+            self._added(value)
+
+    def copy(self) -> List[int]:
+        """Plain list copy (the hash is recomputed if it is assigned to a game)."""
+        return list(self)
+
+    def clone(self) -> "MoveList":
+        """MoveList copy that keeps the hash instead of recomputing it."""
+        moves = MoveList.__new__(MoveList)
+        list.extend(moves, self)
+        moves.zobrist = self.zobrist
+        moves._counts = self._counts.copy()
+        return moves